@@ -0,0 +1,58 @@
+"""Benchmark of validated and trusted hydration of API responses
+
+Builds lists of synthetic cards, dashboards and users through their endpoints \
+    against an in-memory adapter, once with full pydantic validation and once with \
+    trusted hydration (MetabaseApi(trusted_hydration=True)).
+
+Run with: python benchmarks/bench_hydration.py
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from timeit import repeat
+from typing import Any
+
+from synthetic import FakeAdapter, make_card, make_dashboard, make_user
+
+from metabase_tools.endpoints.cards_endpoint import Cards
+from metabase_tools.endpoints.dashboard_endpoint import Dashboards
+from metabase_tools.endpoints.generic_endpoint import Endpoint
+from metabase_tools.endpoints.users_endpoint import Users
+
+N_RECORDS = 5_000
+
+CASES: list[tuple[str, type[Endpoint[Any]], Callable[[int], dict[str, Any]]]] = [
+    ("CardItem", Cards, make_card),
+    ("DashboardItem", Dashboards, make_dashboard),
+    ("UserItem", Users, make_user),
+]
+
+
+def best_of(func: Callable[[], Any], repeats: int = 3) -> float:
+    return min(repeat(func, number=1, repeat=repeats))
+
+
+def main() -> None:
+    print(f"{'Model':<15}{'validated':>12}{'trusted':>12}{'speed up':>10}")
+    for name, endpoint_cls, make_record in CASES:
+        adapter = FakeAdapter([make_record(i) for i in range(1, N_RECORDS + 1)])
+        endpoint = endpoint_cls(adapter)  # type: ignore
+
+        adapter.trusted_hydration = False
+        validated_objs = endpoint.get()
+        validated = best_of(endpoint.get)
+
+        adapter.trusted_hydration = True
+        trusted_objs = endpoint.get()
+        trusted = best_of(endpoint.get)
+
+        assert validated_objs == trusted_objs
+        print(
+            f"{name:<15}{validated * 1e3:>10.1f}ms{trusted * 1e3:>10.1f}ms"
+            f"{validated / trusted:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
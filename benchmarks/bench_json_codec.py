@@ -0,0 +1,78 @@
+"""Benchmark of the JSON codecs used to decode responses and encode requests
+
+Decodes /card style payloads with requests' Response.json() (as the adapter did \
+    before codecs were pluggable), the standard library codec and the orjson codec, \
+    and encodes a card update with each codec. Payloads are synthetic unless paths \
+    to recorded responses (e.g. saved with curl) are passed as arguments.
+
+Run with: python benchmarks/bench_json_codec.py [recorded.json ...]
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+from collections.abc import Callable
+from pathlib import Path
+from timeit import repeat
+from typing import Any
+
+from requests import Response
+from synthetic import make_card
+
+from metabase_tools.utils.codec import HAS_ORJSON, JsonCodec, OrjsonCodec
+
+SIZES = [100, 1_000, 5_000]
+
+
+def best_of(func: Callable[[], Any], repeats: int = 5) -> float:
+    return min(repeat(func, number=1, repeat=repeats))
+
+
+def make_response(body: bytes) -> Response:
+    """Response as received from the server, without a declared encoding"""
+    response = Response()
+    response.status_code = 200
+    response._content = body  # pylint: disable=protected-access
+    return response
+
+
+def payloads() -> list[tuple[str, bytes]]:
+    if len(sys.argv) > 1:
+        return [(Path(path).name, Path(path).read_bytes()) for path in sys.argv[1:]]
+    return [
+        (f"{size} cards", json.dumps([make_card(i) for i in range(size)]).encode())
+        for size in SIZES
+    ]
+
+
+def main() -> None:
+    codecs: list[JsonCodec] = [JsonCodec()]
+    if HAS_ORJSON:
+        codecs.append(OrjsonCodec())
+    else:
+        print("orjson is not installed, only the standard library is measured")
+
+    header = f"{'Payload':<18}{'MB':>7}{'Response.json':>15}"
+    print(header + "".join(f"{codec.name:>12}" for codec in codecs))
+    for name, body in payloads():
+        expected = make_response(body).json()
+        row = f"{name:<18}{len(body) / 1e6:>7.2f}"
+        row += f"{best_of(lambda: make_response(body).json()) * 1e3:>13.1f}ms"
+        for codec in codecs:
+            assert codec.loads(body) == expected
+            row += f"{best_of(lambda: codec.loads(body)) * 1e3:>10.1f}ms"
+        print(row)
+
+    update = make_card(1)
+    print(f"\n{'Encode card':<25}" + "".join(f"{codec.name:>12}" for codec in codecs))
+    row = f"{'x1000':<25}"
+    for codec in codecs:
+        assert json.loads(codec.dumps(update)) == update
+        elapsed = best_of(lambda: [codec.dumps(update) for _ in range(1_000)])
+        row += f"{elapsed * 1e3:>10.1f}ms"
+    print(row)
+
+
+if __name__ == "__main__":
+    main()
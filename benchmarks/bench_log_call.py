@@ -0,0 +1,55 @@
+"""Benchmark of the overhead added by the log_call decorator
+
+Builds 5,000 synthetic cards with Cards.get() against an in-memory adapter, so no \
+    Metabase server is needed, and times single decorated calls.
+
+Run with: python benchmarks/bench_log_call.py
+"""
+
+from __future__ import annotations
+
+import logging
+from timeit import repeat
+from typing import Any
+
+from synthetic import FakeAdapter, make_card
+
+from metabase_tools.endpoints.cards_endpoint import Cards
+from metabase_tools.utils.logging_utils import log_call
+
+N_CARDS = 5_000
+
+
+def noop(value: int) -> int:
+    return value
+
+
+decorated_noop = log_call(noop)
+
+
+def best_of(func: Any, number: int, repeats: int = 5) -> float:
+    return min(repeat(func, number=number, repeat=repeats)) / number
+
+
+def main() -> None:
+    cards = Cards(FakeAdapter([make_card(i) for i in range(1, N_CARDS + 1)]))  # type: ignore
+    logging.basicConfig(level=logging.WARNING, handlers=[logging.NullHandler()])
+    package_logger = logging.getLogger("metabase_tools")
+
+    plain = best_of(lambda: noop(1), number=200_000)
+    disabled = best_of(lambda: decorated_noop(1), number=200_000)
+    print(f"Undecorated call:                 {plain * 1e9:8.0f} ns")
+    print(f"log_call, debug disabled:         {disabled * 1e9:8.0f} ns")
+    print(f"Overhead per call:                {(disabled - plain) * 1e9:8.0f} ns")
+
+    package_logger.setLevel(logging.WARNING)
+    get_disabled = best_of(cards.get, number=1, repeats=3)
+    package_logger.setLevel(logging.DEBUG)
+    get_enabled = best_of(cards.get, number=1, repeats=3)
+    package_logger.setLevel(logging.NOTSET)
+    print(f"cards.get() x{N_CARDS}, debug disabled: {get_disabled * 1e3:8.1f} ms")
+    print(f"cards.get() x{N_CARDS}, debug enabled:  {get_enabled * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
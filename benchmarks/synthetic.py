@@ -0,0 +1,114 @@
+"""Synthetic Metabase API responses and a stand-in adapter for benchmarks
+"""
+
+from __future__ import annotations
+
+from typing import Any
+from uuid import UUID
+
+from packaging.version import Version
+
+NOW = "2023-01-01T00:00:00.000Z"
+
+
+def make_user(user_id: int) -> dict[str, Any]:
+    return {
+        "id": user_id,
+        "common_name": f"User {user_id}",
+        "email": f"user{user_id}@example.com",
+        "first_name": "User",
+        "last_name": str(user_id),
+        "date_joined": NOW,
+        "last_login": NOW,
+        "is_qbnewb": False,
+        "is_superuser": True,
+    }
+
+
+def make_card(card_id: int) -> dict[str, Any]:
+    collection_id = 1 + card_id % 10
+    return {
+        "id": card_id,
+        "name": f"Card {card_id}",
+        "description": "Synthetic card used for benchmarking",
+        "archived": False,
+        "collection_position": None,
+        "table_id": None,
+        "result_metadata": [
+            {"name": f"column_{i}", "display_name": f"Column {i}", "base_type": "Text"}
+            for i in range(20)
+        ],
+        "creator": make_user(1),
+        "database_id": 1,
+        "enable_embedding": False,
+        "collection_id": collection_id,
+        "query_type": "native",
+        "creator_id": 1,
+        "updated_at": NOW,
+        "made_public_by_id": None,
+        "embedding_params": None,
+        "cache_ttl": None,
+        "dataset_query": {
+            "type": "native",
+            "native": {"query": f"SELECT * FROM table_{card_id} " + "-- " * 200},
+            "database": 1,
+        },
+        "display": "table",
+        "last-edit-info": {"id": 1, "email": "user1@example.com"},
+        "visualization_settings": {},
+        "collection": {
+            "id": collection_id,
+            "name": f"Collection {collection_id}",
+            "location": "/",
+            "archived": False,
+            "personal_owner_id": None,
+        },
+        "dataset": None,
+        "created_at": NOW,
+        "public_uuid": str(UUID(int=card_id)),
+        "can_write": True,
+        "favorite": False,
+    }
+
+
+def make_dashboard(dashboard_id: int) -> dict[str, Any]:
+    return {
+        "id": dashboard_id,
+        "name": f"Dashboard {dashboard_id}",
+        "description": None,
+        "archived": False,
+        "collection_position": None,
+        "creator": make_user(1),
+        "enable_embedding": False,
+        "collection_id": 1 + dashboard_id % 10,
+        "show_in_getting_started": False,
+        "caveats": None,
+        "creator_id": 1,
+        "updated_at": NOW,
+        "made_public_by_id": None,
+        "embedding_params": None,
+        "position": None,
+        "parameters": [{"id": "abc", "name": "Date", "type": "date/all-options"}],
+        "favorite": False,
+        "created_at": NOW,
+        "public_uuid": None,
+        "points_of_interest": None,
+        "can_write": True,
+        "last-edit-info": {"id": 1, "email": "user1@example.com"},
+    }
+
+
+class FakeAdapter:
+    """Stands in for MetabaseApi, returning the same synthetic records every call"""
+
+    max_workers = 1
+    server_version = Version("v0.45.3")
+    trusted_hydration = False
+
+    def __init__(self, records: list[dict[str, Any]]):
+        self.records = records
+
+    def get(
+        self, endpoint: str, params: dict[str, Any] | None = None
+    ) -> list[dict[str, Any]]:
+        return self.records
@@ -3,7 +3,29 @@
 
 __version__ = "0.16.0"
 
-from metabase_tools.exceptions import MetabaseApiException
+from metabase_tools.exceptions import MetabaseApiBatchException, MetabaseApiException
 from metabase_tools.metabase import MetabaseApi
+from metabase_tools.utils.cache import ResponseCache
+from metabase_tools.utils.codec import JsonCodec, OrjsonCodec
+from metabase_tools.utils.concurrency import BulkReport
+from metabase_tools.utils.disk_cache import DiskCache
+from metabase_tools.utils.retry import RetryPolicy
+from metabase_tools.utils.search_index import SearchIndex
+from metabase_tools.utils.throttle import AdaptiveConcurrencyLimiter, RateLimiter
+from metabase_tools.utils.transport import TransportConfig
 
-__all__ = ("MetabaseApiException", "MetabaseApi")
+__all__ = (
+    "AdaptiveConcurrencyLimiter",
+    "BulkReport",
+    "DiskCache",
+    "JsonCodec",
+    "MetabaseApiBatchException",
+    "MetabaseApiException",
+    "MetabaseApi",
+    "OrjsonCodec",
+    "RateLimiter",
+    "ResponseCache",
+    "RetryPolicy",
+    "SearchIndex",
+    "TransportConfig",
+)
@@ -0,0 +1,5 @@
+"""Asynchronous API wrapper for Metabase, requires the optional httpx dependency"""
+
+from metabase_tools.aio.metabase import AsyncMetabaseApi
+
+__all__ = ("AsyncMetabaseApi",)
@@ -0,0 +1,774 @@
+"""Asynchronous versions of the endpoint classes
+
+Items returned by these endpoints are the same models used by the synchronous \
+    adapter but do not have an adapter set, so the methods on the items that call \
+    the API (``refresh``, ``update``, ``share``...) cannot be used. Each of them has \
+    an endpoint method taking the item or its ID instead (e.g. \
+    ``await api.cards.update(card, name="New")``).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from logging import getLogger
+from typing import TYPE_CHECKING, Any, ClassVar, Generic, TypeVar
+
+from packaging.version import Version
+
+from metabase_tools.endpoints.activity_endpoint import Activity
+from metabase_tools.endpoints.alerts_endpoint import Alerts
+from metabase_tools.endpoints.cards_endpoint import Cards
+from metabase_tools.endpoints.collections_endpoint import Collections
+from metabase_tools.endpoints.dashboard_endpoint import Dashboards
+from metabase_tools.endpoints.databases_endpoint import Databases
+from metabase_tools.endpoints.search_endpoint import Search
+from metabase_tools.endpoints.users_endpoint import Users
+from metabase_tools.exceptions import MetabaseApiBatchException, MetabaseApiException
+from metabase_tools.models.activity_model import ActivityItem
+from metabase_tools.models.alert_model import AlertItem
+from metabase_tools.models.card_model import (
+    CardItem,
+    CardQueryResult,
+    CardRelatedObjects,
+)
+from metabase_tools.models.collection_model import CollectionItem
+from metabase_tools.models.dashboard_model import DashboardItem
+from metabase_tools.models.database_model import DatabaseItem
+from metabase_tools.models.generic_model import Item, MissingParam
+from metabase_tools.models.search_model import SearchItem
+from metabase_tools.models.user_model import UserItem
+from metabase_tools.utils.search_index import SearchIndex
+
+if TYPE_CHECKING:
+    from metabase_tools.aio.metabase import AsyncMetabaseApi
+
+T = TypeVar("T", bound=Item)
+
+logger = getLogger(__name__)
+
+
+class AsyncEndpoint(Generic[T]):
+    """Base class for asynchronous endpoints"""
+
+    _BASE_EP: ClassVar[str]
+    _STD_OBJ: ClassVar[type]
+    _required_params: ClassVar[list[str]]
+    _adapter: AsyncMetabaseApi
+
+    def __init__(self, adapter: AsyncMetabaseApi):
+        self._adapter = adapter
+
+    async def _request_list(self, endpoint: str, source: list[int]) -> list[Any]:
+        """Sends concurrent GET requests for a list of targets
+
+        Args:
+            endpoint (str): Endpoint to use for request
+            source (list[int]): List of targets
+
+        Raises:
+            MetabaseApiBatchException: One or more requests failed
+
+        Returns:
+            list[Any]: Aggregated results of all API calls
+        """
+        for item in source:
+            if not isinstance(item, int):
+                raise TypeError(f"Expected list[int] but found {type(item)} in list")
+        outcomes = await asyncio.gather(
+            *(self._adapter.get(endpoint=endpoint.format(id=item)) for item in source),
+            return_exceptions=True,
+        )
+        results: list[dict[str, Any]] = []
+        errors: dict[Any, Exception] = {}
+        for item, outcome in zip(source, outcomes):
+            if isinstance(outcome, Exception):
+                logger.warning("Request for %s failed: %s", item, outcome)
+                errors[item] = outcome
+            elif isinstance(outcome, BaseException):
+                raise outcome
+            elif isinstance(outcome, dict):
+                results.append(outcome)
+            else:
+                results.extend(record for record in outcome if isinstance(record, dict))
+        if len(errors) > 0:
+            first_error = next(iter(errors.values()))
+            raise MetabaseApiBatchException(
+                results=results, errors=errors
+            ) from first_error
+        return results
+
+    def _item_endpoint(self, target: int | T) -> str:
+        """Endpoint for a single item
+
+        Args:
+            target (int | T): Item or ID of the item
+
+        Returns:
+            str: Endpoint of the item
+        """
+        target_id = target.id if isinstance(target, Item) else target
+        return f"{self._BASE_EP}/{target_id}"
+
+    def _to_obj(self, result: list[dict[str, Any]] | dict[str, Any]) -> T:
+        if isinstance(result, dict):
+            obj: T = self._STD_OBJ(**result)
+            return obj
+        raise TypeError(f"Expected dict, received {type(result)}")
+
+    async def get(self, targets: list[int] | None = None) -> list[T]:
+        """Fetch an object or list of objects
+
+        Args:
+            targets (list[int], optional): IDs of the objects being requested
+
+        Raises:
+            TypeError: Targets are not None or list[int]
+
+        Returns:
+            list[T]: List of objects of the relevant type
+        """
+        if isinstance(targets, list) and all(isinstance(t, int) for t in targets):
+            results = await self._request_list(
+                endpoint=self._BASE_EP + "/{id}", source=targets
+            )
+            return [self._STD_OBJ(**result) for result in results]
+        if targets is None:
+            result = await self._adapter.get(endpoint=self._BASE_EP)
+            if isinstance(result, list):
+                return [
+                    self._STD_OBJ(**record)
+                    for record in result
+                    if isinstance(record, dict)
+                ]
+            raise TypeError("Received empty list")
+        raise TypeError(f"Expected list[int] or None but received {type(targets)}")
+
+    async def refresh(self, target: int | T) -> T:
+        """Fetches the current state of an object
+
+        Args:
+            target (int | T): Item or ID of the item to fetch
+
+        Returns:
+            T: Object as stored on the server
+        """
+        return self._to_obj(
+            await self._adapter.get(endpoint=self._item_endpoint(target))
+        )
+
+    async def create(self, **kwargs: Any) -> T:
+        """Creates a new object
+
+        Raises:
+            MetabaseApiException: Required parameters were not provided
+
+        Returns:
+            T: Object of the relevant type
+        """
+        details = {k: v for k, v in kwargs.items() if not isinstance(v, MissingParam)}
+        missing_params = [p for p in self._required_params if p not in details]
+        if len(missing_params) > 0:
+            raise MetabaseApiException(
+                f"Missing required parameters: {', '.join(missing_params)}"
+            )
+        result = await self._adapter.post(endpoint=self._BASE_EP, json=details)
+        return self._to_obj(result)
+
+    async def search(
+        self,
+        search_params: list[dict[str, Any]],
+        search_list: list[T] | SearchIndex[T] | None = None,
+    ) -> list[T]:
+        """Method to search a list of objects meeting a list of parameters
+
+        Args:
+            search_params (list[dict]): Each dict contains search criteria and returns\
+                 1 result
+            search_list (list[T] | SearchIndex[T], optional): Provide to search \
+                against an existing list or index, by default pulls from API
+
+        Returns:
+            list[T]: List of objects of the relevant type
+        """
+        objs = search_list or await self.get()
+        index = objs if isinstance(objs, SearchIndex) else SearchIndex(objs)
+        return index.match_each(search_params)
+
+    async def update(self, target: int | T, **kwargs: Any) -> T:
+        """Updates an object with the provided parameters
+
+        Args:
+            target (int | T): Item or ID of the item to update
+
+        Returns:
+            T: Updated object
+        """
+        changes = {k: v for k, v in kwargs.items() if not isinstance(v, MissingParam)}
+        result = await self._adapter.put(
+            endpoint=self._item_endpoint(target), json=changes
+        )
+        return self._to_obj(result)
+
+    async def archive(self, target: int | T) -> T:
+        """Archives an object
+
+        Args:
+            target (int | T): Item or ID of the item to archive
+
+        Returns:
+            T: Archived object
+        """
+        return await self.update(target, archived=True)
+
+    async def unarchive(self, target: int | T) -> T:
+        """Unarchives an object
+
+        Args:
+            target (int | T): Item or ID of the item to unarchive
+
+        Returns:
+            T: Unarchived object
+        """
+        return await self.update(target, archived=False)
+
+    async def delete(self, target: int | T) -> None:
+        """Deletes an object
+
+        Args:
+            target (int | T): Item or ID of the item to delete
+        """
+        _ = await self._adapter.delete(endpoint=self._item_endpoint(target))
+
+
+class AsyncActivity:
+    """Activity related endpoint methods"""
+
+    _BASE_EP: ClassVar[str] = Activity.spec().base_endpoint
+    _STD_OBJ: ClassVar[type] = Activity.spec().std_obj
+
+    def __init__(self, adapter: AsyncMetabaseApi):
+        self._adapter = adapter
+
+    async def get(self) -> list[ActivityItem]:
+        """Get recent activity on the server
+
+        Raises:
+            MetabaseApiException: Invalid results received from server
+
+        Returns:
+            list[ActivityItem]
+        """
+        result = await self._adapter.get(endpoint=self._BASE_EP)
+        if isinstance(result, list):
+            return [self._STD_OBJ(**item) for item in result]
+        raise MetabaseApiException
+
+    async def search(
+        self,
+        search_params: dict[str, Any],
+        search_list: list[ActivityItem] | SearchIndex[ActivityItem] | None = None,
+    ) -> list[ActivityItem]:
+        """Method to search a list of activities meeting a set of parameters
+
+        Args:
+            search_params (dict[str, Any]): Search criteria
+            search_list (list[ActivityItem] | SearchIndex[ActivityItem], optional): \
+                Provide to search against an existing list or index, by default \
+                pulls from API
+
+        Returns:
+            list[ActivityItem]: List of matching activities
+        """
+        objs = search_list or await self.get()
+        index = objs if isinstance(objs, SearchIndex) else SearchIndex(objs)
+        return index.find(search_params)
+
+
+class AsyncAlerts(AsyncEndpoint[AlertItem]):
+    """Alert related endpoint methods"""
+
+    _BASE_EP, _STD_OBJ, _required_params = Alerts.spec()
+
+    async def get(self, targets: list[int] | None = None) -> list[AlertItem]:
+        """Fetch list of alerts
+
+        Args:
+            targets (list[int], optional): If provided, the list of alerts to fetch
+
+        Returns:
+            list[AlertItem]
+        """
+        if targets and not isinstance(targets, list):
+            raise TypeError
+        if await self._adapter.get_server_version() >= Version("v0.41"):
+            return await super().get(targets=targets)
+        if targets:
+            return [x for x in await super().get() if x.id in targets]
+        return await super().get()
+
+    async def get_by_card(self, targets: list[int]) -> list[AlertItem]:
+        """Get all alerts for the given card IDs
+
+        Args:
+            targets (list[int]): List of card IDs
+
+        Returns:
+            list[AlertItem]: List of associated alerts
+        """
+        result = await self._request_list(
+            endpoint="/alert/question/{id}", source=targets
+        )
+        return [AlertItem(**x) for x in result]
+
+    async def delete(self, target: int | AlertItem) -> None:
+        """DEPRECATED; use archive instead"""
+        raise NotImplementedError
+
+
+class AsyncCards(AsyncEndpoint[CardItem]):
+    """Card related endpoint methods"""
+
+    _BASE_EP, _STD_OBJ, _required_params = Cards.spec()
+
+    async def embeddable(self) -> list[CardItem]:
+        """Fetch list of cards with embedding enabled
+
+        Returns:
+            list[CardItem]: List of cards with embedding enabled
+        """
+        cards = await self._adapter.get(endpoint="/card/embeddable")
+        card_ids = [card["id"] for card in cards if isinstance(card, dict)]
+        return await self.get(card_ids)
+
+    async def related(self, target: int | CardItem) -> CardRelatedObjects:
+        """Objects related to target
+
+        Args:
+            target (int | CardItem): Card or ID of the card
+
+        Returns:
+            CardRelatedObjects
+        """
+        result = await self._adapter.get(
+            endpoint=f"{self._item_endpoint(target)}/related"
+        )
+        if isinstance(result, dict):
+            result["card_id"] = target.id if isinstance(target, Item) else target
+            return CardRelatedObjects(**result)
+        raise TypeError(f"Expected dict, received {type(result)}")
+
+    async def query(self, target: int | CardItem) -> CardQueryResult:
+        """Execute the query stored in a card
+
+        Args:
+            target (int | CardItem): Card or ID of the card
+
+        Returns:
+            CardQueryResult: Results of query
+        """
+        result = await self._adapter.post(
+            endpoint=f"{self._item_endpoint(target)}/query"
+        )
+        if isinstance(result, dict):
+            return CardQueryResult(**result)
+        raise TypeError(f"Expected dict, received {type(result)}")
+
+    async def favorite(self, target: int | CardItem) -> CardItem:
+        """Mark card as favorite
+
+        Args:
+            target (int | CardItem): Card or ID of the card
+
+        Returns:
+            CardItem: Favorited card
+        """
+        if await self._adapter.get_server_version() >= Version("v0.40"):
+            raise NotImplementedError("This function was deprecated in Metabase v0.40")
+        result = await self._adapter.post(
+            endpoint=f"{self._item_endpoint(target)}/favorite"
+        )
+        if isinstance(result, dict):
+            return await self.refresh(target)
+        raise TypeError(f"Expected dict, received {type(result)}")
+
+    async def unfavorite(self, target: int | CardItem) -> CardItem:
+        """Unfavorite card
+
+        Args:
+            target (int | CardItem): Card or ID of the card
+
+        Returns:
+            CardItem: Unfavorited card
+        """
+        if await self._adapter.get_server_version() >= Version("v0.40"):
+            raise NotImplementedError("This function was deprecated in Metabase v0.40")
+        result = await self._adapter.delete(
+            endpoint=f"{self._item_endpoint(target)}/favorite"
+        )
+        if isinstance(result, dict):
+            return await self.refresh(target)
+        raise TypeError(f"Expected dict, received {type(result)}")
+
+    async def share(self, target: int | CardItem) -> CardItem:
+        """Generate publicly-accessible link for card
+
+        Args:
+            target (int | CardItem): Card or ID of the card
+
+        Returns:
+            CardItem: Shared card, with the UUID of its public link
+        """
+        result = await self._adapter.post(
+            endpoint=f"{self._item_endpoint(target)}/public_link"
+        )
+        if isinstance(result, dict) and "uuid" in result:
+            return await self.refresh(target)
+        raise TypeError(f"Expected dict, received {type(result)}")
+
+    async def unshare(self, target: int | CardItem) -> CardItem:
+        """Remove publicly-accessible links for card
+
+        Args:
+            target (int | CardItem): Card or ID of the card
+
+        Returns:
+            CardItem: Card without a public link
+        """
+        result = await self._adapter.delete(
+            endpoint=f"{self._item_endpoint(target)}/public_link"
+        )
+        if isinstance(result, dict):
+            return await self.refresh(target)
+        raise TypeError(f"Expected dict, received {type(result)}")
+
+    async def delete(self, target: int | CardItem) -> None:
+        """DEPRECATED; use archive instead"""
+        raise NotImplementedError
+
+
+class AsyncCollections(AsyncEndpoint[CollectionItem]):
+    """Collection related endpoint methods"""
+
+    _BASE_EP, _STD_OBJ, _required_params = Collections.spec()
+
+    async def get_tree(self) -> list[dict[str, Any]]:
+        """Collection tree
+
+        Returns:
+            list[dict]: Representation of collection tree
+        """
+        result = await self._adapter.get(endpoint="/collection/tree")
+        if isinstance(result, list) and all(
+            isinstance(record, dict) for record in result
+        ):
+            return result
+        raise TypeError(f"Expected list[dict], received {type(result)}")
+
+    async def get_flat_list(self) -> list[dict[str, Any]]:
+        """Flattens collection tree so the full path of each collection is shown
+
+        Returns:
+            list[dict]: Flattened collection tree
+        """
+        return Collections.flatten_tree(await self.get_tree())
+
+    async def graph(self) -> dict[str, Any]:
+        """Graph of collection permissions
+
+        Returns:
+            dict: graph of collection
+        """
+        result = await self._adapter.get(endpoint="/collection/graph")
+        if isinstance(result, dict):
+            return result
+        raise TypeError(f"Expected dict, received {type(result)}")
+
+    async def get_contents(
+        self,
+        target: int | CollectionItem,
+        model_type: str | None = None,
+        archived: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Get the contents of the provided collection
+
+        Args:
+            target (int | CollectionItem): Collection or ID of the collection
+            model_type (str, optional): Filter to provided model. Defaults to all.
+            archived (bool, optional): Archived objects. Defaults to False.
+
+        Returns:
+            list: Contents of collection
+        """
+        params: dict[str, Any] = {}
+        if archived:
+            params["archived"] = archived
+        if model_type:
+            params["model"] = model_type
+        result = await self._adapter.get(
+            endpoint=f"{self._item_endpoint(target)}/items", params=params
+        )
+        if isinstance(result, list) and all(
+            isinstance(record, dict) for record in result
+        ):
+            return result
+        raise TypeError(f"Expected list[dict], received {type(result)}")
+
+    async def check_for_object(
+        self, target: int | CollectionItem, item_name: str
+    ) -> int:
+        """Checks for a card in the collection and returns the id, if found
+
+        The card is looked up with the search endpoint of the server. The contents \
+            of the collection are only checked if the search fails or the server \
+            does not report that every match was returned.
+
+        Args:
+            target (int | CollectionItem): Collection or ID of the collection
+            item_name (str): Name of the item being located
+
+        Raises:
+            MetabaseApiException: Item not found
+
+        Returns:
+            int: id of the item being located
+        """
+        collection_id = target.id if isinstance(target, CollectionItem) else target
+        if isinstance(collection_id, int):
+            try:
+                results = await self._adapter.search.find(
+                    query=item_name, models=["card"], collection_id=collection_id
+                )
+            except (MetabaseApiException, TypeError, ValueError) as error:
+                logger.debug("Search for %s failed: %s", item_name, error)
+                results = None
+            if results is not None:
+                return CollectionItem.find_in_results(results, item_name)
+
+        collection_items = await self.get_contents(
+            target, model_type="card", archived=False
+        )
+        for item in collection_items:
+            if item["name"] == item_name and isinstance(item["id"], int):
+                return item["id"]
+        raise MetabaseApiException
+
+    async def delete(self, target: int | CollectionItem) -> None:
+        """DEPRECATED; use archive instead"""
+        raise NotImplementedError
+
+
+class AsyncDashboards(AsyncEndpoint[DashboardItem]):
+    """Dashboard related endpoint methods"""
+
+    _BASE_EP, _STD_OBJ, _required_params = Dashboards.spec()
+
+
+class AsyncDatabases(AsyncEndpoint[DatabaseItem]):
+    """Database related endpoint methods"""
+
+    _BASE_EP, _STD_OBJ, _required_params = Databases.spec()
+
+
+class AsyncSearch:
+    """Search related endpoint methods"""
+
+    _BASE_EP: ClassVar[str] = Search.spec().base_endpoint
+
+    def __init__(self, adapter: AsyncMetabaseApi):
+        self._adapter = adapter
+
+    async def get(
+        self,
+        query: str | None = None,
+        models: list[str] | None = None,
+        archived: bool = False,
+        collection_id: int | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> list[SearchItem]:
+        """Searches the server for objects matching the query
+
+        Args:
+            query (str, optional): Text searched for in names and descriptions
+            models (list[str], optional): Models searched, by default all
+            archived (bool, optional): Search archived objects instead of active \
+                ones, by default False
+            collection_id (int, optional): Only return objects in this collection, \
+                applied after limit and offset
+            limit (int, optional): Maximum number of results
+            offset (int, optional): Number of results skipped
+
+        Returns:
+            list[SearchItem]: Results of the search
+        """
+        result = await self._adapter.get(
+            endpoint=self._BASE_EP,
+            params=Search.request_params(
+                query=query,
+                models=models,
+                archived=archived,
+                limit=limit,
+                offset=offset,
+            ),
+        )
+        return Search.parse_results(result, collection_id=collection_id)
+
+    async def find(
+        self,
+        query: str,
+        models: list[str] | None = None,
+        collection_id: int | None = None,
+    ) -> list[SearchItem] | None:
+        """Searches the server for every active object matching the query
+
+        Args:
+            query (str): Text searched for in names and descriptions
+            models (list[str], optional): Models searched, by default all
+            collection_id (int, optional): Only return objects in this collection
+
+        Returns:
+            list[SearchItem] | None: Results of the search, or None if the server \
+                did not report every match
+        """
+        result = await self._adapter.generic_request(
+            http_verb="GET",
+            endpoint=self._BASE_EP,
+            params=Search.request_params(
+                query=query, models=models, archived=False, limit=None, offset=None
+            ),
+            envelope=True,
+        )
+        if not Search.is_complete(result):
+            return None
+        return Search.parse_results(result, collection_id=collection_id)
+
+    async def paginate(
+        self,
+        query: str | None = None,
+        models: list[str] | None = None,
+        archived: bool = False,
+        page_size: int = 50,
+    ) -> AsyncIterator[SearchItem]:
+        """Iterates over the results of a search, requesting one page at a time
+
+        Args:
+            query (str, optional): Text searched for in names and descriptions
+            models (list[str], optional): Models searched, by default all
+            archived (bool, optional): Search archived objects instead of active \
+                ones, by default False
+            page_size (int, optional): Results requested per page, by default 50
+
+        Raises:
+            ValueError: page_size is less than 1
+
+        Yields:
+            SearchItem: Results of the search
+        """
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        params = Search.request_params(
+            query=query, models=models, archived=archived, limit=None, offset=None
+        )
+        offset = 0
+        while True:
+            page = await self._adapter.get_page(
+                endpoint=self._BASE_EP, limit=page_size, offset=offset, params=params
+            )
+            for record in page.data:
+                yield SearchItem(**record)
+            offset += len(page.data)
+            if (
+                page.limit is None
+                or len(page.data) == 0
+                or (page.total is not None and offset >= page.total)
+            ):
+                return
+
+
+class AsyncUsers(AsyncEndpoint[UserItem]):
+    """User related endpoint methods"""
+
+    _BASE_EP, _STD_OBJ, _required_params = Users.spec()
+
+    async def current(self) -> UserItem:
+        """Current user details
+
+        Returns:
+            UserItem: Current user details
+        """
+        result = await self._adapter.get(endpoint="/user/current")
+        return self._to_obj(result)
+
+    async def disable(self, target: int | UserItem) -> None:
+        """Disables user
+
+        Args:
+            target (int | UserItem): User or ID of the user
+        """
+        await super().delete(target)
+
+    async def enable(self, target: int | UserItem) -> UserItem:
+        """Enable user
+
+        Args:
+            target (int | UserItem): User or ID of the user
+
+        Returns:
+            UserItem: Enabled user
+        """
+        result = await self._adapter.put(
+            endpoint=f"{self._item_endpoint(target)}/reactivate"
+        )
+        return self._to_obj(result)
+
+    async def resend_invite(self, target: int | UserItem) -> dict[str, bool]:
+        """Resend user invite
+
+        Args:
+            target (int | UserItem): User or ID of the user
+
+        Returns:
+            dict[str, bool]: Result of the invite
+        """
+        result = await self._adapter.post(
+            endpoint=f"{self._item_endpoint(target)}/send_invite"
+        )
+        if isinstance(result, dict):
+            return result
+        raise TypeError(f"Expected dict, received {type(result)}")
+
+    async def update_password(
+        self, target: int | UserItem, payload: dict[str, Any]
+    ) -> UserItem:
+        """Updates the password of a user
+
+        Args:
+            target (int | UserItem): User or ID of the user
+            payload (dict): New password
+
+        Returns:
+            UserItem: User with the password updated
+        """
+        result = await self._adapter.put(
+            endpoint=f"{self._item_endpoint(target)}/password", json=payload
+        )
+        return self._to_obj(result)
+
+    async def qbnewb(self, target: int | UserItem) -> dict[str, bool]:
+        """Indicate that a user has been informed about Query Builder
+
+        Args:
+            target (int | UserItem): User or ID of the user
+
+        Returns:
+            dict[str, bool]: Result of the change
+        """
+        if await self._adapter.get_server_version() >= Version("v0.42"):
+            raise NotImplementedError("This function was deprecated in Metabase v0.42")
+        result = await self._adapter.put(
+            endpoint=f"{self._item_endpoint(target)}/qbnewb"
+        )
+        if isinstance(result, dict):
+            return result
+        raise TypeError(f"Expected dict, received {type(result)}")
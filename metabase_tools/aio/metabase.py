@@ -0,0 +1,656 @@
+"""
+Asynchronous rest adapter for the Metabase API
+"""
+
+from __future__ import annotations
+
+import asyncio
+from json import JSONDecodeError
+from logging import getLogger
+from pathlib import Path
+from types import TracebackType
+from time import monotonic
+from typing import Any, Literal
+
+from packaging.version import Version
+
+from metabase_tools.aio.endpoints import (
+    AsyncActivity,
+    AsyncAlerts,
+    AsyncCards,
+    AsyncCollections,
+    AsyncDashboards,
+    AsyncDatabases,
+    AsyncSearch,
+    AsyncUsers,
+)
+from metabase_tools.aio.tools import AsyncMetabaseTools
+from metabase_tools.exceptions import MetabaseApiException
+from metabase_tools.metabase import MetabaseApi
+from metabase_tools.models.server_settings import ServerSettings, Setting
+from metabase_tools.utils.codec import JsonCodec, default_codec
+from metabase_tools.utils.pagination import Page
+from metabase_tools.utils.retry import RetryBudget
+from metabase_tools.utils.transport import TransportConfig
+
+try:
+    import httpx
+except ImportError as import_error:  # pragma: no cover
+    raise ImportError(
+        "AsyncMetabaseApi requires httpx, install it with "
+        "`pip install metabase-tools[async]`"
+    ) from import_error
+
+logger = getLogger(__name__)
+
+# Errors raised by httpx for connection failures and timeouts, which are retryable
+_RETRYABLE_ERRORS = (
+    httpx.TimeoutException,
+    httpx.NetworkError,
+    httpx.RemoteProtocolError,
+)
+
+
+class AsyncMetabaseApi:
+    """Asynchronous Metabase API adapter
+
+    The adapter must be started before use, either by awaiting ``connect`` or by \
+        using it as an async context manager, which also closes the underlying \
+        connection pool on exit.
+
+    The timeouts, keep-alive, retry policy and throttles of the transport settings \
+        apply as they do for MetabaseApi. The connection pool is sized by \
+        max_concurrency instead of the pool settings.
+    """
+
+    json_codec: JsonCodec
+
+    activity: AsyncActivity
+    alerts: AsyncAlerts
+    cards: AsyncCards
+    collections: AsyncCollections
+    dashboards: AsyncDashboards
+    databases: AsyncDatabases
+    search: AsyncSearch
+    tools: AsyncMetabaseTools
+    users: AsyncUsers
+
+    def __init__(
+        self,
+        metabase_url: str,
+        credentials: dict[str, str] | None = None,
+        cache_token: bool = False,
+        token_path: Path | str | None = None,
+        client: httpx.AsyncClient | None = None,
+        max_concurrency: int = 10,
+        json_codec: JsonCodec | None = None,
+        transport: TransportConfig | None = None,
+        server_version: Version | str | None = None,
+    ):
+        if not credentials and not token_path:
+            raise MetabaseApiException("No authentication method provided")
+        if max_concurrency < 1:
+            raise MetabaseApiException("max_concurrency must be at least 1")
+        self._credentials = credentials or {}
+        self._token_path = Path(token_path) if token_path else None
+        self._cache_token = cache_token
+
+        # Validate Metabase URL
+        self.metabase_url = MetabaseApi._validate_base_url(url=metabase_url)
+
+        # Connection pool is created on connect unless one is provided
+        self._client = client
+        self._owns_client = client is None
+        self.max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+
+        # Timeouts, retries and throttles
+        self.transport = transport or TransportConfig()
+        self.rate_limiter = self.transport.rate_limiter
+        self.concurrency_limiter = self.transport.concurrency_limiter
+        self.retry_policy = self.transport.retry_policy
+        self._retry_budget = (
+            RetryBudget(
+                ratio=self.retry_policy.budget_ratio,
+                reserve=self.retry_policy.budget_reserve,
+            )
+            if self.retry_policy
+            else None
+        )
+
+        # Encodes requests and decodes responses, orjson if installed
+        self.json_codec = json_codec or default_codec()
+
+        # Server version and settings are fetched on first use unless supplied
+        self._server_version = Version(str(server_version)) if server_version else None
+        self._settings: ServerSettings | None = None
+
+        # Create endpoints
+        self.activity = AsyncActivity(self)
+        self.alerts = AsyncAlerts(self)
+        self.cards = AsyncCards(self)
+        self.collections = AsyncCollections(self)
+        self.dashboards = AsyncDashboards(self)
+        self.databases = AsyncDatabases(self)
+        self.search = AsyncSearch(self)
+        self.tools = AsyncMetabaseTools(self)
+        self.users = AsyncUsers(self)
+
+    async def __aenter__(self) -> AsyncMetabaseApi:
+        await self.connect()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        await self.close()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Underlying HTTP client
+
+        Raises:
+            MetabaseApiException: Adapter has not been connected
+
+        Returns:
+            httpx.AsyncClient
+        """
+        if self._client is None:
+            raise MetabaseApiException("Adapter is not connected")
+        return self._client
+
+    @property
+    def server_version(self) -> Version:
+        """Metabase version running on the server, once fetched by \
+            get_server_version or supplied when the adapter was created
+
+        Raises:
+            MetabaseApiException: Server version has not been fetched yet
+
+        Returns:
+            Version: Server version
+        """
+        if self._server_version is None:
+            raise MetabaseApiException("Server version not fetched yet")
+        return self._server_version
+
+    async def get_server_version(self) -> Version:
+        """Metabase version running on the server, fetched on first use unless \
+            supplied when the adapter was created
+
+        Returns:
+            Version: Server version
+        """
+        if self._server_version is None:
+            await self._set_server_version()
+        return self.server_version
+
+    async def get_settings(self) -> ServerSettings:
+        """Settings of the Metabase server, fetched on first use
+
+        The settings returned are not bound to the adapter, so changes are made \
+            with update_setting.
+
+        Returns:
+            ServerSettings: Server settings
+        """
+        if self._settings is None:
+            settings = await self.get("/setting")
+            if not isinstance(settings, list):
+                logger.error("Unable to fetch settings")
+                raise MetabaseApiException("Unable to fetch settings")
+            by_key: dict[str, Any] = {
+                setting["key"]: Setting(**setting) for setting in settings
+            }
+            self._settings = ServerSettings(**by_key)
+        return self._settings
+
+    async def update_setting(self, key: str, new_value: Any) -> dict[str, Any]:
+        """Updates a setting on the server
+
+        Args:
+            key (str): Metabase name of the setting, e.g. site-name
+            new_value (Any): Desired value for the setting
+
+        Returns:
+            dict[str, Any]: Status of setting change
+        """
+        result = await self.put(endpoint=f"/setting/{key}", json={"value": new_value})
+        self._settings = None  # fetched again on next use
+        if isinstance(result, dict):
+            return result
+        raise MetabaseApiException
+
+    async def connect(self) -> None:
+        """Opens the connection pool and authenticates"""
+        if self._client is None:
+            limits = httpx.Limits(
+                max_connections=self.max_concurrency,
+                max_keepalive_connections=(
+                    self.max_concurrency if self.transport.keep_alive else 0
+                ),
+            )
+            timeout = httpx.Timeout(
+                self.transport.read_timeout, connect=self.transport.connect_timeout
+            )
+            self._client = httpx.AsyncClient(limits=limits, timeout=timeout)
+        await self._authenticate()
+        if self._cache_token:
+            self._save_token(save_path=Path(self._token_path or "metabase.token"))
+
+    async def close(self) -> None:
+        """Closes the connection pool if it was created by the adapter"""
+        if self._client is not None and self._owns_client:
+            await self._client.aclose()
+            self._client = None
+
+    async def _authenticate(self) -> None:
+        authed = False
+        # Try cached token first
+        if self._token_path and self._token_path.exists():
+            with open(self._token_path, encoding="utf-8") as file:
+                token = file.read()
+            logger.info("Attempting authentication with token file")
+            self._add_token_to_header(token=token)
+            authed = await self.test_for_auth()
+            if not authed:
+                logger.warning("Deleting token file")
+                self._token_path.unlink()
+        # Try token passed as credentials next
+        if not authed and "token" in self._credentials:
+            logger.info("Attempting authentication with token passed")
+            self._add_token_to_header(token=self._credentials["token"])
+            authed = await self.test_for_auth()
+        # Finally try username and password
+        if (
+            not authed
+            and "username" in self._credentials
+            and "password" in self._credentials
+        ):
+            authed = await self._auth_with_login()
+        # Raise error if still not authenticated
+        if not authed:
+            logger.error("Failed to authenticate")
+            raise MetabaseApiException(
+                "Failed to authenticate with credentials provided"
+            )
+
+    async def _auth_with_login(self) -> bool:
+        logger.info("Attempting authentication with username and password")
+        try:
+            response = await self.client.post(
+                f"{self.metabase_url}/session", json=self._credentials
+            )
+            # A session ID is only returned for valid credentials
+            self._add_token_to_header(
+                token=self.json_codec.loads(response.content)["id"]
+            )
+        except (httpx.HTTPError, JSONDecodeError, KeyError, TypeError) as error_raised:
+            logger.warning(
+                "Exception encountered during attempt to authenticate with login \
+                    passed: %s",
+                error_raised,
+            )
+            return False
+        return await self.test_for_auth()
+
+    def _add_token_to_header(self, token: str) -> None:
+        headers = {
+            "Content-Type": "application/json",
+            "X-Metabase-Session": token,
+        }
+        self.client.headers.update(headers)
+
+    def _save_token(self, save_path: Path) -> None:
+        """Writes active token to the specified file
+
+        Args:
+            save_path (Path): Name of file to write
+        """
+        logger.debug("Saving token to %s", save_path)
+        token = str(self.client.headers.get("X-Metabase-Session"))
+        with open(save_path, "w", encoding="utf-8") as file:
+            file.write(token)
+
+    async def test_for_auth(self) -> bool:
+        """Validates successful authentication by attempting to retrieve data about \
+            the current user
+
+        Returns:
+            bool: Authentication success status
+        """
+        response = await self.client.get(f"{self.metabase_url}/user/current")
+        return 200 <= response.status_code <= 299
+
+    async def generic_request(
+        self,
+        http_verb: Literal["GET", "POST", "PUT", "DELETE"],
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        envelope: bool = False,
+        retry: bool | None = None,
+    ) -> list[dict[str, Any]] | dict[str, Any]:
+        """Method for dispatching HTTP requests, limited to max_concurrency requests \
+            in flight at a time
+
+        Args:
+            http_method (str): GET or POST or PUT or DELETE
+            endpoint (str): URL endpoint
+            params (dict, optional): Endpoint parameters
+            json (dict, optional): Data payload
+            envelope (bool, optional): Return paginated responses whole instead of \
+                only the records under data, by default False
+            retry (bool, optional): Override whether the request may be retried, by \
+                default the retry policy decides based on the HTTP verb
+
+        Raises:
+            MetabaseApiException: Request failed
+
+        Returns:
+            list[dict[str, Any]] | dict[str, Any]: Response from API
+        """
+        log_line_post = "Request result: success=%s, status_code=%s, message=%s"
+        response = await self._make_request(
+            method=http_verb,
+            url=self.metabase_url + endpoint,
+            params=params,
+            json=json,
+            retry=retry,
+        )
+
+        # If status_code in 200-299 range, return Result, else raise exception
+        if 299 >= response.status_code >= 200:
+            logger.info(
+                log_line_post, True, response.status_code, response.reason_phrase
+            )
+            try:
+                data = self.json_codec.loads(response.content)
+                if (
+                    not envelope
+                    and isinstance(data, dict)
+                    and all(key in data for key in ["data", "total"])
+                ):
+                    data = data["data"]
+                if isinstance(data, (list, dict)):
+                    return data
+            except JSONDecodeError:
+                if response.status_code == 204:
+                    return {"success": True}
+                logger.error(log_line_post, False, response.status_code, response.text)
+                raise
+        elif response.status_code == 401:
+            logger.error(log_line_post, False, response.status_code, response.text)
+            raise MetabaseApiException(
+                "Failed to authenticate: "
+                f"{response.status_code} - {response.reason_phrase}"
+            )
+
+        error_line = (
+            f"{response.status_code} - {response.reason_phrase} - {response.text}"
+        )
+        logger.error(log_line_post, False, response.status_code, response.text)
+        raise MetabaseApiException(error_line)
+
+    async def _make_request(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        retry: bool | None = None,
+    ) -> httpx.Response:
+        """Perform an HTTP request, retrying transient failures according to the \
+            retry policy of the adapter
+
+        Args:
+            method (str): GET or POST or DELETE or PUT
+            url (str): URL endpoint
+            params (dict, optional): Endpoint parameters
+            json (dict, optional): Data payload
+            retry (bool, optional): Override whether the request may be retried, by \
+                default the retry policy decides based on the HTTP verb
+
+        Raises:
+            MetabaseApiException: Request failed
+
+        Returns:
+            httpx.Response: Response from the API
+        """
+        policy = self.retry_policy
+        if retry is None:
+            retry = policy is not None and policy.is_retryable_method(method)
+        if self._retry_budget:
+            self._retry_budget.deposit()
+
+        retry_number = 0
+        while True:
+            try:
+                response = await self._send(
+                    method=method, url=url, params=params, json=json
+                )
+            except httpx.HTTPError as error_raised:
+                if (
+                    retry
+                    and policy
+                    and isinstance(error_raised, _RETRYABLE_ERRORS)
+                    and self._can_retry(retry_number)
+                ):
+                    delay = policy.backoff(retry_number)
+                    logger.warning(
+                        "Retrying %s %s in %.2fs after error: %s",
+                        method,
+                        url,
+                        delay,
+                        error_raised,
+                    )
+                    await asyncio.sleep(delay)
+                    retry_number += 1
+                    continue
+                logger.error(str(error_raised))
+                raise MetabaseApiException from error_raised
+
+            if (
+                retry
+                and policy
+                and policy.is_retryable_response(response)
+                and self._can_retry(retry_number)
+            ):
+                retry_after = policy.retry_after(response)
+                delay = (
+                    retry_after
+                    if retry_after is not None
+                    else policy.backoff(retry_number)
+                )
+                logger.warning(
+                    "Retrying %s %s in %.2fs after status code %s",
+                    method,
+                    url,
+                    delay,
+                    response.status_code,
+                )
+                await asyncio.sleep(delay)
+                retry_number += 1
+                continue
+            return response
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+    ) -> httpx.Response:
+        """Sends a single request, subject to max_concurrency and the rate and \
+            concurrency limiters
+
+        The concurrency limiter is waited for in a worker thread, so the event \
+            loop is not blocked while the limit is reached.
+
+        Args:
+            method (str): GET or POST or DELETE or PUT
+            url (str): URL endpoint
+            params (dict, optional): Endpoint parameters
+            json (dict, optional): Data payload
+
+        Returns:
+            httpx.Response: Response from the API
+        """
+        if self.rate_limiter:
+            delay = self.rate_limiter.reserve()
+            if delay:
+                await asyncio.sleep(delay)
+        async with self._semaphore:
+            if self.concurrency_limiter:
+                await asyncio.to_thread(self.concurrency_limiter.acquire)
+            start = monotonic()
+            overloaded = True
+            try:
+                logger.info("Making HTTP request: %s:%s:%s", method, url, params)
+                response = await self.client.request(
+                    method=method,
+                    url=url,
+                    params=params,
+                    content=None if json is None else self.json_codec.dumps(json),
+                    headers=(
+                        None if json is None else {"Content-Type": "application/json"}
+                    ),
+                )
+                overloaded = response.status_code >= 500 or response.status_code == 429
+                return response
+            finally:
+                if self.concurrency_limiter:
+                    self.concurrency_limiter.release(
+                        latency=monotonic() - start, overloaded=overloaded
+                    )
+
+    def _can_retry(self, retry_number: int) -> bool:
+        """Checks the retry limits of the policy and the adapter-wide retry budget
+
+        Args:
+            retry_number (int): Number of retries already made for the request
+
+        Returns:
+            bool: True if another attempt may be made
+        """
+        if not self.retry_policy or retry_number >= self.retry_policy.max_retries:
+            return False
+        if self._retry_budget and not self._retry_budget.withdraw():
+            logger.warning("Retry budget exhausted, not retrying request")
+            return False
+        return True
+
+    async def get(
+        self, endpoint: str, params: dict[str, Any] | None = None
+    ) -> list[dict[str, Any]] | dict[str, Any]:
+        """HTTP GET request
+
+        Args:
+            endpoint (str): URL endpoint
+            params (dict, optional): Endpoint parameters
+
+        Returns:
+            list[dict[str, Any]] | dict[str, Any]: Response from API
+        """
+        return await self.generic_request(
+            http_verb="GET", endpoint=endpoint, params=params
+        )
+
+    async def get_page(
+        self,
+        endpoint: str,
+        limit: int,
+        offset: int = 0,
+        params: dict[str, Any] | None = None,
+    ) -> Page:
+        """HTTP GET request for one page of a paginated listing
+
+        Args:
+            endpoint (str): URL endpoint
+            limit (int): Maximum number of records returned
+            offset (int, optional): Number of records skipped, by default 0
+            params (dict, optional): Endpoint parameters
+
+        Raises:
+            MetabaseApiException: Request failed or the response is not a listing
+
+        Returns:
+            Page: Records of the page with the total, limit and offset reported
+        """
+        page_params = {**(params or {}), "limit": limit, "offset": offset}
+        result = await self.generic_request(
+            http_verb="GET", endpoint=endpoint, params=page_params, envelope=True
+        )
+        try:
+            return Page.from_response(result)
+        except TypeError as error_raised:
+            raise MetabaseApiException(str(error_raised)) from error_raised
+
+    async def post(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]] | dict[str, Any]:
+        """HTTP POST request
+
+        Args:
+            endpoint (str): URL endpoint
+            params (dict, optional): Endpoint parameters
+            json (dict, optional): Data payload
+
+        Returns:
+            list[dict[str, Any]] | dict[str, Any]: Response from API
+        """
+        return await self.generic_request(
+            http_verb="POST", endpoint=endpoint, params=params, json=json
+        )
+
+    async def delete(
+        self, endpoint: str, params: dict[str, Any] | None = None
+    ) -> list[dict[str, Any]] | dict[str, Any]:
+        """HTTP DELETE request
+
+        Args:
+            endpoint (str): URL endpoint
+            params (dict, optional): Endpoint parameters
+
+        Returns:
+            list[dict[str, Any]] | dict[str, Any]: Response from API
+        """
+        return await self.generic_request(
+            http_verb="DELETE", endpoint=endpoint, params=params
+        )
+
+    async def put(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+    ) -> list[dict[str, Any]] | dict[str, Any]:
+        """HTTP PUT request
+
+        Args:
+            endpoint (str): URL endpoint
+            params (dict, optional): Endpoint parameters
+            json (dict, optional): Data payload
+
+        Returns:
+            list[dict[str, Any]] | dict[str, Any]: Response from API
+        """
+        return await self.generic_request(
+            http_verb="PUT", endpoint=endpoint, params=params, json=json
+        )
+
+    async def _set_server_version(self) -> None:
+        """Get the Metabase version running on the server"""
+        properties = await self.get("/session/properties")
+        if isinstance(properties, dict):
+            self._server_version = Version(properties["version"]["tag"])
+            logger.info("Server version: %s", self._server_version)
+        else:
+            logger.error("Unable to fetch server version")
+            raise MetabaseApiException("Unable to fetch server version")
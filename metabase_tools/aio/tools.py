@@ -0,0 +1,356 @@
+"""
+AsyncMetabaseTools extends AsyncMetabaseApi with additional complex functions
+"""
+
+from __future__ import annotations
+
+import asyncio
+from json import dumps, loads
+from logging import getLogger
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from metabase_tools.exceptions import MetabaseApiException
+from metabase_tools.models.card_model import CardItem
+from metabase_tools.models.generic_model import Item
+from metabase_tools.tools.tools import (
+    NEW_COLLECTION_COLOR,
+    mapping_details,
+    plan_collections,
+)
+
+if TYPE_CHECKING:
+    from metabase_tools.aio.metabase import AsyncMetabaseApi
+
+logger = getLogger(__name__)
+
+
+class AsyncMetabaseTools:
+    """Extends AsyncMetabaseApi with additional complex functions"""
+
+    _adapter: AsyncMetabaseApi
+
+    def __init__(self, adapter: AsyncMetabaseApi):
+        self._adapter = adapter
+
+    async def download_native_queries(
+        self,
+        save_file: Path | str | None = None,
+        root_folder: Path | str = ".",
+        file_extension: str = "sql",
+        max_writers: int = 4,
+    ) -> Path:
+        """Downloads all native queries into a JSON file
+
+        Query files are written in worker threads, up to max_writers at a time.
+
+        Args:
+            save_file (Path | str, optional): Path to save mapping file, defaults to \
+                mapping.json
+            root_folder (Path | str, optional): Root folder to save queries, by \
+                default "."
+            file_extension (str, optional): File extension to save the queries, by \
+                default "sql"
+            max_writers (int, optional): Query files written at a time, by default 4
+
+        Returns:
+            Path: Path to save file
+        """
+        root_folder = Path(root_folder)
+        save_file = Path(save_file or "mapping.json")
+
+        # Cards, collections and databases are independent so fetch them together
+        all_cards, collections, databases = await asyncio.gather(
+            self._adapter.cards.get(),
+            self._adapter.collections.get_flat_list(),
+            self._adapter.databases.get(),
+        )
+        cards = [
+            card
+            for card in all_cards
+            if (
+                card.query_type == "native"
+                and card.collection
+                and card.collection.personal_owner_id is None
+            )
+        ]
+        logger.debug("Found %s cards with native queries", len(cards))
+        cards_to_write, queries = self._map_cards(
+            cards,
+            collections_by_id={
+                collection["id"]: collection for collection in collections
+            },
+            database_names={database.id: database.name for database in databases},
+            root_folder=root_folder,
+            file_extension=file_extension,
+        )
+        failed = await self._save_queries(queries, file_extension, max_writers)
+        if failed:
+            # Recorded without a hash, as the query on disk is not the one mapped
+            for card in cards_to_write:
+                if card["id"] in failed:
+                    del card["query_hash"]
+            logger.error("%s queries could not be written", len(failed))
+
+        # Save mapping file
+        mapping_path = Path(f"{root_folder}")
+        mapping_path.mkdir(parents=True, exist_ok=True)
+        mapping_path /= save_file
+        logger.debug("Completed iterating through list, saving file: %s", mapping_path)
+        with open(mapping_path, "w", newline="", encoding="utf-8") as file:
+            file.write(dumps(cards_to_write, indent=2))
+        return mapping_path
+
+    @staticmethod
+    def _map_cards(
+        cards: list[CardItem],
+        collections_by_id: dict[Any, Any],
+        database_names: dict[Any, str | None],
+        root_folder: Path,
+        file_extension: str,
+    ) -> tuple[list[dict[str, Any]], list[tuple[CardItem, str]]]:
+        """Builds the mapping entry of each card and the folder its query is \
+            saved to, skipping cards whose name is not a valid file name"""
+        cards_to_write = []
+        queries = []
+        for card in cards:
+            new_card = mapping_details(
+                card,
+                collections_by_id=collections_by_id,
+                database_names=database_names,
+            )
+            cards_to_write.append(new_card)
+            file_name = f"{card.name}.{file_extension}"
+            if Path(file_name).name != file_name:
+                logger.warning("Skipping %s (name error)", card.name)
+                continue
+            queries.append((card, f"{root_folder}/{new_card['path']}"))
+        return cards_to_write, queries
+
+    async def _save_queries(
+        self,
+        queries: list[tuple[CardItem, str]],
+        file_extension: str,
+        max_writers: int,
+    ) -> set[Any]:
+        """Writes the query of each card to its folder in worker threads, up to \
+            max_writers at a time, and returns the IDs of the cards whose query \
+            could not be written"""
+        writers = asyncio.Semaphore(max_writers)
+        failed = set()
+
+        async def save(card: CardItem, save_path: str) -> None:
+            async with writers:
+                try:
+                    await asyncio.to_thread(
+                        self._save_query,
+                        card=card,
+                        save_path=save_path,
+                        file_extension=file_extension,
+                    )
+                except (OSError, UnicodeError) as error_raised:
+                    logger.warning("Unable to write %s: %s", card.name, error_raised)
+                    failed.add(card.id)
+
+        await asyncio.gather(*(save(card, path) for card, path in queries))
+        return failed
+
+    @staticmethod
+    def _save_query(card: CardItem, save_path: str, file_extension: str) -> None:
+        sql_path = Path(f"{save_path}")
+        sql_path.mkdir(parents=True, exist_ok=True)
+        sql_path /= f"{card.name}.{file_extension}"
+        with open(sql_path, "w", newline="", encoding="utf-8") as file:
+            file.write(card.dataset_query["native"]["query"])
+
+    async def upload_native_queries(
+        self,
+        mapping_path: Path | str,
+        file_extension: str,
+        dry_run: bool = True,
+        stop_on_error: bool = False,
+        create_collections: bool = False,
+    ) -> list[dict[str, Any]] | dict[str, Any]:
+        """Uploads queries to Metabase
+
+        Cards in a collection that does not exist are errors, unless \
+            create_collections is set; the collections are then created, parents \
+            first.
+
+        Args:
+            mapping_path (Path | str): Path to the mapping configuration file
+            file_extension (str): File extension of the saved queries
+            dry_run (bool, optional): Execute task as a dry run (i.e. do not make \
+                any changes), by default True
+            stop_on_error (bool, optional): Raise error and stop if an error is \
+                encountered. Defaults to False.
+            create_collections (bool, optional): Create the collections of the \
+                mapping that do not exist, by default False
+
+        Raises:
+            FileNotFoundError: The file referenced was not found
+            MetabaseApiException: A collection does not exist, create_collections \
+                is not set and stop_on_error is set
+
+        Returns:
+            list[dict] | dict: Results of upload
+        """
+        mapping_path = Path(mapping_path or "./mapping.json")
+        with open(mapping_path, newline="", encoding="utf-8") as file:
+            cards = loads(file.read())
+
+        changes = await self._plan_changes(
+            cards,
+            mapping_path,
+            file_extension,
+            stop_on_error=stop_on_error,
+            create_collections=create_collections,
+        )
+        if not dry_run:
+            return await self._execute_changes(changes)
+        return changes
+
+    async def _plan_changes(
+        self,
+        cards: list[dict[str, Any]],
+        mapping_path: Path,
+        file_extension: str,
+        stop_on_error: bool,
+        create_collections: bool,
+    ) -> dict[str, list[dict[str, Any]]]:
+        changes: dict[str, list[dict[str, Any]]] = {
+            "collections": [],
+            "updates": [],
+            "creates": [],
+            "errors": [],
+        }
+        collection_ids: dict[str, Any] = {
+            collection["path"]: collection["id"]
+            for collection in await self._adapter.collections.get_flat_list()
+        }
+        database_ids = {
+            database.name: database.id
+            for database in await self._adapter.databases.get()
+        }
+
+        planned = []
+        for card in cards:
+            card_path = Path(
+                f"{mapping_path.parent}/{card['path']}/{card['name']}.{file_extension}"
+            )
+            if not card_path.exists():
+                if stop_on_error:
+                    logger.error("Unable to process %s (file not found)", card["name"])
+                    raise FileNotFoundError(f"{card_path} not found")
+                logger.warning("Skipping %s (file not found)", card["name"])
+                changes["errors"].append(card)
+            elif card["path"] in collection_ids:
+                planned.append((card, card_path))
+            elif create_collections:
+                # Collections missing from the server are created before the cards
+                changes["collections"].extend(
+                    plan_collections(card["path"], collection_ids)
+                )
+                planned.append((card, card_path))
+            else:
+                if stop_on_error:
+                    logger.error(
+                        "Unable to process %s (collection not found)", card["name"]
+                    )
+                    raise MetabaseApiException(f"Collection {card['path']} not found")
+                logger.warning("Skipping %s (collection not found)", card["name"])
+                changes["errors"].append(card)
+
+        results = await asyncio.gather(
+            *(
+                self._plan_card(
+                    card=card,
+                    card_path=card_path,
+                    dev_coll_id=collection_ids[card["path"]],
+                    database_ids=database_ids,
+                )
+                for card, card_path in planned
+            )
+        )
+        for change_type, change in results:
+            if change:
+                changes[change_type].append(change)
+        return changes
+
+    async def _plan_card(
+        self,
+        card: dict[str, Any],
+        card_path: Path,
+        dev_coll_id: int | None,
+        database_ids: dict[str | None, int | str],
+    ) -> tuple[str, dict[str, Any]]:
+        with open(card_path, newline="", encoding="utf-8") as file:
+            dev_code = file.read()
+        card_id = None
+        if dev_coll_id is not None:  # None until a planned collection is created
+            try:
+                card_id = await self._adapter.collections.check_for_object(
+                    dev_coll_id, card["name"]
+                )
+            except MetabaseApiException:
+                pass
+        if card_id is None:
+            logger.debug("%s not found in listed location, creating", card["name"])
+            new_card_def = {
+                "visualization_settings": {},
+                "collection_id": dev_coll_id,
+                "name": card["name"],
+                "dataset_query": {
+                    "type": "native",
+                    "native": {"query": dev_code},
+                    "database": database_ids[card["database_name"]],
+                },
+                "display": "table",
+            }
+            if dev_coll_id is None:  # resolved once the collection exists
+                new_card_def["collection_path"] = card["path"]
+            return "creates", new_card_def
+
+        prod_card = (await self._adapter.cards.get(targets=[card_id]))[0]
+        if dev_code != prod_card.dataset_query["native"]["query"]:
+            dev_query = prod_card.dataset_query.copy()
+            dev_query["native"]["query"] = dev_code
+            return "updates", {"id": card_id, "dataset_query": dev_query}
+        return "updates", {}
+
+    async def _execute_changes(
+        self, changes: dict[str, list[dict[str, Any]]]
+    ) -> list[dict[str, Any]]:
+        # Planned parents first, so each parent exists before its children
+        collection_ids: dict[str, Any] = {}
+        new_collections: list[Item] = []
+        for collection in changes.get("collections", []):
+            parent_id = collection["parent_id"]
+            if parent_id is None:
+                parent_id = collection_ids.get(collection["parent_path"])
+            new_collection = await self._adapter.collections.create(
+                name=collection["name"], color=NEW_COLLECTION_COLOR, parent_id=parent_id
+            )
+            collection_ids[collection["path"]] = new_collection.id
+            new_collections.append(new_collection)
+
+        creates = []
+        for details in changes["creates"]:
+            path = details.get("collection_path")
+            details = {k: v for k, v in details.items() if k != "collection_path"}
+            if path:
+                details["collection_id"] = collection_ids[path]
+            creates.append(details)
+        updated = await asyncio.gather(
+            *(
+                self._adapter.cards.update(update["id"], **update)
+                for update in changes["updates"]
+            )
+        )
+        created = await asyncio.gather(
+            *(self._adapter.cards.create(**details) for details in creates)
+        )
+        return [
+            {"id": result.id, "name": result.name, "is_success": True}
+            for result in [*new_collections, *updated, *created]
+        ]
@@ -3,11 +3,14 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from logging import getLogger
 from typing import TYPE_CHECKING, Any, ClassVar
 
+from metabase_tools.endpoints.generic_endpoint import EndpointSpec
 from metabase_tools.exceptions import MetabaseApiException
 from metabase_tools.models.activity_model import ActivityItem
+from metabase_tools.utils.search_index import SearchIndex
 
 if TYPE_CHECKING:
     from metabase_tools import MetabaseApi
@@ -24,6 +27,15 @@ class Activity:
     def __init__(self, adapter: MetabaseApi):
         self._adapter = adapter
 
+    @classmethod
+    def spec(cls) -> EndpointSpec:
+        """Definition of the endpoint
+
+        Returns:
+            EndpointSpec: Path, model and required parameters of the endpoint
+        """
+        return EndpointSpec(cls._BASE_EP, cls._STD_OBJ, [])
+
     def get(self: Activity) -> list[ActivityItem]:
         """Get recent activity on the server
 
@@ -35,33 +47,75 @@ class Activity:
         """
         result = self._adapter.get(endpoint=self._BASE_EP)
         if isinstance(result, list):
-            activities = [self._STD_OBJ(**item) for item in result]
-            for activity in activities:
-                activity.set_adapter(self._adapter)
-            return activities
+            return [self._hydrate(item) for item in result]
         raise MetabaseApiException
 
+    def _hydrate(self, record: dict[str, Any]) -> ActivityItem:
+        """Builds an activity from a record returned by the API and sets its adapter
+
+        Args:
+            record (dict[str, Any]): Definition of the activity
+
+        Returns:
+            ActivityItem
+        """
+        if self._adapter.trusted_hydration:
+            activity = ActivityItem.from_api(record)
+        else:
+            activity = ActivityItem(**record)
+        activity.set_adapter(self._adapter)
+        return activity
+
+    def iter_get(self: Activity) -> Iterator[ActivityItem]:
+        """Iterate over recent activity on the server as it is received
+
+        Yields:
+            ActivityItem
+        """
+        for item in self._adapter.iter_get(endpoint=self._BASE_EP):
+            if isinstance(item, dict):
+                yield self._hydrate(item)
+
+    def iter_all(self: Activity) -> Iterator[ActivityItem]:
+        """Iterate over recent activity on the server as it is received
+
+        Yields:
+            ActivityItem
+        """
+        return self.iter_get()
+
     def search(
         self,
         search_params: dict[str, Any],
-        search_list: list[ActivityItem] | None = None,
+        search_list: list[ActivityItem] | SearchIndex[ActivityItem] | None = None,
     ) -> list[ActivityItem]:
         """Method to search a list of objects meeting a set of parameters
 
         Args:
             search_params (dict[str, Any]): Search criteria
-            search_list (list[T], optional): Provide to search against an existing \
-                list, by default pulls from API
+            search_list (list[T] | SearchIndex[T], optional): Provide to search \
+                against an existing list or index, by default pulls from API
 
         Returns:
             list[T]: List of objects of the relevant type
         """
         objs = search_list or self.get()
-        results = []
-        for obj in objs:
-            for key, value in search_params.items():
-                if key not in obj.dict() or obj.dict()[key] != value:
-                    break
-            else:
-                results.append(obj)
-        return results
+        return self._filter(objs=objs, search_params=search_params)
+
+    @staticmethod
+    def _filter(
+        objs: list[ActivityItem] | SearchIndex[ActivityItem],
+        search_params: dict[str, Any],
+    ) -> list[ActivityItem]:
+        """Filters a list of activities to those matching all search criteria
+
+        Args:
+            objs (list[ActivityItem] | SearchIndex[ActivityItem]): Activities to \
+                search
+            search_params (dict[str, Any]): Search criteria
+
+        Returns:
+            list[ActivityItem]: Activities matching the criteria
+        """
+        index = objs if isinstance(objs, SearchIndex) else SearchIndex(objs)
+        return index.find(search_params)
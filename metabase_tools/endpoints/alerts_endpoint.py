@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Callable, Iterator, Sequence
 from logging import getLogger
 from typing import Any, ClassVar
 
@@ -11,7 +12,9 @@ from packaging.version import Version
 from metabase_tools.endpoints.generic_endpoint import Endpoint
 from metabase_tools.models.alert_model import AlertItem
 from metabase_tools.models.generic_model import MissingParam
+from metabase_tools.utils.concurrency import BulkReport
 from metabase_tools.utils.logging_utils import log_call
+from metabase_tools.utils.search_index import SearchIndex
 
 logger = getLogger(__name__)
 
@@ -30,23 +33,35 @@ class Alerts(Endpoint[AlertItem]):
         "alert_above_goal",
     ]
 
-    @log_call
-    def get(self, targets: list[int] | None = None) -> list[AlertItem]:
-        """Fetch list of alerts
-
-        Args:
-            targets (list[int], optional): If provided, the list of alerts to fetch
+    def _legacy(self) -> bool:
+        """Alerts cannot be fetched by ID before v0.41
 
         Returns:
-            list[AlertItem]
+            bool: True if the server is older than v0.41
         """
-        if targets and not isinstance(targets, list):
-            raise TypeError
-        if self._adapter and self._adapter.server_version >= Version("v0.41"):
-            return super().get(targets=targets)  # standard if supported by version
-        if targets and isinstance(targets, list):
-            return [x for x in super().get() if x.id in targets]  # get all and filter
-        return super().get()  # get all
+        return self._adapter.server_version < Version("v0.41")
+
+    def _get_targets(
+        self,
+        targets: list[int],
+        parse: Callable[[dict[str, Any]], Any] | None = None,
+    ) -> list[Any]:
+        if not self._legacy():
+            return super()._get_targets(targets, parse=parse)
+        return list(self._iter_targets(targets, parse or (lambda record: record)))
+
+    def _iter_targets(
+        self, targets: list[int], parse: Callable[[dict[str, Any]], Any]
+    ) -> Iterator[Any]:
+        if not self._legacy():
+            return super()._iter_targets(targets, parse)
+        # Filter the list of all alerts, parsing only the alerts requested
+        wanted = set(targets)
+        return (
+            parse(record)
+            for record in self._adapter.iter_get(endpoint=self._BASE_EP)
+            if isinstance(record, dict) and record.get("id") in wanted
+        )
 
     def get_by_card(self, targets: list[int]) -> list[AlertItem]:
         """Get all alerts for the given card IDs
@@ -60,10 +75,7 @@ class Alerts(Endpoint[AlertItem]):
         result = self._request_list(
             "GET", endpoint="/alert/question/{id}", source=targets
         )
-        alerts = [AlertItem(**x) for x in result]
-        for alert in alerts:
-            alert.set_adapter(self._adapter)
-        return alerts
+        return [self._hydrate(x) for x in result]
 
     def _make_create(self, **kwargs: Any) -> AlertItem:
         """Makes create request
@@ -119,19 +131,26 @@ class Alerts(Endpoint[AlertItem]):
             **kwargs,
         )
 
+    @log_call
+    def bulk_delete(
+        self, targets: Sequence[int | AlertItem], max_workers: int | None = None
+    ) -> BulkReport:
+        """DEPRECATED; use bulk_archive instead"""
+        raise NotImplementedError
+
     @log_call
     def search(
         self,
         search_params: list[dict[str, Any]],
-        search_list: list[AlertItem] | None = None,
+        search_list: list[AlertItem] | SearchIndex[AlertItem] | None = None,
     ) -> list[AlertItem]:
         """Method to search a list of alerts meeting a list of parameters
 
         Args:
             search_params (list[dict]): Each dict contains search criteria and returns\
                  1 result
-            search_list (list[AlertItem], optional): Provide to search an existing \
-                list, by default pulls from API
+            search_list (list[AlertItem] | SearchIndex[AlertItem], optional): Provide \
+                to search an existing list or index, by default pulls from API
 
         Returns:
             list[AlertItem]: List of alerts of the relevant type
@@ -3,13 +3,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from logging import getLogger
 from typing import Any, ClassVar
 
 from metabase_tools.endpoints.generic_endpoint import Endpoint
 from metabase_tools.models.card_model import CardItem
 from metabase_tools.models.generic_model import MissingParam
+from metabase_tools.utils.concurrency import BulkReport
 from metabase_tools.utils.logging_utils import log_call
+from metabase_tools.utils.search_index import SearchIndex
 
 logger = getLogger(__name__)
 
@@ -27,18 +30,6 @@ class Cards(Endpoint[CardItem]):
         "display",
     ]
 
-    @log_call
-    def get(self, targets: list[int] | None = None) -> list[CardItem]:
-        """Fetch list of cards
-
-        Args:
-            targets (list[int], optional): If provided, the list of cards to fetch
-
-        Returns:
-            list[CardItem]
-        """
-        return super().get(targets=targets)
-
     def _make_create(self, **kwargs: Any) -> CardItem:
         """Makes create request
 
@@ -93,19 +84,26 @@ class Cards(Endpoint[CardItem]):
             **kwargs,
         )
 
+    @log_call
+    def bulk_delete(
+        self, targets: Sequence[int | CardItem], max_workers: int | None = None
+    ) -> BulkReport:
+        """DEPRECATED; use bulk_archive instead"""
+        raise NotImplementedError
+
     @log_call
     def search(
         self,
         search_params: list[dict[str, Any]],
-        search_list: list[CardItem] | None = None,
+        search_list: list[CardItem] | SearchIndex[CardItem] | None = None,
     ) -> list[CardItem]:
         """Method to search a list of cards meeting a list of parameters
 
         Args:
             search_params (list[dict]): Each dict contains search criteria and returns\
                  1 result
-            search_list (list[CardItem], optional): Provide to search an existing \
-                list, by default pulls from API
+            search_list (list[CardItem] | SearchIndex[CardItem], optional): Provide \
+                to search an existing list or index, by default pulls from API
 
         Returns:
             list[CardItem]: List of cards of the relevant type
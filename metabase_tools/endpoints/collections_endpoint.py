@@ -3,13 +3,16 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 from logging import getLogger
 from typing import Any, ClassVar
 
 from metabase_tools.endpoints.generic_endpoint import Endpoint
 from metabase_tools.models.collection_model import CollectionItem
 from metabase_tools.models.generic_model import MissingParam
+from metabase_tools.utils.concurrency import BulkReport
 from metabase_tools.utils.logging_utils import log_call
+from metabase_tools.utils.search_index import SearchIndex
 
 logger = getLogger(__name__)
 
@@ -21,18 +24,6 @@ class Collections(Endpoint[CollectionItem]):
     _STD_OBJ: ClassVar[type] = CollectionItem
     _required_params: ClassVar[list[str]] = ["name", "color"]
 
-    @log_call
-    def get(self, targets: list[int] | None = None) -> list[CollectionItem]:
-        """Fetch list of collections
-
-        Args:
-            targets (list[int], optional): If provided, the list of collections to fetch
-
-        Returns:
-            list[CollectionItem]
-        """
-        return super().get(targets=targets)
-
     def _make_create(self, **kwargs: Any) -> CollectionItem:
         """Makes create request
 
@@ -75,19 +66,27 @@ class Collections(Endpoint[CollectionItem]):
             **kwargs,
         )
 
+    @log_call
+    def bulk_delete(
+        self, targets: Sequence[int | CollectionItem], max_workers: int | None = None
+    ) -> BulkReport:
+        """DEPRECATED; use bulk_archive instead"""
+        raise NotImplementedError
+
     @log_call
     def search(
         self,
         search_params: list[dict[str, Any]],
-        search_list: list[CollectionItem] | None = None,
+        search_list: list[CollectionItem] | SearchIndex[CollectionItem] | None = None,
     ) -> list[CollectionItem]:
         """Method to search a list of cards meeting a list of parameters
 
         Args:
             search_params (list[dict]): Each dict contains search criteria and returns\
                  1 result
-            search_list (list[CollectionItem], optional): Provide to search an existing\
-                 list, by default pulls from API
+            search_list (list[CollectionItem] | SearchIndex[CollectionItem], \
+                optional): Provide to search an existing list or index, by \
+                default pulls from API
 
         Returns:
             list[CollectionItem]: List of cards of the relevant type
@@ -157,7 +156,19 @@ class Collections(Endpoint[CollectionItem]):
         Returns:
             list[dict]: Flattened collection tree
         """
-        tree = self.get_tree()
+        return self.flatten_tree(self.get_tree())
+
+    @staticmethod
+    def flatten_tree(tree: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Flattens a collection tree so the full path of each collection is shown, \
+            shared with the asynchronous endpoint
+
+        Args:
+            tree (list[dict]): Collection tree, as returned by get_tree
+
+        Returns:
+            list[dict]: Flattened collection tree, without personal collections
+        """
         folders = []
         for root_folder in tree:
             if root_folder["personal_owner_id"] is not None:  # Skips personal folders
@@ -10,6 +10,7 @@ from metabase_tools.endpoints.generic_endpoint import Endpoint
 from metabase_tools.models.dashboard_model import DashboardItem
 from metabase_tools.models.generic_model import MissingParam
 from metabase_tools.utils.logging_utils import log_call
+from metabase_tools.utils.search_index import SearchIndex
 
 logger = getLogger(__name__)
 
@@ -21,18 +22,6 @@ class Dashboards(Endpoint[DashboardItem]):
     _STD_OBJ: ClassVar[type] = DashboardItem
     _required_params: ClassVar[list[str]] = ["name"]
 
-    @log_call
-    def get(self, targets: list[int] | None = None) -> list[DashboardItem]:
-        """Fetch list of dashboards
-
-        Args:
-            targets (list[int], optional): If provided, the list of dashboards to fetch
-
-        Returns:
-            list[DashboardItem]
-        """
-        return super().get(targets=targets)
-
     def _make_create(self, **kwargs: Any) -> DashboardItem:
         """Makes create request
 
@@ -79,15 +68,16 @@ class Dashboards(Endpoint[DashboardItem]):
     def search(
         self,
         search_params: list[dict[str, Any]],
-        search_list: list[DashboardItem] | None = None,
+        search_list: list[DashboardItem] | SearchIndex[DashboardItem] | None = None,
     ) -> list[DashboardItem]:
         """Method to search a list of dashboards meeting a list of parameters
 
         Args:
             search_params (list[dict]): Each dict contains search criteria and returns\
                  1 result
-            search_list (list[DashboardItem], optional): Provide to search an existing \
-                list, by default pulls from API
+            search_list (list[DashboardItem] | SearchIndex[DashboardItem], \
+                optional): Provide to search an existing list or index, by \
+                default pulls from API
 
         Returns:
             list[DashboardItem]: List of dashboards of the relevant type
@@ -10,6 +10,7 @@ from metabase_tools.endpoints.generic_endpoint import Endpoint
 from metabase_tools.models.database_model import DatabaseItem
 from metabase_tools.models.generic_model import MissingParam
 from metabase_tools.utils.logging_utils import log_call
+from metabase_tools.utils.search_index import SearchIndex
 
 logger = getLogger(__name__)
 
@@ -21,18 +22,6 @@ class Databases(Endpoint[DatabaseItem]):
     _STD_OBJ: ClassVar[type] = DatabaseItem
     _required_params: ClassVar[list[str]] = ["name", "engine", "details"]
 
-    @log_call
-    def get(self, targets: list[int] | None = None) -> list[DatabaseItem]:
-        """Fetch list of databases
-
-        Args:
-            targets (list[int], optional): If provided, the list of databases to fetch
-
-        Returns:
-            list[DatabaseItem]
-        """
-        return super().get(targets=targets)
-
     def _make_create(self, **kwargs: Any) -> DatabaseItem:
         """Makes create request
 
@@ -85,15 +74,16 @@ class Databases(Endpoint[DatabaseItem]):
     def search(
         self,
         search_params: list[dict[str, Any]],
-        search_list: list[DatabaseItem] | None = None,
+        search_list: list[DatabaseItem] | SearchIndex[DatabaseItem] | None = None,
     ) -> list[DatabaseItem]:
         """Method to search a list of databases meeting a list of parameters
 
         Args:
             search_params (list[dict]): Each dict contains search criteria and returns\
                  1 result
-            search_list (list[DatabaseItem], optional): Provide to search an existing \
-                list, by default pulls from API
+            search_list (list[DatabaseItem] | SearchIndex[DatabaseItem], \
+                optional): Provide to search an existing list or index, by \
+                default pulls from API
 
         Returns:
             list[DatabaseItem]: List of databases of the relevant type
@@ -4,12 +4,34 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator, Sequence
+from functools import partial
 from logging import getLogger
-from typing import TYPE_CHECKING, Any, ClassVar, Generic, Literal, TypeVar, cast
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Generic,
+    Literal,
+    NamedTuple,
+    TypeVar,
+    cast,
+    overload,
+)
 
-from metabase_tools.exceptions import MetabaseApiException
-from metabase_tools.models.generic_model import Item, MissingParam
+from metabase_tools.exceptions import (
+    MetabaseApiBatchException,
+    MetabaseApiException,
+)
+from metabase_tools.models.generic_model import (
+    Item,
+    ItemProjection,
+    MissingParam,
+    make_projection,
+)
+from metabase_tools.utils.concurrency import BulkReport, map_concurrently, run_bulk
 from metabase_tools.utils.logging_utils import log_call
+from metabase_tools.utils.search_index import SearchIndex
 
 if TYPE_CHECKING:
     from metabase_tools import MetabaseApi
@@ -19,6 +41,21 @@ T = TypeVar("T", bound=Item)
 logger = getLogger(__name__)
 
 
+class EndpointSpec(NamedTuple):
+    """Definition of an endpoint, shared by the synchronous and asynchronous \
+        endpoint classes
+
+    Attributes:
+        base_endpoint: Path of the endpoint on the server
+        std_obj: Model of the objects returned
+        required_params: Parameters required to create an object
+    """
+
+    base_endpoint: str
+    std_obj: type
+    required_params: list[str]
+
+
 class Endpoint(ABC, Generic[T]):
     """Abstract base class for endpoints"""
 
@@ -30,89 +67,458 @@ class Endpoint(ABC, Generic[T]):
     def __init__(self, adapter: MetabaseApi):
         self._adapter = adapter
 
+    @classmethod
+    def spec(cls) -> EndpointSpec:
+        """Definition of the endpoint
+
+        Returns:
+            EndpointSpec: Path, model and required parameters of the endpoint
+        """
+        return EndpointSpec(cls._BASE_EP, cls._STD_OBJ, cls._required_params)
+
+    def _hydrate(self, record: dict[str, Any]) -> T:
+        """Builds an object from a record returned by the API and sets its adapter
+
+        Validation is skipped if the adapter is configured for trusted hydration.
+
+        Args:
+            record (dict[str, Any]): Definition of the object
+
+        Returns:
+            T: Object of the relevant type
+        """
+        model = cast(type[T], self._STD_OBJ)
+        if self._adapter.trusted_hydration:
+            obj = model.from_api(record)
+        else:
+            obj = model(**record)
+        obj.set_adapter(self._adapter)
+        return obj
+
+    def _project(
+        self, record: dict[str, Any], model: type[ItemProjection]
+    ) -> ItemProjection:
+        """Builds a read-only object with a subset of the fields of a record
+
+        Args:
+            record (dict[str, Any]): Definition of the object
+            model (type[ItemProjection]): Model with the requested fields
+
+        Returns:
+            ItemProjection: Object with only the requested fields
+        """
+        if self._adapter.trusted_hydration:
+            return model.from_api(record)
+        return model(**record)
+
+    def _projection(self, fields: list[str]) -> type[ItemProjection]:
+        """Read-only model with the requested fields of the standard object
+
+        Args:
+            fields (list[str]): Names of the fields requested
+
+        Raises:
+            TypeError: Fields is not a list of strings
+
+        Returns:
+            type[ItemProjection]: Model with the requested fields
+        """
+        if not isinstance(fields, list) or not all(
+            isinstance(field, str) for field in fields
+        ):
+            raise TypeError(f"Expected list[str] but received {type(fields)}")
+        return make_projection(self._STD_OBJ, tuple(fields))
+
     @log_call
     def _request_list(
         self,
         http_verb: Literal["GET", "POST", "PUT", "DELETE"],
         endpoint: str,
         source: list[int],
-    ) -> list[dict[str, Any]]:
+        parse: Callable[[dict[str, Any]], Any] | None = None,
+    ) -> list[Any]:
         """Sends requests to API based on a list of objects
 
+        Requests are dispatched concurrently when the adapter is configured with \
+            more than one worker. Results keep the order of source and every target \
+            is attempted even if some of them fail.
+
         Args:
             http_method (str): GET or POST or PUT or DELETE
             endpoint (str): Endpoint to use for request
             source (list[int] | list[dict]): List of targets or payloads
+            parse (Callable, optional): Applied to each record as soon as it is \
+                received, so only the parsed records are kept
 
         Raises:
             InvalidParameters: Item in source is not an int or dict
             EmptyDataReceived: No data returned
+            MetabaseApiBatchException: One or more requests failed
 
         Returns:
-            list[dict]: Aggregated results of all API calls
+            list: Aggregated results of all API calls
         """
-        results = []
-
         for item in source:
-            if isinstance(item, int):
+            if not isinstance(item, int):
+                raise TypeError(f"Expected list[int] but found {type(item)} in list")
+
+        def request(item: int) -> list[Any]:
+            if http_verb == "GET":
+                # Shares the caches and requests in flight of the adapter
+                result = self._adapter.get(endpoint=endpoint.format(id=item))
+            else:
                 result = self._adapter.generic_request(
                     http_verb=http_verb, endpoint=endpoint.format(id=item)
                 )
-            else:
-                raise TypeError(f"Expected list[int] but found {type(item)} in list")
-            if isinstance(result, dict):
-                results.append(result)
-            if isinstance(result, list) and all(
-                isinstance(item, dict) for item in result
+            records = [result] if isinstance(result, dict) else result
+            if not isinstance(records, list) or not all(
+                isinstance(record, dict) for record in records
             ):
+                return []
+            if parse is None:
+                return records
+            return [parse(record) for record in records]
+
+        outcomes = map_concurrently(
+            request,
+            source,
+            max_workers=self._adapter.max_workers,
+        )
+
+        results: list[Any] = []
+        errors: dict[Any, Exception] = {}
+        for item, (result, error) in zip(source, outcomes):
+            if error is not None:
+                logger.warning("Request for %s failed: %s", item, error)
+                errors[item] = error
+            if result:
                 results.extend(result)
+        if len(errors) > 0:
+            first_error = next(iter(errors.values()))
+            raise MetabaseApiBatchException(
+                results=results, errors=errors
+            ) from first_error
         if len(results) > 0:
             return results
         raise TypeError("Received empty list")
 
-    @abstractmethod
-    def get(self, targets: list[int] | None = None) -> list[T]:
-        """Generic method for returning an object or list of objects
+    @staticmethod
+    def _check_targets(targets: Any) -> None:
+        """Validates the IDs of the objects being requested
 
         Args:
-            targets (list[int], optional): IDs of the objects being requested
+            targets (Any): IDs of the objects being requested
 
         Raises:
-            InvalidParameters: Targets are not None or list[int]
-            EmptyDataReceived: No data is received from the API
+            TypeError: Targets are not list[int]
+        """
+        if not isinstance(targets, list) or not all(
+            isinstance(target, int) for target in targets
+        ):
+            raise TypeError(f"Expected list[int] or None but received {type(targets)}")
+
+    def _get_targets(
+        self,
+        targets: list[int],
+        parse: Callable[[dict[str, Any]], Any] | None = None,
+    ) -> list[Any]:
+        """Requests objects by ID
+
+        Args:
+            targets (list[int]): IDs of the objects being requested
+            parse (Callable, optional): Applied to each record as it is received
 
         Returns:
-            list[T]: List of objects of the relevant type
+            list: Records of the objects, parsed if parse is provided
+        """
+        return self._request_list(
+            http_verb="GET",
+            endpoint=self._BASE_EP + "/{id}",
+            source=targets,
+            parse=parse,
+        )
+
+    def _iter_targets(
+        self, targets: list[int], parse: Callable[[dict[str, Any]], Any]
+    ) -> Iterator[Any]:
+        """Requests objects by ID in batches of the adapter's max_workers
+
+        Args:
+            targets (list[int]): IDs of the objects being requested
+            parse (Callable): Applied to each record as it is received
+
+        Yields:
+            Any: Parsed objects
+        """
+        batch_size = self._adapter.max_workers
+        for start in range(0, len(targets), batch_size):
+            end = start + batch_size
+            yield from self._get_targets(targets[start:end], parse=parse)
+
+    def _iter_records(self, parse: Callable[[dict[str, Any]], Any]) -> Iterator[Any]:
+        """Streams the list of all objects
+
+        Args:
+            parse (Callable): Applied to each record as it is received
+
+        Yields:
+            Any: Parsed objects
         """
-        if isinstance(targets, list) and all(isinstance(t, int) for t in targets):
-            results = self._request_list(
-                http_verb="GET",
-                endpoint=self._BASE_EP + "/{id}",
-                source=targets,
-            )
-            objs = [self._STD_OBJ(**result) for result in results]
-            for obj in objs:
-                obj.set_adapter(self._adapter)
-            return objs
+        for record in self._adapter.iter_get(endpoint=self._BASE_EP):
+            if isinstance(record, dict):
+                yield parse(record)
+
+    def _parser(self, fields: list[str] | None) -> Callable[[dict[str, Any]], Any]:
+        """Builds full objects, or read-only objects if fields are requested
 
+        Args:
+            fields (list[str], optional): Names of the fields requested
+
+        Returns:
+            Callable: Parser of the records returned by the API
+        """
+        if fields is None:
+            return self._hydrate
+        return partial(self._project, model=self._projection(fields))
+
+    @overload
+    def get(self, targets: list[int] | None = None) -> list[T]: ...
+
+    @overload
+    def get(
+        self, targets: list[int] | None = None, *, fields: list[str]
+    ) -> list[ItemProjection]: ...
+
+    @log_call
+    def get(
+        self, targets: list[int] | None = None, fields: list[str] | None = None
+    ) -> list[T] | list[ItemProjection]:
+        """Fetch an object or list of objects
+
+        Args:
+            targets (list[int], optional): IDs of the objects being requested
+            fields (list[str], optional): If provided, only these fields and the id \
+                are kept and read-only objects are returned
+
+        Raises:
+            TypeError: Targets are not None or list[int], or no data is received \
+                from the API
+
+        Returns:
+            list[T] | list[ItemProjection]: List of objects of the relevant type
+        """
         if targets is None:
+            if fields is not None:
+                # Stream the list so the unrequested fields are never held at once
+                return list(self.iter_get(fields=fields))
             # If no targets are provided, all objects of that type should be returned
             result = self._adapter.get(endpoint=self._BASE_EP)
             if isinstance(result, list):  # Validate data was returned
                 # Unpack data into instances of the class and return
-                objs = [
-                    self._STD_OBJ(**record)
+                return [
+                    self._hydrate(record)
                     for record in result
                     if isinstance(record, dict)
                 ]
-                for obj in objs:
-                    obj.set_adapter(self._adapter)
-                return objs
-        else:
-            # If something other than None, list[int], raise error
-            raise TypeError(f"Expected list[int] or None but received {type(targets)}")
-        # If response.data was empty, raise error
-        raise TypeError("Received empty list")
+            # If response.data was empty, raise error
+            raise TypeError("Received empty list")
+        self._check_targets(targets)
+        if fields is not None:
+            # Projected as each response arrives so full records are not kept
+            return self._get_targets(targets, parse=self._parser(fields))
+        return [self._hydrate(result) for result in self._get_targets(targets)]
+
+    @overload
+    def iter_get(self, targets: list[int] | None = None) -> Iterator[T]: ...
+
+    @overload
+    def iter_get(
+        self, targets: list[int] | None = None, *, fields: list[str]
+    ) -> Iterator[ItemProjection]: ...
+
+    def iter_get(
+        self, targets: list[int] | None = None, fields: list[str] | None = None
+    ) -> Iterator[T] | Iterator[ItemProjection]:
+        """Iterate over an object or list of objects as they are received
+
+        Objects are yielded as soon as they are received so memory use does not \
+            grow with the number of objects. Targets are requested in batches of \
+            the adapter's max_workers.
+
+        Args:
+            targets (list[int], optional): IDs of the objects being requested
+            fields (list[str], optional): If provided, only these fields and the id \
+                are kept and read-only objects are yielded
+
+        Raises:
+            TypeError: Targets are not None or list[int]
+
+        Returns:
+            Iterator[T] | Iterator[ItemProjection]: Objects of the relevant type
+        """
+        parse = self._parser(fields)
+        if targets is None:
+            return self._iter_records(parse)
+        self._check_targets(targets)
+        return self._iter_targets(targets, parse)
+
+    def iter_all(self) -> Iterator[T]:
+        """Iterates over all objects of the relevant type
+
+        Yields:
+            T: Objects of the relevant type
+        """
+        return self.iter_get()
+
+    def _bulk(
+        self,
+        operation: str,
+        func: Callable[[Any], Any],
+        targets: Sequence[Any],
+        max_workers: int | None,
+    ) -> BulkReport:
+        """Runs an operation on many targets with a bounded pool of workers
+
+        Args:
+            operation (str): Name of the operation, used in the report
+            func (Callable[[Any], Any]): Operation run for each target
+            targets (Sequence[Any]): IDs, objects or changes of the targets
+            max_workers (int, optional): Maximum number of concurrent requests, \
+                by default the adapter's max_workers
+
+        Returns:
+            BulkReport: Outcome of every target, in the order of targets
+        """
+        return run_bulk(
+            operation=operation,
+            func=func,
+            items=targets,
+            key=lambda target: (
+                target.get("id")
+                if isinstance(target, dict)
+                else getattr(target, "id", target)
+            ),
+            max_workers=max_workers or self._adapter.max_workers,
+        )
+
+    def _bulk_put(self, target: int | T | None, payload: dict[str, Any]) -> T:
+        """Sends an update for one target of a bulk operation
+
+        Args:
+            target (int | T, optional): ID of the object or the object
+            payload (dict[str, Any]): Fields to update
+
+        Raises:
+            TypeError: Target is not an int or object, or the response is not a \
+                dict
+
+        Returns:
+            T: Object returned by the API after the update
+        """
+        target_id = target.id if isinstance(target, Item) else target
+        if not isinstance(target_id, int):
+            raise TypeError(f"Expected int or Item but received {type(target)}")
+        result = self._adapter.put(
+            endpoint=f"{self._BASE_EP}/{target_id}", json=payload
+        )
+        if isinstance(result, dict):
+            return self._hydrate(result)
+        raise TypeError(f"Expected dict but received {type(result)}")
+
+    @log_call
+    def bulk_update(
+        self,
+        changes: Sequence[dict[str, Any] | T],
+        max_workers: int | None = None,
+    ) -> BulkReport:
+        """Updates many objects concurrently
+
+        Every change is attempted and failures are collected in the report \
+            instead of being raised.
+
+        Args:
+            changes (Sequence[dict[str, Any] | T]): Either a dict with the id of \
+                the object and the fields to update, or an object whose changed \
+                fields are saved
+            max_workers (int, optional): Maximum number of concurrent requests, \
+                by default the adapter's max_workers
+
+        Returns:
+            BulkReport: Updated object or error for every change
+        """
+
+        def update(change: dict[str, Any] | T) -> T:
+            if isinstance(change, Item):
+                return change.save()
+            payload = {key: value for key, value in change.items() if key != "id"}
+            return self._bulk_put(change.get("id"), payload)
+
+        return self._bulk("bulk_update", update, changes, max_workers)
+
+    @log_call
+    def bulk_archive(
+        self, targets: Sequence[int | T], max_workers: int | None = None
+    ) -> BulkReport:
+        """Archives many objects concurrently
+
+        Args:
+            targets (Sequence[int | T]): IDs of the objects or the objects
+            max_workers (int, optional): Maximum number of concurrent requests, \
+                by default the adapter's max_workers
+
+        Returns:
+            BulkReport: Archived object or error for every target
+        """
+        return self._bulk(
+            "bulk_archive",
+            lambda target: self._bulk_put(target, {"archived": True}),
+            targets,
+            max_workers,
+        )
+
+    @log_call
+    def bulk_unarchive(
+        self, targets: Sequence[int | T], max_workers: int | None = None
+    ) -> BulkReport:
+        """Unarchives many objects concurrently
+
+        Args:
+            targets (Sequence[int | T]): IDs of the objects or the objects
+            max_workers (int, optional): Maximum number of concurrent requests, \
+                by default the adapter's max_workers
+
+        Returns:
+            BulkReport: Unarchived object or error for every target
+        """
+        return self._bulk(
+            "bulk_unarchive",
+            lambda target: self._bulk_put(target, {"archived": False}),
+            targets,
+            max_workers,
+        )
+
+    @log_call
+    def bulk_delete(
+        self, targets: Sequence[int | T], max_workers: int | None = None
+    ) -> BulkReport:
+        """Deletes many objects concurrently
+
+        Args:
+            targets (Sequence[int | T]): IDs of the objects or the objects
+            max_workers (int, optional): Maximum number of concurrent requests, \
+                by default the adapter's max_workers
+
+        Returns:
+            BulkReport: Outcome for every target
+        """
+
+        def delete(target: int | T) -> None:
+            target_id = target.id if isinstance(target, Item) else target
+            if not isinstance(target_id, int):
+                raise TypeError(f"Expected int or Item but received {type(target)}")
+            _ = self._adapter.delete(endpoint=f"{self._BASE_EP}/{target_id}")
+
+        return self._bulk("bulk_delete", delete, targets, max_workers)
 
     @abstractmethod
     def _make_create(self, **kwargs: Any) -> T:
@@ -143,34 +549,48 @@ class Endpoint(ABC, Generic[T]):
 
         result = self._adapter.post(endpoint=self._BASE_EP, json=details)
         if isinstance(result, dict):
-            obj = self._STD_OBJ(**result)
-            obj.set_adapter(adapter=self._adapter)
-            return cast(T, obj)
+            return self._hydrate(result)
         raise TypeError(f"Expected dict but received {type(result)}")
 
     @abstractmethod
     def search(
         self,
         search_params: list[dict[str, Any]],
-        search_list: list[T] | None = None,
+        search_list: list[T] | SearchIndex[T] | None = None,
     ) -> list[T]:
         """Method to search a list of objects meeting a list of parameters
 
+        A list is indexed again on every call, so only a SearchIndex passed as \
+            search_list is reused between searches.
+
         Args:
             search_params (list[dict]): Each dict contains search criteria and returns\
                  1 result
-            search_list (list[T], optional): Provide to search against an existing \
-                list, by default pulls from API
+            search_list (list[T] | SearchIndex[T], optional): Provide to search \
+                against an existing list or index, by default pulls from API
 
         Returns:
             list[T]: List of objects of the relevant type
         """
         objs = search_list or self.get()
-        results = []
-        for param in search_params:
-            for obj in objs:
-                obj_dict = obj.dict()
-                for key, value in param.items():
-                    if key in obj_dict and value == obj_dict[key]:
-                        results.append(obj)
-        return results
+        return self._filter(objs=objs, search_params=search_params)
+
+    @staticmethod
+    def _filter(
+        objs: list[T] | SearchIndex[T], search_params: list[dict[str, Any]]
+    ) -> list[T]:
+        """Filters a list of objects using a list of search criteria
+
+        Each object is returned once for every criterion of a dict it matches. \
+            Lists are indexed for this call only and the index is not cached.
+
+        Args:
+            objs (list[T] | SearchIndex[T]): Objects to search
+            search_params (list[dict]): Each dict contains search criteria and returns\
+                 1 result
+
+        Returns:
+            list[T]: List of objects matching the criteria
+        """
+        index = objs if isinstance(objs, SearchIndex) else SearchIndex(objs)
+        return index.match_each(search_params)
@@ -0,0 +1,223 @@
+"""Classes related to the search endpoint
+"""
+
+from __future__ import annotations
+
+from logging import getLogger
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from metabase_tools.endpoints.generic_endpoint import EndpointSpec
+from metabase_tools.models.search_model import SearchItem
+from metabase_tools.utils.logging_utils import log_call
+from metabase_tools.utils.pagination import Pager
+
+if TYPE_CHECKING:
+    from metabase_tools import MetabaseApi
+
+logger = getLogger(__name__)
+
+
+class Search:
+    """Search related endpoint methods"""
+
+    _BASE_EP: ClassVar[str] = "/search"
+    _STD_OBJ: ClassVar[type] = SearchItem
+
+    def __init__(self, adapter: MetabaseApi):
+        self._adapter = adapter
+
+    @classmethod
+    def spec(cls) -> EndpointSpec:
+        """Definition of the endpoint
+
+        Returns:
+            EndpointSpec: Path, model and required parameters of the endpoint
+        """
+        return EndpointSpec(cls._BASE_EP, cls._STD_OBJ, [])
+
+    @staticmethod
+    def request_params(
+        query: str | None,
+        models: list[str] | None,
+        archived: bool,
+        limit: int | None,
+        offset: int | None,
+    ) -> dict[str, Any]:
+        """Query parameters of a search request, shared with the asynchronous \
+            endpoint
+
+        Args:
+            query (str, optional): Text searched for
+            models (list[str], optional): Models searched
+            archived (bool): Search archived objects instead of active ones
+            limit (int, optional): Maximum number of results
+            offset (int, optional): Number of results skipped
+
+        Returns:
+            dict[str, Any]: Parameters of the request
+        """
+        params: dict[str, Any] = {"archived": str(archived).lower()}
+        if query:
+            params["q"] = query
+        if models:
+            params["models"] = models
+        if limit is not None:
+            params["limit"] = limit
+        if offset is not None:
+            params["offset"] = offset
+        return params
+
+    @staticmethod
+    def parse_results(result: Any, collection_id: int | None) -> list[SearchItem]:
+        """Builds search results from a response of the API, shared with the \
+            asynchronous endpoint
+
+        Args:
+            result (Any): Response of the API, either a list of results or an \
+                object with the results under data
+            collection_id (int, optional): Only keep results in this collection
+
+        Raises:
+            TypeError: Invalid response received from the API
+
+        Returns:
+            list[SearchItem]: Results of the search
+        """
+        if isinstance(result, dict):
+            result = result.get("data")
+        if not isinstance(result, list):
+            raise TypeError(f"Expected list, received {type(result)}")
+        items = [SearchItem(**record) for record in result if isinstance(record, dict)]
+        if collection_id is not None:
+            items = [item for item in items if item.collection_id == collection_id]
+        return items
+
+    @staticmethod
+    def is_complete(result: Any) -> bool:
+        """Checks whether a response of the API lists every match, shared with \
+            the asynchronous endpoint
+
+        Args:
+            result (Any): Response of the API
+
+        Returns:
+            bool: True if the response reports a total that does not exceed the \
+                results returned
+        """
+        if not isinstance(result, dict) or not isinstance(result.get("data"), list):
+            return False
+        total = result.get("total")
+        return isinstance(total, int) and total <= len(result["data"])
+
+    @log_call
+    def get(
+        self,
+        query: str | None = None,
+        models: list[str] | None = None,
+        archived: bool = False,
+        collection_id: int | None = None,
+        limit: int | None = None,
+        offset: int | None = None,
+    ) -> list[SearchItem]:
+        """Searches the server for objects matching the query
+
+        Filtering is done by the server, except for collection_id, which is applied \
+            to the results returned. limit and offset are applied before that \
+            filter, so scope the query as tightly as possible when paginating \
+            with a collection.
+
+        Args:
+            query (str, optional): Text searched for in names and descriptions
+            models (list[str], optional): Models searched (e.g. card, dashboard, \
+                collection, dataset), by default all
+            archived (bool, optional): Search archived objects instead of active \
+                ones, by default False
+            collection_id (int, optional): Only return objects in this collection
+            limit (int, optional): Maximum number of results
+            offset (int, optional): Number of results skipped
+
+        Returns:
+            list[SearchItem]: Results of the search
+        """
+        result = self._adapter.get(
+            endpoint=self._BASE_EP,
+            params=self.request_params(
+                query=query,
+                models=models,
+                archived=archived,
+                limit=limit,
+                offset=offset,
+            ),
+        )
+        return self.parse_results(result, collection_id=collection_id)
+
+    @log_call
+    def find(
+        self,
+        query: str,
+        models: list[str] | None = None,
+        collection_id: int | None = None,
+    ) -> list[SearchItem] | None:
+        """Searches the server for every active object matching the query
+
+        Results are only returned when the server reports that every match is \
+            included, so an object missing from them does not exist.
+
+        Args:
+            query (str): Text searched for in names and descriptions
+            models (list[str], optional): Models searched, by default all
+            collection_id (int, optional): Only return objects in this collection
+
+        Returns:
+            list[SearchItem] | None: Results of the search, or None if the server \
+                did not report every match
+        """
+        result = self._adapter.generic_request(
+            http_verb="GET",
+            endpoint=self._BASE_EP,
+            params=self.request_params(
+                query=query, models=models, archived=False, limit=None, offset=None
+            ),
+            envelope=True,
+        )
+        if not self.is_complete(result):
+            return None
+        return self.parse_results(result, collection_id=collection_id)
+
+    @log_call
+    def paginate(
+        self,
+        query: str | None = None,
+        models: list[str] | None = None,
+        archived: bool = False,
+        page_size: int = 50,
+        prefetch: bool = False,
+    ) -> Pager[SearchItem]:
+        """Iterates over the results of a search one page at a time
+
+        No request is sent until iteration starts or the total is read. Results \
+            cannot be filtered by collection here, as the total reported by the \
+            server would no longer match; filter the items yielded instead.
+
+        Args:
+            query (str, optional): Text searched for in names and descriptions
+            models (list[str], optional): Models searched (e.g. card, dashboard, \
+                collection, dataset), by default all
+            archived (bool, optional): Search archived objects instead of active \
+                ones, by default False
+            page_size (int, optional): Results requested per page, by default 50
+            prefetch (bool, optional): Request the next page while the current one \
+                is consumed, by default False
+
+        Returns:
+            Pager[SearchItem]: Iterable of the results, with the total number of \
+                results
+        """
+        return self._adapter.paginate(
+            endpoint=self._BASE_EP,
+            params=self.request_params(
+                query=query, models=models, archived=archived, limit=None, offset=None
+            ),
+            page_size=page_size,
+            prefetch=prefetch,
+        ).map(lambda record: SearchItem(**record))
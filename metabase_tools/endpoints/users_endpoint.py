@@ -10,6 +10,8 @@ from metabase_tools.endpoints.generic_endpoint import Endpoint
 from metabase_tools.models.generic_model import MissingParam
 from metabase_tools.models.user_model import UserItem
 from metabase_tools.utils.logging_utils import log_call
+from metabase_tools.utils.pagination import Pager
+from metabase_tools.utils.search_index import SearchIndex
 
 logger = getLogger(__name__)
 
@@ -27,16 +29,22 @@ class Users(Endpoint[UserItem]):
     ]
 
     @log_call
-    def get(self, targets: list[int] | None = None) -> list[UserItem]:
-        """Fetch list of users
+    def paginate(self, page_size: int = 50, prefetch: bool = False) -> Pager[UserItem]:
+        """Iterates over users one page at a time
+
+        No request is sent until iteration starts or the total is read.
 
         Args:
-            targets (list[int], optional): If provided, the list of users to fetch
+            page_size (int, optional): Users requested per page, by default 50
+            prefetch (bool, optional): Request the next page while the current one \
+                is consumed, by default False
 
         Returns:
-            list[UserItem]
+            Pager[UserItem]: Iterable of the users, with the total number of users
         """
-        return super().get(targets=targets)
+        return self._adapter.paginate(
+            endpoint=self._BASE_EP, page_size=page_size, prefetch=prefetch
+        ).map(self._hydrate)
 
     def _make_create(self, **kwargs: Any) -> UserItem:
         """Makes create request
@@ -87,15 +95,15 @@ class Users(Endpoint[UserItem]):
     def search(
         self,
         search_params: list[dict[str, Any]],
-        search_list: list[UserItem] | None = None,
+        search_list: list[UserItem] | SearchIndex[UserItem] | None = None,
     ) -> list[UserItem]:
         """Method to search a list of users meeting a list of parameters
 
         Args:
             search_params (list[dict]): Each dict contains search criteria and returns\
                  1 result
-            search_list (list[UserItem], optional): Provide to search an existing \
-                list, by default pulls from API
+            search_list (list[UserItem] | SearchIndex[UserItem], optional): Provide \
+                to search an existing list or index, by default pulls from API
 
         Returns:
             list[UserItem]: List of users of the relevant type
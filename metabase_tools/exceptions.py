@@ -1,6 +1,28 @@
 """Exceptions for the MetabaseApi class
 """
 
+from __future__ import annotations
+
+from typing import Any
+
 
 class MetabaseApiException(Exception):
     """Base exception for errors in the adapter"""
+
+
+class MetabaseApiBatchException(MetabaseApiException):
+    """Raised when some requests in a batch failed
+
+    Attributes:
+        results (list[Any]): Aggregated results of the successful requests, as \
+            parsed items when the request parsed records as they were received, \
+            else as raw records
+        errors (dict[Any, Exception]): Exception raised for each failed target
+    """
+
+    def __init__(self, results: list[Any], errors: dict[Any, Exception]) -> None:
+        self.results = results
+        self.errors = errors
+        super().__init__(
+            f"{len(errors)} request(s) failed: {', '.join(map(str, errors))}"
+        )
@@ -4,10 +4,12 @@ Rest adapter for the Metabase API
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from json import JSONDecodeError
 from logging import getLogger
 from pathlib import Path
-from typing import Any, Literal
+from time import monotonic, sleep
+from typing import Any, Literal, cast
 
 from packaging.version import Version
 from requests import Response, Session
@@ -19,10 +21,24 @@ from metabase_tools.endpoints.cards_endpoint import Cards
 from metabase_tools.endpoints.collections_endpoint import Collections
 from metabase_tools.endpoints.dashboard_endpoint import Dashboards
 from metabase_tools.endpoints.databases_endpoint import Databases
+from metabase_tools.endpoints.search_endpoint import Search
 from metabase_tools.endpoints.users_endpoint import Users
 from metabase_tools.exceptions import MetabaseApiException
 from metabase_tools.models.server_settings import ServerSettings, Setting
 from metabase_tools.tools.tools import MetabaseTools
+from metabase_tools.utils.cache import ResponseCache
+from metabase_tools.utils.coalesce import RequestCoalescer
+from metabase_tools.utils.codec import JsonCodec, default_codec
+from metabase_tools.utils.disk_cache import DiskCache
+from metabase_tools.utils.json_stream import iter_json_list
+from metabase_tools.utils.pagination import Page, Pager
+from metabase_tools.utils.retry import RetryBudget, RetryPolicy
+from metabase_tools.utils.throttle import AdaptiveConcurrencyLimiter, RateLimiter
+from metabase_tools.utils.transport import (
+    PooledHTTPAdapter,
+    TransportConfig,
+    has_custom_adapter,
+)
 
 logger = getLogger(__name__)
 
@@ -30,7 +46,16 @@ logger = getLogger(__name__)
 class MetabaseApi:
     """Metabase API adapter"""
 
-    server_version: Version
+    max_workers: int
+    transport: TransportConfig
+    retry_policy: RetryPolicy | None
+    rate_limiter: RateLimiter | None
+    concurrency_limiter: AdaptiveConcurrencyLimiter | None
+    response_cache: ResponseCache | None
+    disk_cache: DiskCache | None
+    request_coalescer: RequestCoalescer | None
+    json_codec: JsonCodec
+    trusted_hydration: bool
 
     activity: Activity
     alerts: Alerts
@@ -38,7 +63,7 @@ class MetabaseApi:
     collections: Collections
     dashboards: Dashboards
     databases: Databases
-    settings: ServerSettings
+    search: Search
     tools: MetabaseTools
     users: Users
 
@@ -49,28 +74,63 @@ class MetabaseApi:
         cache_token: bool = False,
         token_path: Path | str | None = None,
         session: Session | None = None,
+        max_workers: int = 1,
+        transport: TransportConfig | None = None,
+        response_cache: ResponseCache | None = None,
+        disk_cache: DiskCache | None = None,
+        coalesce_requests: bool = False,
+        json_codec: JsonCodec | None = None,
+        server_version: Version | str | None = None,
+        trust_token: bool = False,
+        trusted_hydration: bool = False,
     ):
         if not credentials and not token_path:
             raise MetabaseApiException("No authentication method provided")
+        if max_workers < 1:
+            raise MetabaseApiException("max_workers must be at least 1")
         credentials = credentials or {}
         token_path = Path(token_path) if token_path else None
 
         # Validate Metabase URL
         self.metabase_url = self._validate_base_url(url=metabase_url)
 
+        # Maximum number of concurrent requests used when fanning out over targets
+        self.max_workers = max_workers
+
         # Starts session to be reused by the adapter so that the auth token is cached
         self._session = session or Session()
 
+        # Connection pool, retries and throttles
+        self._set_transport(
+            transport or TransportConfig(), session_passed=bool(session)
+        )
+
+        # Opt-in cache of GET responses, invalidated by writes through the adapter
+        self.response_cache = response_cache
+
+        # Opt-in cache of GET responses persisted between processes
+        self.disk_cache = disk_cache
+
+        # Opt-in sharing of identical GET requests made by several threads at once
+        self.request_coalescer = RequestCoalescer() if coalesce_requests else None
+
+        # Encodes requests and decodes responses, orjson if installed
+        self.json_codec = json_codec or default_codec()
+
+        # Build objects from API responses without validating them
+        self.trusted_hydration = trusted_hydration
+
+        # Server version and settings are fetched on first use unless supplied
+        self._server_version = Version(str(server_version)) if server_version else None
+        self._settings: ServerSettings | None = None
+
         # Authenticate
+        self._trust_token = trust_token
         self._authenticate(token_path=token_path, credentials=credentials)
 
         # Cache token, if set during init
         if cache_token:
-            save_path = Path(token_path or "metabase.token")
-            self._save_token(save_path=save_path)
-
-        # Set server version for compatability checks
-        self._set_server_version()
+            self._save_token(save_path=Path(token_path or "metabase.token"))
 
         # Create endpoints
         self.activity = Activity(self)
@@ -79,11 +139,43 @@ class MetabaseApi:
         self.collections = Collections(self)
         self.dashboards = Dashboards(self)
         self.databases = Databases(self)
-        self.settings = self._fetch_settings()
+        self.search = Search(self)
         self.tools = MetabaseTools(self)
         self.users = Users(self)
 
-    def _validate_base_url(self, url: str) -> str:
+    def _set_transport(self, transport: TransportConfig, session_passed: bool) -> None:
+        """Applies the transport settings to the adapter
+
+        Args:
+            transport (TransportConfig): Transport settings
+            session_passed (bool): Whether the session was passed in by the caller
+        """
+        # Mount a tuned connection pool for the Metabase URL, unless the caller
+        # mounted their own adapter for it on the session they passed in
+        self.transport = transport
+        self._http_adapter = PooledHTTPAdapter(config=transport)
+        if session_passed and has_custom_adapter(self._session, self.metabase_url):
+            logger.debug("Keeping the adapter mounted on the session passed in")
+        else:
+            self._session.mount(self.metabase_url, self._http_adapter)
+
+        # Throttles shared by every endpoint of the adapter
+        self.rate_limiter = transport.rate_limiter
+        self.concurrency_limiter = transport.concurrency_limiter
+
+        # Retry transient failures, limited by a budget shared by all requests
+        self.retry_policy = transport.retry_policy
+        self._retry_budget = (
+            RetryBudget(
+                ratio=self.retry_policy.budget_ratio,
+                reserve=self.retry_policy.budget_reserve,
+            )
+            if self.retry_policy
+            else None
+        )
+
+    @staticmethod
+    def _validate_base_url(url: str) -> str:
         if url[-1] == "/":
             url = url[:-1]
         if url[-4:] == "/api":
@@ -131,7 +223,7 @@ class MetabaseApi:
             token = file.read()
         logger.info("Attempting authentication with token file")
         self._add_token_to_header(token=token)
-        authed = self.test_for_auth()
+        authed = self._trust_token or self.test_for_auth()
         logger.info(
             "Authenticated with token file"
             if authed
@@ -142,7 +234,7 @@ class MetabaseApi:
     def _auth_with_passed_token(self, credentials: dict[str, str]) -> bool:
         logger.info("Attempting authentication with token passed")
         self._add_token_to_header(token=credentials["token"])
-        authed = self.test_for_auth()
+        authed = self._trust_token or self.test_for_auth()
         logger.info(
             "Authenticated with token passed"
             if authed
@@ -159,16 +251,14 @@ class MetabaseApi:
         try:
             logger.info("Attempting authentication with username and password")
             response = self._session.post(
-                f"{self.metabase_url}/session", json=credentials
+                f"{self.metabase_url}/session",
+                json=credentials,
+                timeout=self.transport.timeout,
             )
+            # A session ID is only returned for valid credentials
             self._add_token_to_header(token=response.json()["id"])
-            authed = self.test_for_auth()
-            logger.info(
-                "Authenticated with login"
-                if authed
-                else "Failed to authenticate with login"
-            )
-            return authed
+            logger.info("Authenticated with login")
+            return True
         except KeyError as error_raised:
             logger.warning(
                 "Exception encountered during attempt to authenticate with login \
@@ -177,6 +267,40 @@ class MetabaseApi:
             )
         return False
 
+    @property
+    def server_version(self) -> Version:
+        """Metabase version running on the server, fetched on first use unless \
+            supplied when the adapter was created
+
+        Returns:
+            Version: Server version
+        """
+        if self._server_version is None:
+            self._set_server_version()
+        return cast(Version, self._server_version)
+
+    @property
+    def settings(self) -> ServerSettings:
+        """Settings of the Metabase server, fetched on first use
+
+        Returns:
+            ServerSettings: Server settings
+        """
+        if self._settings is None:
+            self._settings = self._fetch_settings()
+        return self._settings
+
+    @property
+    def connection_stats(self) -> dict[str, int]:
+        """Counters for the connection pool mounted for the Metabase URL, which \
+            stay at zero when the session passed in has its own adapter for the URL
+
+        Returns:
+            dict[str, int]: Requests sent, new connections opened and requests \
+                sent on reused connections
+        """
+        return self._http_adapter.stats.as_dict()
+
     def test_for_auth(self) -> bool:
         """Validates successful authentication by attempting to retrieve data about \
             the current user
@@ -184,11 +308,10 @@ class MetabaseApi:
         Returns:
             bool: Authentication success status
         """
-        return (
-            200
-            <= self._session.get(f"{self.metabase_url}/user/current").status_code
-            <= 299
+        response = self._session.get(
+            f"{self.metabase_url}/user/current", timeout=self.transport.timeout
         )
+        return 200 <= response.status_code <= 299
 
     def _save_token(self, save_path: Path | str) -> None:
         """Writes active token to the specified file
@@ -207,14 +330,24 @@ class MetabaseApi:
         url: str,
         params: dict[str, Any] | None = None,
         json: dict[str, Any] | None = None,
+        retry: bool | None = None,
+        headers: dict[str, str] | None = None,
+        stream: bool = False,
     ) -> Response:
         """Perform an HTTP request, catching and re-raising any exceptions
 
+        Transient failures are retried according to the retry policy of the adapter.
+
         Args:
             method (str): GET or POST or DELETE or PUT
             url (str): URL endpoint
             params (dict, optional): Endpoint parameters
             json (dict, optional): Data payload
+            retry (bool, optional): Override whether the request may be retried, by \
+                default the retry policy decides based on the HTTP verb
+            headers (dict, optional): Headers added to those of the session
+            stream (bool, optional): Defer downloading the response body, by \
+                default False
 
         Raises:
             RequestFailure: Request failed
@@ -222,14 +355,200 @@ class MetabaseApi:
         Returns:
             Response: Response from the API
         """
+        policy = self.retry_policy
+        if retry is None:
+            retry = policy is not None and policy.is_retryable_method(method)
+        if self._retry_budget:
+            self._retry_budget.deposit()
+
+        retry_number = 0
+        while True:
+            try:
+                response = self._send(
+                    method=method,
+                    url=url,
+                    params=params,
+                    json=json,
+                    headers=headers,
+                    stream=stream,
+                )
+            except RequestException as error_raised:
+                if (
+                    retry
+                    and policy
+                    and policy.is_retryable_error(error_raised)
+                    and self._can_retry(retry_number)
+                ):
+                    delay = policy.backoff(retry_number)
+                    logger.warning(
+                        "Retrying %s %s in %.2fs after error: %s",
+                        method,
+                        url,
+                        delay,
+                        error_raised,
+                    )
+                    sleep(delay)
+                    retry_number += 1
+                    continue
+                logger.error(str(error_raised))
+                raise MetabaseApiException from error_raised
+
+            if (
+                retry
+                and policy
+                and policy.is_retryable_response(response)
+                and self._can_retry(retry_number)
+            ):
+                retry_after = policy.retry_after(response)
+                delay = (
+                    retry_after
+                    if retry_after is not None
+                    else policy.backoff(retry_number)
+                )
+                logger.warning(
+                    "Retrying %s %s in %.2fs after status code %s",
+                    method,
+                    url,
+                    delay,
+                    response.status_code,
+                )
+                response.close()
+                sleep(delay)
+                retry_number += 1
+                continue
+            return response
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        params: dict[str, Any] | None = None,
+        json: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        stream: bool = False,
+    ) -> Response:
+        """Sends a single request, subject to the rate and concurrency limiters
+
+        Args:
+            method (str): GET or POST or DELETE or PUT
+            url (str): URL endpoint
+            params (dict, optional): Endpoint parameters
+            json (dict, optional): Data payload
+            headers (dict, optional): Headers added to those of the session
+            stream (bool, optional): Defer downloading the response body
+
+        Returns:
+            Response: Response from the API
+        """
+        if self.rate_limiter:
+            self.rate_limiter.acquire()
+        if self.concurrency_limiter:
+            self.concurrency_limiter.acquire()
+        start = monotonic()
+        overloaded = True
         try:
             logger.info("Making HTTP request: %s:%s:%s", method, url, params)
-            return self._session.request(
-                method=method, url=url, params=params, json=json, timeout=30
+            body = None
+            if json is not None:
+                body = self.json_codec.dumps(json)
+                headers = {**(headers or {}), "Content-Type": "application/json"}
+            response = self._session.request(
+                method=method,
+                url=url,
+                params=params,
+                data=body,
+                headers=headers,
+                stream=stream,
+                timeout=self.transport.timeout,
+            )
+            overloaded = response.status_code >= 500 or response.status_code == 429
+            return response
+        finally:
+            if self.concurrency_limiter:
+                self.concurrency_limiter.release(
+                    latency=monotonic() - start, overloaded=overloaded
+                )
+
+    def _can_retry(self, retry_number: int) -> bool:
+        """Checks the retry limits of the policy and the adapter-wide retry budget
+
+        Args:
+            retry_number (int): Number of retries already made for the request
+
+        Returns:
+            bool: True if another attempt may be made
+        """
+        if not self.retry_policy or retry_number >= self.retry_policy.max_retries:
+            return False
+        if self._retry_budget and not self._retry_budget.withdraw():
+            logger.warning("Retry budget exhausted, not retrying request")
+            return False
+        return True
+
+    def _get_with_disk_cache(
+        self,
+        disk_cache: DiskCache,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        retry: bool | None = None,
+    ) -> tuple[Response, bool]:
+        """GET request served from the disk cache when the cached response is fresh \
+            or the server confirms it is unchanged
+
+        Args:
+            disk_cache (DiskCache): Cache of responses
+            endpoint (str): URL endpoint
+            params (dict, optional): Endpoint parameters
+            retry (bool, optional): Override whether the request may be retried
+
+        Returns:
+            tuple[Response, bool]: Response from the API or the cache, and whether \
+                the server confirmed it is current
+        """
+        url = self.metabase_url + endpoint
+        key = disk_cache.key(url=url, params=params)
+        cached, fresh = disk_cache.lookup(key)
+        if cached and fresh:
+            logger.debug("Disk cache hit: %s:%s", endpoint, params)
+            return cached.to_response(url=url), False
+
+        response = self._make_request(
+            method="GET",
+            url=url,
+            params=params,
+            retry=retry,
+            headers=cached.validators if cached else None,
+        )
+        if cached and response.status_code == 304:
+            logger.debug("Disk cache revalidated: %s:%s", endpoint, params)
+            disk_cache.revalidated(key)
+            return cached.to_response(url=url), True
+        if response.status_code == 200:
+            disk_cache.store(key=key, endpoint=endpoint, response=response)
+        return response, response.status_code == 200
+
+    def _revalidate_items(self, endpoint: str, records: list[Any]) -> None:
+        """Revalidates the responses cached on disk for the items of a listing \
+            confirmed by the server, using their updated_at"""
+        if self.disk_cache:
+            self.disk_cache.revalidate_items(
+                url=self.metabase_url + endpoint,
+                versions=(
+                    (record.get("id"), record.get("updated_at"))
+                    for record in records
+                    if isinstance(record, dict)
+                ),
             )
-        except RequestException as error_raised:
-            logger.error(str(error_raised))
-            raise MetabaseApiException from error_raised
+
+    def _invalidate(self, endpoint: str) -> None:
+        """Drops cached and in flight responses for the resource an endpoint \
+            belongs to, after a write to it"""
+        if self.response_cache:
+            self.response_cache.invalidate(endpoint)
+        if self.disk_cache:
+            self.disk_cache.invalidate(endpoint)
+        if self.request_coalescer:
+            self.request_coalescer.forget(endpoint)
 
     def generic_request(
         self,
@@ -237,6 +556,8 @@ class MetabaseApi:
         endpoint: str,
         params: dict[str, Any] | None = None,
         json: dict[str, Any] | None = None,
+        retry: bool | None = None,
+        envelope: bool = False,
     ) -> list[dict[str, Any]] | dict[str, Any]:
         """Method for dispatching HTTP requests
 
@@ -245,6 +566,10 @@ class MetabaseApi:
             endpoint (str): URL endpoint
             params (dict, optional): Endpoint parameters
             json (dict, optional): Data payload
+            retry (bool, optional): Override whether the request may be retried, by \
+                default the retry policy decides based on the HTTP verb
+            envelope (bool, optional): Return paginated responses whole instead of \
+                only the records under data, by default False
 
         Raises:
             InvalidDataReceived: Unable to decode response from API
@@ -255,22 +580,41 @@ class MetabaseApi:
             list[dict[str, Any]] | dict[str, Any]: Response from API
         """
         log_line_post = "Request result: success=%s, status_code=%s, message=%s"
-        response = self._make_request(
-            method=http_verb,
-            url=self.metabase_url + endpoint,
-            params=params,
-            json=json,
-        )
+        current = False  # listing confirmed by the server, revalidating its items
+        try:
+            if http_verb == "GET" and self.disk_cache:
+                response, current = self._get_with_disk_cache(
+                    disk_cache=self.disk_cache,
+                    endpoint=endpoint,
+                    params=params,
+                    retry=retry,
+                )
+            else:
+                response = self._make_request(
+                    method=http_verb,
+                    url=self.metabase_url + endpoint,
+                    params=params,
+                    json=json,
+                    retry=retry,
+                )
+        finally:
+            # A write may have been applied even if the request failed
+            if http_verb != "GET":
+                self._invalidate(endpoint)
 
         # If status_code in 200-299 range, return Result, else raise exception
         if 299 >= response.status_code >= 200:
             logger.info(log_line_post, True, response.status_code, response.reason)
             try:
-                data = response.json()
-                if isinstance(data, dict) and all(
-                    key in data for key in ["data", "total"]
+                data = self.json_codec.loads(response.content)
+                if (
+                    not envelope
+                    and isinstance(data, dict)
+                    and all(key in data for key in ["data", "total"])
                 ):
                     data = data["data"]
+                if current and isinstance(data, list):
+                    self._revalidate_items(endpoint, data)
                 if isinstance(data, (list, dict)):
                     return data
             except JSONDecodeError:
@@ -293,6 +637,10 @@ class MetabaseApi:
     ) -> list[dict[str, Any]] | dict[str, Any]:
         """HTTP GET request
 
+        Responses are served from the response cache of the adapter, if one is set. \
+            Identical requests made by several threads at once share one request \
+            if coalesce_requests was enabled.
+
         Args:
             endpoint (str): URL endpoint
             ep_params (dict, optional): Endpoint parameters
@@ -300,7 +648,166 @@ class MetabaseApi:
         Returns:
             list[dict[str, Any]] | dict[str, Any]: Response from API
         """
-        return self.generic_request(http_verb="GET", endpoint=endpoint, params=params)
+        if self.response_cache:
+            found, cached = self.response_cache.lookup(endpoint=endpoint, params=params)
+            if found:
+                logger.debug("Cache hit: %s:%s", endpoint, params)
+                return cast(list[dict[str, Any]] | dict[str, Any], cached)
+        if self.request_coalescer:
+            return self.request_coalescer.do(
+                endpoint=endpoint,
+                params=params,
+                func=lambda: self._get_uncached(endpoint=endpoint, params=params),
+            )
+        return self._get_uncached(endpoint=endpoint, params=params)
+
+    def _get_uncached(
+        self, endpoint: str, params: dict[str, Any] | None = None
+    ) -> list[dict[str, Any]] | dict[str, Any]:
+        """HTTP GET request sent to the server, storing the response in the response \
+            cache of the adapter, if one is set
+
+        Args:
+            endpoint (str): URL endpoint
+            params (dict, optional): Endpoint parameters
+
+        Returns:
+            list[dict[str, Any]] | dict[str, Any]: Response from API
+        """
+        # A write during the request makes its response stale, so it is not stored
+        generation = (
+            self.response_cache.generation(endpoint) if self.response_cache else 0
+        )
+        result = self.generic_request(http_verb="GET", endpoint=endpoint, params=params)
+        if self.response_cache:
+            self.response_cache.store(
+                endpoint=endpoint, params=params, value=result, generation=generation
+            )
+        return result
+
+    def get_page(
+        self,
+        endpoint: str,
+        limit: int,
+        offset: int = 0,
+        params: dict[str, Any] | None = None,
+    ) -> Page:
+        """HTTP GET request for one page of a paginated listing
+
+        The envelope of the response is kept, so the total reported by the server \
+            is available. Responses are not read from or stored in the response \
+            cache of the adapter.
+
+        Args:
+            endpoint (str): URL endpoint
+            limit (int): Maximum number of records returned
+            offset (int, optional): Number of records skipped, by default 0
+            params (dict, optional): Endpoint parameters
+
+        Raises:
+            MetabaseApiException: Request failed or the response is not a listing
+
+        Returns:
+            Page: Records of the page with the total, limit and offset reported
+        """
+        page_params = {**(params or {}), "limit": limit, "offset": offset}
+        result = self.generic_request(
+            http_verb="GET", endpoint=endpoint, params=page_params, envelope=True
+        )
+        try:
+            return Page.from_response(result)
+        except TypeError as error_raised:
+            raise MetabaseApiException(str(error_raised)) from error_raised
+
+    def paginate(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        page_size: int = 50,
+        prefetch: bool = False,
+    ) -> Pager[dict[str, Any]]:
+        """Iterates over the records of a paginated listing one page at a time
+
+        No request is sent until iteration starts or the total is read. Listings \
+            the server does not paginate are returned as a single page.
+
+        Args:
+            endpoint (str): URL endpoint
+            params (dict, optional): Endpoint parameters
+            page_size (int, optional): Records requested per page, by default 50
+            prefetch (bool, optional): Request the next page while the current one \
+                is consumed, by default False
+
+        Returns:
+            Pager[dict[str, Any]]: Iterable of the records, with the total of the \
+                listing
+        """
+        return Pager(
+            fetch=lambda limit, offset: self.get_page(
+                endpoint=endpoint, limit=limit, offset=offset, params=params
+            ),
+            transform=lambda record: cast(dict[str, Any], record),
+            page_size=page_size,
+            prefetch=prefetch,
+        )
+
+    def iter_get(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        chunk_size: int = 64 * 1024,
+    ) -> Iterator[Any]:
+        """HTTP GET request yielding the records of a list as the response body is \
+            received, so only the record being parsed is held in memory
+
+        The request is sent when iteration starts. Responses are not read from or \
+            stored in the caches of the adapter, but once a listing is read to the \
+            end, the ID and updated_at of its records revalidate the responses \
+            cached on disk for each item.
+
+        Args:
+            endpoint (str): URL endpoint
+            params (dict, optional): Endpoint parameters
+            chunk_size (int, optional): Bytes read from the connection at a time, by \
+                default 64 KiB
+
+        Raises:
+            MetabaseApiException: Request failed or the response is not a list
+
+        Yields:
+            Any: Records of the list returned
+        """
+        log_line_post = "Request result: success=%s, status_code=%s, message=%s"
+        response = self._make_request(
+            method="GET", url=self.metabase_url + endpoint, params=params, stream=True
+        )
+        with response:
+            if not 299 >= response.status_code >= 200:
+                logger.error(log_line_post, False, response.status_code, response.text)
+                status = f"{response.status_code} - {response.reason}"
+                if response.status_code == 401:
+                    raise MetabaseApiException(f"Failed to authenticate: {status}")
+                raise MetabaseApiException(f"{status} - {response.text}")
+            logger.info(log_line_post, True, response.status_code, response.reason)
+            versions = []
+            try:
+                for record in iter_json_list(
+                    response.iter_content(chunk_size=chunk_size)
+                ):
+                    if self.disk_cache and isinstance(record, dict):
+                        versions.append(
+                            {
+                                "id": record.get("id"),
+                                "updated_at": record.get("updated_at"),
+                            }
+                        )
+                    yield record
+            except JSONDecodeError as error_raised:
+                logger.error("Unable to decode response: %s", error_raised)
+                raise MetabaseApiException(
+                    f"Unable to decode response: {error_raised}"
+                ) from error_raised
+        self._revalidate_items(endpoint, versions)
 
     def post(
         self,
@@ -366,8 +873,8 @@ class MetabaseApi:
         """
         properties = self.get("/session/properties")
         if isinstance(properties, dict):
-            self.server_version = Version(properties["version"]["tag"])
-            logger.info("Server version: %s", self.server_version)
+            self._server_version = Version(properties["version"]["tag"])
+            logger.info("Server version: %s", self._server_version)
         else:
             logger.error("Unable to fetch server version")
             raise MetabaseApiException("Unable to fetch server version")
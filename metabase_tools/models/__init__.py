@@ -3,6 +3,7 @@
 from .card_model import CardItem, CardQueryResult, CardRelatedObjects
 from .collection_model import CollectionItem
 from .database_model import DatabaseItem
+from .search_model import SearchItem
 from .server_settings import ServerSettings, Setting
 from .user_model import UserItem
 
@@ -12,6 +13,7 @@ __all__ = (
     "CardRelatedObjects",
     "CollectionItem",
     "DatabaseItem",
+    "SearchItem",
     "UserItem",
     "ServerSettings",
     "Setting",
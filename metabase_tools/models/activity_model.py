@@ -5,7 +5,7 @@ from __future__ import annotations
 
 from datetime import datetime
 from logging import getLogger
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
 
 from metabase_tools.models.database_model import DatabaseItem
 from metabase_tools.models.generic_model import Item
@@ -21,6 +21,8 @@ logger = getLogger(__name__)
 class ActivityItem(Item):
     """Activity object class with related methods"""
 
+    _LAZY_FIELDS: ClassVar[tuple[str, ...]] = ("database", "user")
+
     id: int
     table_id: int | None
     table: str | None
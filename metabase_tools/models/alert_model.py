@@ -26,9 +26,9 @@ class AlertItem(Item):
     """Alert object class with related methods"""
 
     _BASE_EP: ClassVar[str] = "/alert/{id}"
+    _LAZY_FIELDS: ClassVar[tuple[str, ...]] = ("creator",)
 
     _adapter: MetabaseApi | None = PrivateAttr(None)
-    _server_version: Version | None = PrivateAttr(None)
 
     archived: bool
     collection_position: int | None
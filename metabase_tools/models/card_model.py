@@ -27,9 +27,9 @@ class CardItem(Item):
     """Card object class with related methods"""
 
     _BASE_EP: ClassVar[str] = "/card/{id}"
+    _LAZY_FIELDS: ClassVar[tuple[str, ...]] = ("creator", "collection")
 
     _adapter: MetabaseApi | None = PrivateAttr(None)
-    _server_version: Version | None = PrivateAttr(None)
 
     description: str | None
     archived: bool
@@ -200,7 +200,7 @@ class CardItem(Item):
         Returns:
             dict: Result of favoriting operation
         """
-        if self._server_version and self._server_version >= Version("v0.40"):
+        if self._adapter and self._adapter.server_version >= Version("v0.40"):
             raise NotImplementedError("This function was deprecated in Metabase v0.40")
         if self._adapter:
             result = self._adapter.post(endpoint=f"/card/{self.id}/favorite")
@@ -216,7 +216,7 @@ class CardItem(Item):
         Returns:
             dict: Result of unfavoriting operation
         """
-        if self._server_version and self._server_version >= Version("v0.40"):
+        if self._adapter and self._adapter.server_version >= Version("v0.40"):
             raise NotImplementedError("This function was deprecated in Metabase v0.40")
         if self._adapter:
             result = self._adapter.delete(endpoint=f"/card/{self.id}/favorite")
@@ -12,9 +12,11 @@ from pydantic import PrivateAttr
 from metabase_tools.exceptions import MetabaseApiException
 from metabase_tools.models.generic_model import Item, MissingParam
 from metabase_tools.utils.logging_utils import log_call
+from metabase_tools.utils.pagination import Pager
 
 if TYPE_CHECKING:
     from metabase_tools.metabase import MetabaseApi
+    from metabase_tools.models.search_model import SearchItem
 
 logger = getLogger(__name__)
 
@@ -146,16 +148,10 @@ class CollectionItem(Item):
         Returns:
             list: Contents of collection
         """
-        params: dict[Any, Any] = {}
-        if archived:
-            params["archived"] = archived
-        if model_type:
-            params["model"] = model_type
-
         if self._adapter:
             result = self._adapter.get(
                 endpoint=f"/collection/{self.id}/items",
-                params=params,
+                params=self._contents_params(model_type=model_type, archived=archived),
             )
             if isinstance(result, list) and all(
                 isinstance(record, dict) for record in result
@@ -164,10 +160,86 @@ class CollectionItem(Item):
             raise TypeError(f"Expected list[dict], received {type(result)}")
         raise AttributeError("Adapter not set on object")
 
+    @staticmethod
+    def _contents_params(model_type: str | None, archived: bool) -> dict[str, Any]:
+        """Query parameters of a request for the contents of a collection
+
+        Args:
+            model_type (str, optional): Filter to provided model
+            archived (bool): Archived objects
+
+        Returns:
+            dict[str, Any]: Parameters of the request
+        """
+        params: dict[str, Any] = {}
+        if archived:
+            params["archived"] = archived
+        if model_type:
+            params["model"] = model_type
+        return params
+
+    @log_call
+    def paginate_contents(
+        self,
+        model_type: str | None = None,
+        archived: bool = False,
+        page_size: int = 50,
+        prefetch: bool = False,
+    ) -> Pager[dict[str, Any]]:
+        """Iterates over the contents of the collection one page at a time
+
+        No request is sent until iteration starts or the total is read.
+
+        Args:
+            model_type (str, optional): Filter to provided model. Defaults to all.
+            archived (bool, optional): Archived objects. Defaults to False.
+            page_size (int, optional): Objects requested per page, by default 50
+            prefetch (bool, optional): Request the next page while the current one \
+                is consumed, by default False
+
+        Raises:
+            AttributeError: Adapter not set on object
+
+        Returns:
+            Pager[dict[str, Any]]: Iterable of the contents, with the total number \
+                of objects in the collection
+        """
+        if self._adapter:
+            return self._adapter.paginate(
+                endpoint=f"/collection/{self.id}/items",
+                params=self._contents_params(model_type=model_type, archived=archived),
+                page_size=page_size,
+                prefetch=prefetch,
+            )
+        raise AttributeError("Adapter not set on object")
+
+    @staticmethod
+    def find_in_results(results: list[SearchItem], item_name: str) -> int:
+        """Finds a card in search results that list every match
+
+        Args:
+            results (list[SearchItem]): Results of a search
+            item_name (str): Name of the item being located
+
+        Raises:
+            MetabaseApiException: Item not found
+
+        Returns:
+            int: id of the item being located
+        """
+        for result in results:
+            if result.name == item_name and isinstance(result.id, int):
+                return result.id
+        raise MetabaseApiException(f"{item_name} not found")
+
     @log_call
     def check_for_object(self, item_name: str) -> int:
         """Checks for object in the collection and returns the id, if found
 
+        The card is looked up with the search endpoint of the server. The contents \
+            of the collection are only checked if the search fails or the server \
+            does not report that every match was returned.
+
         Args:
             item_name (str): Name of the item being located
 
@@ -177,6 +249,17 @@ class CollectionItem(Item):
         Returns:
             int: id of the item being located
         """
+        if self._adapter and isinstance(self.id, int):
+            try:
+                results = self._adapter.search.find(
+                    query=item_name, models=["card"], collection_id=self.id
+                )
+            except (MetabaseApiException, TypeError, ValueError) as error:
+                logger.debug("Search for %s failed: %s", item_name, error)
+                results = None
+            if results is not None:
+                return self.find_in_results(results, item_name)
+
         collection_items = self.get_contents(model_type="card", archived=False)
         for item in collection_items:
             if item["name"] == item_name and isinstance(item["id"], int):
@@ -5,18 +5,27 @@
 from __future__ import annotations
 
 from abc import ABC
+from collections.abc import Callable
+from datetime import datetime
+from functools import lru_cache
 from logging import getLogger
-from typing import TYPE_CHECKING, Any, ClassVar, TypeVar
+from typing import TYPE_CHECKING, Any, ClassVar, NamedTuple, TypeVar
+from uuid import UUID
 
 from packaging.version import Version
-from pydantic import BaseModel, PrivateAttr
+from pydantic import BaseModel, Field, PrivateAttr, create_model
+from pydantic.datetime_parse import parse_datetime
+from pydantic.fields import SHAPE_LIST, SHAPE_SINGLETON, ModelField
 
 from metabase_tools.utils.logging_utils import log_call
+from metabase_tools.utils.model_values import dict_value, json_value
 
 if TYPE_CHECKING:
     from metabase_tools.metabase import MetabaseApi
 
 T = TypeVar("T", bound="Item")
+M = TypeVar("M", bound=BaseModel)
+P = TypeVar("P", bound="ItemProjection")
 logger = getLogger(__name__)
 
 
@@ -28,13 +37,107 @@ class Item(BaseModel, ABC, extra="forbid"):
     """Base class for all Metabase objects. Provides generic fields and methods."""
 
     _BASE_EP: ClassVar[str]
+    _LAZY_FIELDS: ClassVar[tuple[str, ...]] = ()
 
     _adapter: MetabaseApi | None = PrivateAttr(None)
-    _server_version: Version | None = PrivateAttr(None)
+    _dirty: frozenset[str] = PrivateAttr(frozenset())
 
     id: int | str
     name: str | None
 
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        for name in cls.__dict__.get("_LAZY_FIELDS", ()):
+            setattr(cls, name, _LazyField(name))
+
+    def __init__(self, **data: Any) -> None:
+        # Nested objects in lazy fields are validated on first access, so a
+        # placeholder object is validated in their place
+        lazy = {}
+        for name, alias, model in _lazy_fields(self.__class__):
+            value = data.get(alias)
+            if isinstance(value, dict):
+                lazy[name] = _Lazy(model=model, record=value, trusted=False)
+                data[alias] = _placeholder(model)
+        super().__init__(**data)
+        self.__dict__.update(lazy)
+
+    def _materialize(self) -> None:
+        """Builds the nested objects of all lazy fields that were not yet accessed"""
+        for name in self._LAZY_FIELDS:
+            getattr(self, name)
+
+    def _iter(self, *args: Any, **kwargs: Any) -> Any:
+        # Used by dict, json, copy and comparisons
+        include, exclude = kwargs.get("include"), kwargs.get("exclude")
+        for name in self._LAZY_FIELDS:
+            if include is not None and name not in include:
+                continue
+            if isinstance(exclude, dict) and exclude.get(name) in (..., True):
+                continue
+            if isinstance(exclude, (set, frozenset)) and name in exclude:
+                continue
+            getattr(self, name)
+        return super()._iter(*args, **kwargs)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        for field, _, model in _lazy_fields(self.__class__):
+            # Assignments are not validated, so nested objects are built here
+            if name == field and isinstance(value, dict):
+                value = model(**value)
+        super().__setattr__(name, value)
+        if name in self.__fields__:
+            # Replaced rather than updated as copies share private attributes
+            self._dirty = self._dirty | {name}
+
+    def copy(self: T, **kwargs: Any) -> T:
+        """Duplicates the object
+
+        Changes made to the original are not tracked on the copy, only the fields \
+            set through ``update`` are. Nested objects set through ``update`` are \
+            validated like assigned ones.
+
+        Returns:
+            T: Copy of the object
+        """
+        obj = super().copy(**kwargs)
+        update = kwargs.get("update") or {}
+        for field, _, model in _lazy_fields(self.__class__):
+            if isinstance(update.get(field), dict):
+                obj.__dict__[field] = model(**update[field])
+        dirty = frozenset(name for name in update if name in self.__fields__)
+        obj._dirty = dirty  # pylint: disable=protected-access
+        return obj
+
+    @property
+    def dirty_fields(self) -> frozenset[str]:
+        """Names of the fields changed since the object was received from the API
+
+        Returns:
+            frozenset[str]
+        """
+        return self._dirty
+
+    def __repr_args__(self) -> Any:
+        self._materialize()
+        return super().__repr_args__()
+
+    @classmethod
+    def from_api(cls: type[T], record: dict[str, Any]) -> T:
+        """Builds an object from a response of the API without validating it
+
+        Only datetimes, UUIDs and nested objects are converted and other values are \
+            used as received, so only use this for data that came straight from the \
+            server. Falls back to validation if a required field is missing.
+
+        Args:
+            record (dict[str, Any]): Definition of the object returned by the API
+
+        Returns:
+            T: Object of the relevant type
+        """
+        return _from_api(cls, record)
+
     @log_call
     def set_adapter(self, adapter: MetabaseApi) -> None:
         """Sets the adapter on an object
@@ -43,7 +146,6 @@ class Item(BaseModel, ABC, extra="forbid"):
             adapter (MetabaseApi): Connection to MetabaseApi
         """
         self._adapter = adapter
-        self._server_version = adapter.server_version
 
     @log_call
     def refresh(self: T) -> T:
@@ -55,22 +157,42 @@ class Item(BaseModel, ABC, extra="forbid"):
         if self._adapter and self._adapter.server_version >= Version("v0.40"):
             result = self._adapter.get(endpoint=self._BASE_EP.format(id=self.id))
             if isinstance(result, dict):
-                obj = self.__class__(**result)
-                obj.set_adapter(adapter=self._adapter)
-                return obj
+                return self._from_response(result)
         elif self._adapter:
             # In version 0.39 less information is returned when using specific ids
             result = self._adapter.get(endpoint=self._BASE_EP.replace("{id}", ""))
             for item in result:
                 if isinstance(item, dict) and self.id == item["id"]:
-                    obj = self.__class__(**item)
-                    obj.set_adapter(adapter=self._adapter)
-                    return obj
+                    return self._from_response(item)
         return self
 
+    def _from_response(self: T, result: Any) -> T:
+        """Builds a new object from the response to a change and sets its adapter
+
+        Args:
+            result (Any): Response of the API
+
+        Raises:
+            TypeError: Response is not a dict
+
+        Returns:
+            T: Object of the relevant type
+        """
+        if not isinstance(result, dict):
+            raise TypeError(f"Expected dict, received {type(result)}")
+        if self._adapter and self._adapter.trusted_hydration:
+            obj = self.from_api(result)
+        else:
+            obj = self.__class__(**result)
+        if self._adapter:
+            obj.set_adapter(adapter=self._adapter)
+        return obj
+
     def _make_update(self: T, **kwargs: Any) -> T:
         """Generic method for updating an object
 
+        Only fields whose value differs from the current value are sent.
+
         Args:
             payloads (dict): Details of update
 
@@ -81,17 +203,13 @@ class Item(BaseModel, ABC, extra="forbid"):
             T: Object of the relevant type
         """
         if self._adapter:
-            # Eliminate parameters that were not provided
-            changes = {
-                k: v for k, v in kwargs.items() if not isinstance(v, MissingParam)
-            }
-
-            # Determine if there are any differences to update
-            current_definition = self.dict()
+            # Keep provided fields that differ, without serialising the whole object
             changes = {
                 k: v
-                for k, v in changes.items()
-                if k in current_definition and v != current_definition[k]
+                for k, v in kwargs.items()
+                if not isinstance(v, MissingParam)
+                and k in self.__fields__
+                and v != dict_value(getattr(self, k))
             }
 
             if len(changes) == 0:
@@ -100,11 +218,33 @@ class Item(BaseModel, ABC, extra="forbid"):
             result = self._adapter.put(
                 endpoint=self._BASE_EP.format(id=self.id), json=changes
             )
-            if isinstance(result, dict):
-                obj = self.__class__(**result)
-                obj.set_adapter(adapter=self._adapter)
-                return obj
-            raise TypeError(f"Expected dict, received {type(result)}")
+            return self._from_response(result)
+        raise AttributeError("Adapter not set on object")
+
+    @log_call
+    def save(self: T) -> T:
+        """Sends the fields changed on the object since it was received
+
+        Fields are changed by assigning to them, e.g. ``card.name = "New name"``. \
+            Only the changed fields are sent and nothing is sent if no fields were \
+            changed.
+
+        Raises:
+            AttributeError: Adapter not set on object
+
+        Returns:
+            T: Object returned by the API after the update, or self if no fields \
+                were changed
+        """
+        if not self._dirty:
+            return self
+        if self._adapter:
+            payload = json_value(self.dict(include=set(self._dirty), by_alias=True))
+            result = self._adapter.put(
+                endpoint=self._BASE_EP.format(id=self.id), json=payload
+            )
+            self._dirty = frozenset()
+            return self._from_response(result)
         raise AttributeError("Adapter not set on object")
 
     @log_call
@@ -160,3 +300,272 @@ class Item(BaseModel, ABC, extra="forbid"):
         """
         if self._adapter:
             _ = self._adapter.delete(endpoint=self._BASE_EP.format(id=self.id))
+
+
+class ItemProjection(BaseModel, extra="ignore", frozen=True):
+    """Read-only object holding a subset of the fields of a Metabase object
+
+    Fields that were not requested are discarded when the object is built.
+    """
+
+    id: int | str
+
+    @classmethod
+    def from_api(cls: type[P], record: dict[str, Any]) -> P:
+        """Builds an object from a response of the API without validating it
+
+        Args:
+            record (dict[str, Any]): Definition of the object returned by the API
+
+        Returns:
+            P: Object of the relevant type
+        """
+        return _from_api(cls, record)
+
+
+@lru_cache(maxsize=None)
+def make_projection(model: type[Item], fields: tuple[str, ...]) -> type[ItemProjection]:
+    """Read-only model holding only the requested fields of a model
+
+    The id is always included. Models are created once for each set of fields.
+
+    Args:
+        model (type[Item]): Model being projected
+        fields (tuple[str, ...]): Names or aliases of the fields to keep
+
+    Raises:
+        ValueError: A field is not a field of the model
+
+    Returns:
+        type[ItemProjection]: Model with only the requested fields
+    """
+    names = {field.alias: name for name, field in model.__fields__.items()}
+    names.update((name, name) for name in model.__fields__)
+    unknown = [field for field in fields if field not in names]
+    if unknown:
+        raise ValueError(f"{model.__name__} has no fields {', '.join(unknown)}")
+
+    definitions: dict[str, Any] = {}
+    for name in dict.fromkeys(["id", *(names[field] for field in fields)]):
+        field = model.__fields__[name]
+        if field.required:
+            info = Field(..., alias=field.alias)
+        elif field.default_factory is not None:
+            info = Field(default_factory=field.default_factory, alias=field.alias)
+        else:
+            info = Field(field.default, alias=field.alias)
+        definitions[name] = (field.annotation, info)
+    return create_model(
+        f"{model.__name__}Projection", __base__=ItemProjection, **definitions
+    )
+
+
+Converter = Callable[[Any], Any]
+
+
+def _from_api(model: type[M], record: dict[str, Any]) -> M:
+    """Builds a model from a response of the API without validating it
+
+    Args:
+        model (type[M]): Model being built
+        record (dict[str, Any]): Definition of the object returned by the API
+
+    Returns:
+        M: Object of the model
+    """
+    plan = _hydration_plan(model)
+    values = plan.template.copy()
+    fields_set = set()
+    for alias, name, convert in plan.fields:
+        if alias in record:
+            value = record[alias]
+        elif name in record:
+            value = record[name]
+        else:
+            continue
+        values[name] = convert(value) if convert and value is not None else value
+        fields_set.add(name)
+    if not plan.required <= fields_set:
+        return model(**record)
+    for name, field in plan.factories:
+        if name not in fields_set:
+            values[name] = field.get_default()
+
+    # Equivalent to BaseModel.construct, with the field defaults precomputed
+    obj = model.__new__(model)
+    object.__setattr__(obj, "__dict__", values)
+    object.__setattr__(obj, "__fields_set__", fields_set)
+    obj._init_private_attributes()  # pylint: disable=protected-access
+    return obj
+
+
+class _Lazy(NamedTuple):
+    """Definition of a nested object kept until the object is first accessed"""
+
+    model: type[Item]
+    record: dict[str, Any]
+    trusted: bool
+
+    def materialize(self) -> Item:
+        """Builds the nested object
+
+        Returns:
+            Item: Nested object
+        """
+        if self.trusted:
+            return self.model.from_api(self.record)
+        return self.model(**self.record)
+
+
+class _LazyField:
+    """Data descriptor building the nested object of a lazy field on first access"""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def __get__(self, obj: Item | None, objtype: type | None = None) -> Any:
+        if obj is None:
+            return self
+        try:
+            value = obj.__dict__[self.name]
+        except KeyError as error:
+            raise AttributeError(self.name) from error
+        if isinstance(value, _Lazy):
+            value = value.materialize()
+            obj.__dict__[self.name] = value
+        return value
+
+    def __set__(self, obj: Item, value: Any) -> None:
+        obj.__dict__[self.name] = value
+
+
+@lru_cache(maxsize=None)
+def _lazy_fields(model: type[Item]) -> tuple[tuple[str, str, type[Item]], ...]:
+    """Name, alias and nested model of each lazy field of a model
+
+    Args:
+        model (type[Item]): Model with lazy fields
+
+    Returns:
+        tuple: Name, alias and nested model of each lazy field
+    """
+    return tuple(
+        (name, model.__fields__[name].alias, model.__fields__[name].type_)
+        for name in model._LAZY_FIELDS  # pylint: disable=protected-access
+    )
+
+
+@lru_cache(maxsize=None)
+def _placeholder(model: type[Item]) -> Item:
+    """Object accepted by validation in place of a nested object that is not \
+        built yet
+
+    Args:
+        model (type[Item]): Nested model
+
+    Returns:
+        Item: Empty object of the nested model
+    """
+    return model.construct()
+
+
+def _datetime(value: Any) -> datetime:
+    if isinstance(value, str):
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            pass
+    return parse_datetime(value)
+
+
+def _uuid(value: Any) -> UUID:
+    return value if isinstance(value, UUID) else UUID(str(value))
+
+
+def _field_converter(field: ModelField, lazy: bool = False) -> Converter | None:
+    """Conversion applied to a field when building an object without validation
+
+    Args:
+        field (ModelField): Field of the model
+        lazy (bool, optional): Keep nested objects as they were received until \
+            they are first accessed, by default False
+
+    Returns:
+        Converter | None: Function converting a value, or None if the value is used \
+            as received
+    """
+    type_ = field.type_
+    convert: Converter
+    if isinstance(type_, type) and issubclass(type_, Item):
+        nested = type_
+
+        def convert(value: Any) -> Any:
+            if not isinstance(value, dict):
+                return value
+            if lazy:
+                return _Lazy(model=nested, record=value, trusted=True)
+            return nested.from_api(value)
+
+    elif type_ is datetime:
+        convert = _datetime
+    elif type_ is UUID:
+        convert = _uuid
+    else:
+        return None
+    if field.shape == SHAPE_SINGLETON:
+        return convert
+    if field.shape == SHAPE_LIST:
+        return lambda values: [convert(value) for value in values]
+    return None
+
+
+class _HydrationPlan(NamedTuple):
+    """How to build a model from a response of the API without validation
+
+    Attributes:
+        fields: Alias, name and converter of each field
+        template: Values of every field before the response is applied, in the \
+            order of the fields, with the immutable defaults filled in
+        factories: Fields whose default has to be copied for every object
+        required: Names of the required fields
+    """
+
+    fields: tuple[tuple[str, str, Converter | None], ...]
+    template: dict[str, Any]
+    factories: tuple[tuple[str, ModelField], ...]
+    required: frozenset[str]
+
+
+@lru_cache(maxsize=None)
+def _hydration_plan(model: type[BaseModel]) -> _HydrationPlan:
+    """Fields of a model and how to convert them, computed once per class
+
+    Args:
+        model (type[BaseModel]): Model being built
+
+    Returns:
+        _HydrationPlan: Plan for building the model
+    """
+    model_fields = model.__fields__.items()
+    lazy_fields = getattr(model, "_LAZY_FIELDS", ())
+    immutable = (type(None), bool, int, float, str)
+    return _HydrationPlan(
+        fields=tuple(
+            (
+                field.alias,
+                name,
+                _field_converter(field, lazy=name in lazy_fields),
+            )
+            for name, field in model_fields
+        ),
+        template={
+            name: field.default if isinstance(field.default, immutable) else None
+            for name, field in model_fields
+        },
+        factories=tuple(
+            (name, field)
+            for name, field in model_fields
+            if not field.required and not isinstance(field.default, immutable)
+        ),
+        required=frozenset(name for name, field in model_fields if field.required),
+    )
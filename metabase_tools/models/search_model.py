@@ -0,0 +1,46 @@
+"""Classes related to the search endpoint
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from logging import getLogger
+
+from pydantic import BaseModel
+
+logger = getLogger(__name__)
+
+
+class SearchCollection(BaseModel, extra="ignore"):
+    """Collection holding a search result; the id is None for the root collection"""
+
+    id: int | str | None
+    name: str | None
+    authority_level: str | None
+
+
+class SearchItem(BaseModel, extra="ignore"):
+    """Object found by a search
+
+    Only the fields shared by every type of object are kept. Use the id with the \
+        endpoint of the relevant model to get the full object.
+    """
+
+    id: int | str
+    model: str
+    name: str | None
+    description: str | None
+    archived: bool | None
+    collection: SearchCollection | None
+    database_id: int | None
+    table_id: int | None
+    updated_at: datetime | None
+
+    @property
+    def collection_id(self) -> int | str | None:
+        """ID of the collection holding the object, None for the root collection
+
+        Returns:
+            int | str | None
+        """
+        return self.collection.id if self.collection else None
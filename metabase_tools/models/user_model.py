@@ -121,7 +121,7 @@ class UserItem(Item):
         Returns:
             UserItem: User with query builder toggle set
         """
-        if self._server_version and self._server_version >= Version("v0.42"):
+        if self._adapter and self._adapter.server_version >= Version("v0.42"):
             raise NotImplementedError("This function was deprecated in Metabase v0.42")
         if self._adapter:
             result = self._adapter.put(endpoint=f"/user/{self.id}/qbnewb")
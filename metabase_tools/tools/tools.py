@@ -4,13 +4,20 @@ MetabaseTools extends MetabaseApi with additional complex functions
 
 from __future__ import annotations  # Included for support of |
 
-from json import dumps, loads
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import nullcontext
+from copy import deepcopy
+from functools import partial
+from hashlib import sha256
+from json import JSONDecodeError, dumps, loads
 from logging import getLogger
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, TextIO
 
-from metabase_tools.exceptions import MetabaseApiException
+from metabase_tools.exceptions import MetabaseApiBatchException, MetabaseApiException
 from metabase_tools.models.card_model import CardItem
+from metabase_tools.utils.concurrency import Task, run_graph
+from metabase_tools.utils.file_writer import FileWriterPool, write_atomic
 from metabase_tools.utils.logging_utils import log_call
 
 if TYPE_CHECKING:
@@ -18,6 +25,71 @@ if TYPE_CHECKING:
 
 logger = getLogger(__name__)
 
+# Color given to collections created for queries in folders not found in Metabase
+NEW_COLLECTION_COLOR = "#509EE3"
+
+# Fields of the cards listed to find the cards of an upload on the server
+_INDEX_FIELDS = ["name", "collection_id", "dataset_query", "archived", "dataset"]
+
+
+def plan_collections(path: str, collection_ids: dict[str, Any]) -> list[dict[str, Any]]:
+    """Collections to create, parents first, for a collection path to exist
+
+    Args:
+        path (str): Path of the collection, e.g. /Development/Accounting
+        collection_ids (dict[str, Any]): IDs of the existing collections by path, \
+            updated with the planned paths, which have no ID yet
+
+    Returns:
+        list[dict[str, Any]]: Name, path, parent path and, if the parent exists, \
+            parent ID of each collection to create
+    """
+    missing = []
+    while path and path not in collection_ids:
+        parent_path, _, name = path.rpartition("/")
+        missing.append(
+            {
+                "name": name,
+                "path": path,
+                "parent_path": parent_path,
+                "parent_id": collection_ids.get(parent_path),
+            }
+        )
+        collection_ids[path] = None
+        path = parent_path
+    return missing[::-1]
+
+
+def mapping_details(
+    card: CardItem,
+    collections_by_id: dict[Any, Any],
+    database_names: dict[Any, str | None],
+) -> dict[str, Any]:
+    """Entry of a card in the mapping file of an export
+
+    Args:
+        card (CardItem): Card with a native query
+        collections_by_id (dict[Any, Any]): Collections by ID, with their path
+        database_names (dict[Any, str | None]): Names of the databases by ID
+
+    Returns:
+        dict[str, Any]: Name, location, database, id, last update and a hash of \
+            the query of the card
+    """
+    if card.database_id not in database_names:
+        logger.warning("Database %s of %s not found", card.database_id, card.name)
+    query = card.dataset_query["native"]["query"]
+    return {
+        "name": card.name,
+        "collection_id": card.collection_id,
+        "path": collections_by_id[card.collection_id]["path"],
+        "database_id": card.database_id,
+        "database_name": database_names.get(card.database_id),
+        "id": card.id,
+        "updated_at": card.updated_at.isoformat(),
+        "query_hash": sha256(query.encode("utf-8")).hexdigest(),
+    }
+
 
 class MetabaseTools:
     """Extends MetabaseApi with additional complex functions"""
@@ -33,9 +105,25 @@ class MetabaseTools:
         save_file: Path | str | None = None,
         root_folder: Path | str = ".",
         file_extension: str = "sql",
+        max_writers: int = 4,
+        incremental: bool = False,
     ) -> Path:
         """Downloads all native queries into a JSON file
 
+        Cards are parsed as they are received from the API and their queries are \
+            written by a pool of threads in the meantime. Each folder is created \
+            once and every file is written atomically.
+
+        The mapping records the id, last update and a hash of the query of each \
+            card. In incremental mode, it is compared to the mapping of the previous \
+            export: only queries that changed or moved are written, files of cards \
+            that were deleted, moved or renamed are removed and the mapping is only \
+            rewritten if it changed. A card updated at the same time as in the \
+            previous export is unchanged without comparing the hashes. Local edits \
+            to a query file are kept until the card changes on the server. Queries \
+            that could not be written are logged and recorded without a hash, so \
+            the next incremental export writes them again.
+
         Args:
             save_file (Path | str, optional): Path to save mapping file, defaults to \
                 mapping_{timestamp}.json
@@ -43,6 +131,9 @@ class MetabaseTools:
                 default "."
             file_extension (str, optional): File extension to save the queries, by \
                 default "sql"
+            max_writers (int, optional): Threads writing query files, by default 4
+            incremental (bool, optional): Only write what changed since the export \
+                recorded in the mapping file, by default False
 
         Returns:
             Path: Path to save file
@@ -51,53 +142,36 @@ class MetabaseTools:
         root_folder = Path(root_folder)  # Convert root folder to a path object
         save_file = Path(save_file or "mapping.json")
 
-        # Download list of cards from Metabase API and filter to only native queries
-        cards = [
-            card
-            for card in self._adapter.cards.get()
-            if (
-                card.query_type == "native"
-                and card.collection
-                and card.collection.personal_owner_id is None
-            )
-        ]
-        logger.debug("Found %s cards with native queries", len(cards))
-
-        # Create dictionary of collections for file paths
-        collections_by_id = self._get_collections_dict(key="id")
-        logger.debug("Generated flat list of %s collections", len(collections_by_id))
-
-        # Format filtered list
-        cards_to_write = []
-
-        for card in cards:
-            new_card = self._get_mapping_details(
-                card, collections_by_id=collections_by_id
-            )
-            cards_to_write.append(new_card)
+        mapping_path = root_folder / save_file
+        previous = self._read_mapping(mapping_path) if incremental else {}
 
-            try:
-                self._save_query(
-                    card=card,
-                    save_path=f"{root_folder}/{new_card['path']}",
-                    file_extension=file_extension,
-                )
-            except OSError:
-                logger.warning("Skipping %s (name error)", card.name)
-                continue
-            logger.debug(
-                "%s saved to %s",
-                card.name,
-                f"{root_folder}/{new_card['path']}",
+        # Format filtered list while the queries are written by the pool
+        with FileWriterPool(max_workers=max_writers) as writer:
+            cards_to_write, stale_paths, unchanged = self._export_cards(
+                writer=writer,
+                previous=previous,
+                root_folder=root_folder,
+                file_extension=file_extension,
             )
+        logger.debug("Found %s cards with native queries", len(cards_to_write))
+        self._forget_failed(cards_to_write, writer.close(), root_folder, file_extension)
+        removed = self._remove_queries(root_folder, stale_paths)
+        logger.info(
+            "Exported %s queries: %s written, %s unchanged, %s removed",
+            len(cards_to_write),
+            writer.written,
+            unchanged,
+            removed,
+        )
 
         # Save mapping file
-        mapping_path = Path(f"{root_folder}")
-        mapping_path.mkdir(parents=True, exist_ok=True)
-        mapping_path /= save_file
-        logger.debug("Completed iterating through list, saving file: %s", mapping_path)
-        with open(mapping_path, "w", newline="", encoding="utf-8") as file:
-            file.write(dumps(cards_to_write, indent=2))
+        root_folder.mkdir(parents=True, exist_ok=True)
+        mapping = dumps(cards_to_write, indent=2)
+        if incremental and self._read_text(mapping_path) == mapping:
+            logger.debug("Mapping unchanged, not saving file: %s", mapping_path)
+        else:
+            logger.debug("Completed iterating, saving file: %s", mapping_path)
+            write_atomic(mapping_path, mapping)
 
         # Returns path to file saved
         return mapping_path
@@ -109,9 +183,25 @@ class MetabaseTools:
         file_extension: str,
         dry_run: bool = True,
         stop_on_error: bool = False,
+        max_workers: int | None = None,
+        checkpoint_path: Path | str | None = None,
+        create_collections: bool = False,
     ) -> list[dict[str, Any]] | dict[str, Any]:
         """Uploads queries to Metabase
 
+        The collection tree, the cards and, if any card is new, the databases are \
+            fetched once to plan the changes, so the number of requests made does \
+            not grow with the number of queries until changes are pushed.
+
+        Cards in a collection that does not exist are errors, unless \
+            create_collections is set; the collections are then created, parents \
+            first. Changes are pushed concurrently, each card once its collection \
+            exists, and every change completed is recorded in the checkpoint file. \
+            If the upload fails part way, running it again with the same checkpoint \
+            file skips the changes already pushed, even if the cards created were \
+            renamed or moved since, and reports them with the rest. The checkpoint \
+            file is removed once every change succeeded.
+
         Args:
             mapping_path (Path | str): Path to the mapping configuration file, by \
                 default None
@@ -119,12 +209,23 @@ class MetabaseTools:
                 any changes), by default True
             stop_on_error (bool, optional): Raise error and stop if an error is \
                 encountered. Defaults to False.
+            max_workers (int, optional): Changes pushed concurrently, by default \
+                the max_workers of the adapter
+            checkpoint_path (Path | str, optional): File recording the changes \
+                pushed, by default None (no checkpoint)
+            create_collections (bool, optional): Create the collections of the \
+                mapping that do not exist, by default False
 
         Raises:
             FileNotFoundError: The file referenced was not found
+            MetabaseApiException: A collection does not exist, create_collections \
+                is not set and stop_on_error is set
+            MetabaseApiBatchException: One or more changes failed and stop_on_error \
+                is set
 
         Returns:
-            list[dict] | dict: Results of upload
+            list[dict] | dict: Results of upload, one per change with the time it \
+                took, or the changes planned for a dry run
         """
         # Open mapping configuration file
         mapping_path = Path(mapping_path or "./mapping.json")
@@ -133,109 +234,496 @@ class MetabaseTools:
 
         # Iterate through mapping file
         changes: dict[str, list[dict[str, Any]]] = {
+            "collections": [],
             "updates": [],
             "creates": [],
             "errors": [],
         }
-        collections_by_path = self._get_collections_dict(key="path")
+        planned, new_paths = self._locate_queries(
+            cards,
+            mapping_path,
+            file_extension,
+            changes,
+            stop_on_error=stop_on_error,
+            create_collections=create_collections,
+        )
+        cards_by_id = self._plan_cards(planned, new_paths, changes)
+
+        # Loop exit before pushing changes to Metabase in case errors are encountered
+        # Push changes back to Metabase API
+        if not dry_run:
+            return self._execute_changes(
+                changes,
+                cards_by_id=cards_by_id,
+                max_workers=max_workers or self._adapter.max_workers,
+                checkpoint_path=checkpoint_path,
+                stop_on_error=stop_on_error,
+            )
+        return changes
+
+    def _locate_queries(
+        self,
+        cards: list[dict[str, Any]],
+        mapping_path: Path,
+        file_extension: str,
+        changes: dict[str, list[dict[str, Any]]],
+        stop_on_error: bool,
+        create_collections: bool,
+    ) -> tuple[list[tuple[dict[str, Any], Path, Any]], set[str]]:
+        """Finds the query file of each card and, if create_collections is set, \
+            plans the collections missing for it; cards without a file or \
+            collection, or whose file is listed twice as Metabase allows duplicate \
+            names, are added to the errors
+
+        Returns:
+            tuple[list[tuple[dict[str, Any], Path, Any]], set[str]]: Card, query \
+                file and collection ID of each card, and the paths of the \
+                collections to create
+        """
+        collection_ids = {
+            path: collection["id"]
+            for path, collection in self._get_collections_dict(key="path").items()
+        }
+        new_paths: set[str] = set()
+        planned: dict[Path, tuple[dict[str, Any], Path, Any]] = {}
         for card in cards:
             card_path = Path(
                 f"{mapping_path.parent}/{card['path']}/{card['name']}.{file_extension}"
             )
-            if card_path.exists():
-                # Check if a card with the same name exists in the listed location
-                dev_coll_id = collections_by_path[card["path"]]["id"]
-                try:
-                    collection = self._adapter.collections.get(targets=[dev_coll_id])[0]
-                    card_id = collection.check_for_object(card["name"])
-                except MetabaseApiException:  # No items in collection or not found
-                    logger.debug(
-                        "%s not found in listed location, creating", card["name"]
-                    )
-                    card_id = None
-
-                if card_id:  # update existing card
-                    card_result = self._update_existing_card(
-                        card_id=card_id, card_path=card_path
-                    )
-                    if card_result:
-                        changes["updates"].append(card_result)
-                else:  # create card
-                    card_result = self._create_new_card(
-                        card=card, card_path=card_path, dev_coll_id=dev_coll_id
-                    )
-                    if card_result:
-                        changes["creates"].append(card_result)
-
-            else:  # File does not exist
+            if card_path in planned:  # would be pushed twice
+                logger.warning("Skipping %s (duplicate name)", card["name"])
+                changes["errors"].append(card)
+            elif not card_path.exists():  # File does not exist
                 if stop_on_error:
                     logger.error("Unable to process %s (file not found)", card["name"])
                     raise FileNotFoundError(f"{card_path} not found")
                 logger.warning("Skipping %s (file not found)", card["name"])
                 changes["errors"].append(card)
+            elif card["path"] in collection_ids:
+                planned[card_path] = (card, card_path, collection_ids[card["path"]])
+            elif create_collections:
+                new_collections = plan_collections(card["path"], collection_ids)
+                new_paths.update(new["path"] for new in new_collections)
+                changes["collections"].extend(new_collections)
+                planned[card_path] = (card, card_path, None)
+            else:  # Collection does not exist
+                if stop_on_error:
+                    logger.error(
+                        "Unable to process %s (collection not found)", card["name"]
+                    )
+                    raise MetabaseApiException(f"Collection {card['path']} not found")
+                logger.warning("Skipping %s (collection not found)", card["name"])
+                changes["errors"].append(card)
+        return list(planned.values()), new_paths
 
-        # Loop exit before pushing changes to Metabase in case errors are encountered
-        # Push changes back to Metabase API
-        if not dry_run:
-            return self._execute_changes(changes)
-        return changes
+    def _plan_cards(
+        self,
+        planned: list[tuple[dict[str, Any], Path, Any]],
+        new_paths: set[str],
+        changes: dict[str, list[dict[str, Any]]],
+    ) -> dict[Any, dict[str, Any]]:
+        """Plans the update or creation of each card located
+
+        Returns:
+            dict[Any, dict[str, Any]]: Cards found on the server, by ID
+        """
+        # Cards of every collection referenced are fetched once and matched by name
+        prod_cards = self._index_cards(
+            {
+                dev_coll_id
+                for card, _, dev_coll_id in planned
+                if card["path"] not in new_paths
+            }
+        )
+        database_ids: dict[str | None, int | str] | None = None
+        for card, card_path, dev_coll_id in planned:
+            prod_card = None
+            if card["path"] not in new_paths:
+                prod_card = prod_cards.get((dev_coll_id, card["name"]))
+            if prod_card:  # update existing card
+                card_result = self._update_existing_card(
+                    prod_card=prod_card, card_path=card_path
+                )
+                if card_result:
+                    changes["updates"].append(card_result)
+            else:  # create card
+                logger.debug("%s not found in listed location, creating", card["name"])
+                if database_ids is None:
+                    database_ids = self._get_database_ids()
+                card_result = self._create_new_card(
+                    card=card,
+                    card_path=card_path,
+                    dev_coll_id=dev_coll_id,
+                    database_ids=database_ids,
+                )
+                if card["path"] in new_paths:  # resolved once the collection exists
+                    card_result["collection_path"] = card["path"]
+                changes["creates"].append(card_result)
+        return {prod_card["id"]: prod_card for prod_card in prod_cards.values()}
 
     @log_call
     def _execute_changes(
-        self, changes: dict[str, list[dict[str, Any]]]
-    ) -> list[dict[str, Any]] | dict[str, Any]:
-        results = []
-        if len(changes["updates"]) > 0:
-            update_results = []
-            for update in changes["updates"]:
-                card = self._adapter.cards.get([update["id"]])[0]
-                update_results.append(card.update(**update))
-
-            if isinstance(update_results, list):
-                for result in update_results:
-                    results.append(
-                        {"id": result.id, "name": result.name, "is_success": True}
-                    )
-
-        create_results = []
-        if len(changes["creates"]) > 0:
-            create_results = [
-                self._adapter.cards.create(**details) for details in changes["creates"]
-            ]
-            if isinstance(create_results, list):
-                for result in create_results:
-                    results.append(
-                        {"id": result.id, "name": result.name, "is_success": True}
-                    )
+        self,
+        changes: dict[str, list[dict[str, Any]]],
+        cards_by_id: dict[Any, dict[str, Any]] | None = None,
+        max_workers: int = 1,
+        checkpoint_path: Path | str | None = None,
+        stop_on_error: bool = False,
+    ) -> list[dict[str, Any]]:
+        tasks, payloads, labels = self._plan_tasks(changes, cards_by_id or {})
+        if not tasks:
+            return []
+
+        # Only changes recorded with the same payload are skipped when resuming
+        digests = {key: self._digest(payload) for key, payload in payloads.items()}
+        checkpoint = Path(checkpoint_path) if checkpoint_path else None
+        completed = {
+            key: entry["result"]
+            for key, entry in self._read_checkpoint(checkpoint).items()
+            if digests.get(key) == entry["digest"]
+        }
+        if completed:
+            logger.info("Resuming upload, %s changes already pushed", len(completed))
+
+        with (
+            open(checkpoint, "a", newline="", encoding="utf-8")
+            if checkpoint
+            else nullcontext()
+        ) as checkpoint_file:
+            report = run_graph(
+                "upload",
+                tasks,
+                max_workers=max_workers,
+                completed=completed,
+                on_success=(
+                    partial(self._record, checkpoint_file, digests)
+                    if checkpoint_file
+                    else None
+                ),
+                stop_on_error=stop_on_error,
+            )
 
+        logger.info("Upload report: %s", report.summary())
+        results = [
+            {
+                **labels[outcome.target],
+                **(outcome.result or {}),
+                "is_success": outcome.error is None,
+                "elapsed": outcome.elapsed,
+                **({"error": str(outcome.error)} if outcome.error is not None else {}),
+            }
+            for outcome in report.outcomes
+        ]
+        if report.ok:
+            if checkpoint:
+                checkpoint.unlink(missing_ok=True)
+        else:
+            if checkpoint:
+                logger.warning("Rerun with checkpoint %s to resume", checkpoint)
+            if stop_on_error:
+                raise MetabaseApiBatchException(
+                    results=[result for result in results if result["is_success"]],
+                    errors=report.errors,
+                )
         return results
 
-    @log_call
-    def _get_mapping_details(
-        self, card: CardItem, collections_by_id: dict[Any, Any]
+    def _plan_tasks(
+        self,
+        changes: dict[str, list[dict[str, Any]]],
+        cards_by_id: dict[Any, dict[str, Any]],
+    ) -> tuple[list[Task], dict[str, Any], dict[str, dict[str, Any]]]:
+        """Task pushing each change, each card after its collection is created
+
+        Returns:
+            tuple[list[Task], dict[str, Any], dict[str, dict[str, Any]]]: Tasks, \
+                and the payload and the ID and name reported of each one, by key
+        """
+        tasks: list[Task] = []
+        labels: dict[str, dict[str, Any]] = {}
+        payloads: dict[str, Any] = {}
+
+        def add(key: str, payload: dict[str, Any], task: Task, name: Any) -> None:
+            tasks.append(task)
+            payloads[key] = payload
+            labels[key] = {"id": payload.get("id"), "name": name}
+
+        for collection in changes.get("collections", []):
+            key = f"collection:{collection['path']}"
+            depends_on = (
+                (f"collection:{collection['parent_path']}",)
+                if collection["parent_path"] and not collection["parent_id"]
+                else ()
+            )
+            task = Task(key, partial(self._push_collection, collection), depends_on)
+            add(key, collection, task, collection["name"])
+        for update in changes["updates"]:
+            key = f"update:{update['id']}"
+            card = cards_by_id.get(update["id"])
+            task = Task(key, partial(self._push_update, update))
+            add(key, update, task, card["name"] if card else None)
+        for details in changes["creates"]:
+            path = details.get("collection_path")
+            key = f"create:{path or details['collection_id']}/{details['name']}"
+            depends_on = (f"collection:{path}",) if path else ()
+            task = Task(key, partial(self._push_create, details), depends_on)
+            add(key, details, task, details["name"])
+        return tasks, payloads, labels
+
+    @staticmethod
+    def _record(
+        checkpoint_file: TextIO, digests: dict[str, str], key: str, result: Any
+    ) -> None:
+        entry = {"key": key, "digest": digests[key], "result": result}
+        checkpoint_file.write(dumps(entry) + "\n")
+        checkpoint_file.flush()
+
+    def _push_collection(
+        self, collection: dict[str, Any], parents: dict[str, Any]
     ) -> dict[str, Any]:
-        mapping_details = {
-            "name": card.name,
-            "collection_id": card.collection_id,
-            "path": collections_by_id[card.collection_id]["path"],
-        }
+        parent_id = collection["parent_id"]
+        for parent in parents.values():  # created in this upload
+            parent_id = parent["id"]
+        created = self._adapter.collections.create(
+            name=collection["name"], color=NEW_COLLECTION_COLOR, parent_id=parent_id
+        )
+        return {"id": created.id, "name": created.name}
+
+    def _push_update(self, update: dict[str, Any], _: dict[str, Any]) -> dict[str, Any]:
+        # Only the changed fields were planned, so they are sent as they are
+        result = self._adapter.put(
+            endpoint=f"/card/{update['id']}",
+            json={k: v for k, v in update.items() if k != "id"},
+        )
+        if not isinstance(result, dict):
+            raise TypeError(f"Expected dict, received {type(result)}")
+        return {"id": result["id"], "name": result.get("name")}
+
+    def _push_create(
+        self, details: dict[str, Any], collections: dict[str, Any]
+    ) -> dict[str, Any]:
+        details = {k: v for k, v in details.items() if k != "collection_path"}
+        for collection in collections.values():  # created in this upload
+            details["collection_id"] = collection["id"]
+        result = self._adapter.cards.create(**details)
+        return {"id": result.id, "name": result.name}
+
+    @staticmethod
+    def _digest(payload: Any) -> str:
+        return sha256(dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _read_checkpoint(checkpoint: Path | None) -> dict[str, dict[str, Any]]:
+        text = MetabaseTools._read_text(checkpoint) if checkpoint else None
+        entries = {}
+        for line in (text or "").splitlines():
+            try:
+                entry = loads(line)
+            except JSONDecodeError:  # last line cut short by an interruption
+                logger.warning("Ignoring unreadable checkpoint entry: %s", line)
+                continue
+            entries[entry["key"]] = entry
+        return entries
+
+    def _iter_native_cards(self) -> Iterator[CardItem]:
+        for card in self._adapter.cards.iter_all():
+            if (
+                card.query_type == "native"
+                and card.collection
+                and card.collection.personal_owner_id is None
+            ):
+                yield card
 
-        mapping_details["database_id"] = card.database_id
-        mapping_details["database_name"] = self._adapter.databases.search(
-            search_params=[{"id": card.database_id}]
-        )[0].name
+    @log_call
+    def _index_cards(
+        self, collection_ids: set[Any]
+    ) -> dict[tuple[Any, str], dict[str, Any]]:
+        """Cards in the collections by collection and name, from a single listing
+
+        Only the fields needed to plan the changes are kept, so the cards are not \
+            fully built. Archived cards and models are left out, as they cannot be \
+            found in a collection by name. The first card listed wins if names are \
+            duplicated.
+        """
+        if not collection_ids:
+            return {}
+        cards: dict[tuple[Any, str], dict[str, Any]] = {}
+        for projection in self._adapter.cards.iter_get(fields=_INDEX_FIELDS):
+            card = projection.dict()
+            if (
+                card["collection_id"] in collection_ids
+                and card["name"] is not None
+                and not card["archived"]
+                and not card["dataset"]
+            ):
+                cards.setdefault((card["collection_id"], card["name"]), card)
+        return cards
 
-        return mapping_details
+    @log_call
+    def _get_database_ids(self) -> dict[str | None, int | str]:
+        return {
+            database.name: database.id for database in self._adapter.databases.get()
+        }
 
     @log_call
-    def _save_query(self, card: CardItem, save_path: str, file_extension: str) -> None:
-        # SQL file creation
-        sql_code = card.dataset_query["native"]["query"]
-        sql_path = Path(f"{save_path}")
-        sql_path.mkdir(parents=True, exist_ok=True)
-        sql_path /= f"{card.name}.{file_extension}"
-        with open(sql_path, "w", newline="", encoding="utf-8") as file:
-            file.write(sql_code)
+    def _get_database_names(self) -> dict[Any, str | None]:
+        return {
+            database.id: database.name for database in self._adapter.databases.get()
+        }
+
+    def _export_cards(
+        self,
+        writer: FileWriterPool,
+        previous: dict[Any, dict[str, Any]],
+        root_folder: Path,
+        file_extension: str,
+    ) -> tuple[list[dict[str, Any]], set[Path], int]:
+        """Maps each native card and submits the queries that changed since the \
+            previous export to the writer
+
+        Returns:
+            tuple[list[dict[str, Any]], set[Path], int]: Mapping entries, query \
+                files no longer part of the export and number of queries unchanged
+        """
+        details = self._mapping_details()
+        cards_to_write = []
+        stale_paths: list[Path] = []
+        unchanged = 0
+        for card in self._iter_native_cards():
+            # Taken out first, so the file of a card renamed badly is removed
+            old_card = previous.pop(card.id, None)
+            new_card = details(card)
+            cards_to_write.append(new_card)
+            query_path = self._query_path(root_folder, new_card, file_extension)
+            if query_path.name != f"{card.name}.{file_extension}":
+                logger.warning("Skipping %s (name error)", card.name)
+                if old_card is not None:
+                    stale_paths.append(
+                        self._query_path(root_folder, old_card, file_extension)
+                    )
+                continue
+
+            changed, stale_path = self._compare_card(
+                old_card, new_card, query_path, root_folder, file_extension
+            )
+            if stale_path is not None:
+                stale_paths.append(stale_path)
+            if not changed:
+                unchanged += 1
+                continue
+            writer.submit(
+                path=query_path, content=card.dataset_query["native"]["query"]
+            )
+
+        # Cards left over were deleted, archived or are no longer native queries
+        stale_paths.extend(
+            self._query_path(root_folder, old_card, file_extension)
+            for old_card in previous.values()
+        )
+        return (
+            cards_to_write,
+            set(stale_paths).difference(
+                self._query_path(root_folder, card, file_extension)
+                for card in cards_to_write
+            ),
+            unchanged,
+        )
+
+    def _mapping_details(self) -> Callable[[CardItem], dict[str, Any]]:
+        """Maps cards to their entry in the mapping file"""
+        # Collections and databases are fetched once and looked up per card
+        collections_by_id = self._get_collections_dict(key="id")
+        logger.debug("Generated flat list of %s collections", len(collections_by_id))
+        return partial(
+            mapping_details,
+            collections_by_id=collections_by_id,
+            database_names=self._get_database_names(),
+        )
+
+    @staticmethod
+    def _forget_failed(
+        cards: list[dict[str, Any]],
+        failed: dict[Path, Exception],
+        root_folder: Path,
+        file_extension: str,
+    ) -> None:
+        """Drops the hash from the mapping entries of the queries that could not \
+            be written, so the next incremental export writes them again"""
+        if not failed:
+            return
+        for card in cards:
+            if MetabaseTools._query_path(root_folder, card, file_extension) in failed:
+                del card["query_hash"]
+        logger.error("%s queries could not be written", len(failed))
+
+    @staticmethod
+    def _compare_card(
+        old_card: dict[str, Any] | None,
+        new_card: dict[str, Any],
+        query_path: Path,
+        root_folder: Path,
+        file_extension: str,
+    ) -> tuple[bool, Path | None]:
+        """Whether the query of a card must be written and, if the card moved or \
+            was renamed, the file it was exported to before"""
+        if old_card is None:
+            return True, None
+        old_path = MetabaseTools._query_path(root_folder, old_card, file_extension)
+        if old_path != query_path:
+            return True, old_path
+        if "query_hash" not in old_card:
+            # Exported before hashes were recorded or the file could not be written
+            return True, None
+        changed = old_card.get("updated_at") != new_card["updated_at"] and (
+            old_card["query_hash"] != new_card["query_hash"]
+        )
+        return changed or not query_path.exists(), None
+
+    @staticmethod
+    def _query_path(
+        root_folder: Path, card: dict[str, Any], file_extension: str
+    ) -> Path:
+        return (
+            Path(f"{root_folder}/{card['path']}") / f"{card['name']}.{file_extension}"
+        )
+
+    @staticmethod
+    def _read_text(path: Path) -> str | None:
+        try:
+            with open(path, newline="", encoding="utf-8") as file:
+                return file.read()
+        except FileNotFoundError:
+            return None
+
+    @staticmethod
+    def _read_mapping(mapping_path: Path) -> dict[Any, dict[str, Any]]:
+        """Cards of a previous export by id; cards exported before ids were \
+            recorded are left out, so their queries are written again
+        """
+        text = MetabaseTools._read_text(mapping_path)
+        if text is None:
+            logger.info("No previous export found at %s", mapping_path)
+            return {}
+        return {card["id"]: card for card in loads(text) if "id" in card}
+
+    @staticmethod
+    def _remove_queries(root_folder: Path, paths: Iterable[Path]) -> int:
+        root = root_folder.resolve()
+        removed = 0
+        for path in paths:
+            # Mappings may be edited by hand, so never leave the export folder
+            if not path.resolve().is_relative_to(root):
+                logger.warning("Not removing %s (outside %s)", path, root_folder)
+                continue
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                continue
+            except OSError as error_raised:
+                logger.warning("Unable to remove %s: %s", path, error_raised)
+                continue
+            logger.debug("Removed %s", path)
+            removed += 1
+        return removed
 
     @log_call
     def _get_collections_dict(self, key: str) -> dict[Any, Any]:
@@ -246,30 +734,30 @@ class MetabaseTools:
     @log_call
     def _update_existing_card(
         self,
-        card_id: int,
+        prod_card: dict[str, Any],
         card_path: Path | str,
     ) -> dict[str, Any]:
-        prod_card = self._adapter.cards.get(targets=[card_id])[0]
         with open(card_path, newline="", encoding="utf-8") as file:
             dev_code = file.read()
-        if dev_code != prod_card.dataset_query["native"]["query"]:
-            dev_query = prod_card.dataset_query.copy()
+        if dev_code != prod_card["dataset_query"]["native"]["query"]:
+            # The card is reused for the update, so its query must not change here
+            dev_query = deepcopy(prod_card["dataset_query"])
             dev_query["native"]["query"] = dev_code
-            dev_def = {"id": card_id, "dataset_query": dev_query}
+            dev_def = {"id": prod_card["id"], "dataset_query": dev_query}
             return dev_def
         return {}
 
     @log_call
     def _create_new_card(
-        self, card: dict[str, Any], card_path: Path, dev_coll_id: int
+        self,
+        card: dict[str, Any],
+        card_path: Path,
+        dev_coll_id: int | None,
+        database_ids: dict[str | None, int | str],
     ) -> dict[str, Any]:
         with open(card_path, newline="", encoding="utf-8") as file:
             dev_query = file.read()
-        db_id = [
-            database.id
-            for database in self._adapter.databases.get()
-            if card["database_name"] == database.name
-        ][0]
+        db_id = database_ids[card["database_name"]]
 
         new_card_def = {
             "visualization_settings": {},
@@ -0,0 +1,195 @@
+"""In-memory cache of responses from the Metabase API
+"""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+from copy import deepcopy
+from json import dumps
+from logging import getLogger
+from threading import Lock
+from time import monotonic
+from typing import Any
+
+logger = getLogger(__name__)
+
+
+def resource_prefix(endpoint: str) -> str:
+    """Top level resource of an endpoint (e.g. /card for /card/1/query)
+
+    Args:
+        endpoint (str): URL endpoint
+
+    Returns:
+        str: Resource prefix
+    """
+    return "/" + endpoint.strip("/").split("/", 1)[0]
+
+
+class ResponseCache:
+    """LRU cache of GET responses with per-endpoint time to live
+
+    Responses are keyed by endpoint and parameters. Any PUT, POST or DELETE sent \
+        through the adapter invalidates every cached response for the same resource \
+        prefix, e.g. a PUT to /card/1 invalidates /card, /card/1 and /card/embeddable. \
+        Responses to requests sent before an invalidation of their resource are not \
+        stored, so a GET in flight during a write does not cache the data from \
+        before the write.
+
+    Args:
+        default_ttl (float, optional): Seconds a response is cached, by default 60
+        ttls (dict[str, float], optional): Seconds a response is cached for \
+            endpoints starting with each key, overriding default_ttl. The longest \
+            matching key is used and a value of 0 disables caching for the endpoint.
+        max_entries (int, optional): Maximum responses cached before the least \
+            recently used are evicted, by default 256
+    """
+
+    def __init__(
+        self,
+        default_ttl: float = 60,
+        ttls: dict[str, float] | None = None,
+        max_entries: int = 256,
+    ):
+        if max_entries < 1:
+            raise ValueError("max_entries must be at least 1")
+        self.default_ttl = default_ttl
+        self.ttls = dict(sorted((ttls or {}).items(), key=lambda x: -len(x[0])))
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[str, str], tuple[float, Any]] = OrderedDict()
+        self._generations: dict[str, int] = {}
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def _key(endpoint: str, params: dict[str, Any] | None) -> tuple[str, str]:
+        return endpoint, dumps(params or {}, sort_keys=True, default=str)
+
+    def ttl_for(self, endpoint: str) -> float:
+        """Time to live for responses from an endpoint
+
+        Args:
+            endpoint (str): URL endpoint
+
+        Returns:
+            float: Seconds a response is cached
+        """
+        for prefix, ttl in self.ttls.items():
+            if endpoint.startswith(prefix):
+                return ttl
+        return self.default_ttl
+
+    def lookup(
+        self, endpoint: str, params: dict[str, Any] | None = None
+    ) -> tuple[bool, Any]:
+        """Finds a cached response
+
+        Args:
+            endpoint (str): URL endpoint
+            params (dict, optional): Endpoint parameters
+
+        Returns:
+            tuple[bool, Any]: Whether the response was found and a copy of it
+        """
+        key = self._key(endpoint, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] < monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return False, None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            value = entry[1]
+        return True, deepcopy(value)
+
+    def generation(self, endpoint: str) -> int:
+        """Number of invalidations of the resource an endpoint belongs to, read \
+            before sending a request and passed to store with its response
+
+        Args:
+            endpoint (str): URL endpoint
+
+        Returns:
+            int: Invalidations of the resource so far
+        """
+        with self._lock:
+            return self._generations.get(resource_prefix(endpoint), 0)
+
+    def store(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None,
+        value: Any,
+        generation: int | None = None,
+    ) -> None:
+        """Caches a response
+
+        Args:
+            endpoint (str): URL endpoint
+            params (dict, optional): Endpoint parameters
+            value (Any): Response to cache
+            generation (int, optional): Generation of the resource when the request \
+                was sent. The response is not cached if the resource was \
+                invalidated since, by default it is always cached
+        """
+        ttl = self.ttl_for(endpoint)
+        if ttl <= 0:
+            return
+        key = self._key(endpoint, params)
+        entry = (monotonic() + ttl, deepcopy(value))
+        with self._lock:
+            current = self._generations.get(resource_prefix(endpoint), 0)
+            if generation is not None and generation != current:
+                logger.debug("Not caching response invalidated in flight: %s", endpoint)
+                return
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, endpoint: str) -> None:
+        """Removes cached responses for the resource an endpoint belongs to
+
+        Args:
+            endpoint (str): URL endpoint that was changed
+        """
+        prefix = resource_prefix(endpoint)
+        with self._lock:
+            self._generations[prefix] = self._generations.get(prefix, 0) + 1
+            stale = [
+                key
+                for key in self._entries
+                if key[0] == prefix or key[0].startswith(prefix + "/")
+            ]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += len(stale)
+        if stale:
+            logger.debug("Invalidated %s cached responses for %s", len(stale), prefix)
+
+    def clear(self) -> None:
+        """Removes all cached responses"""
+        with self._lock:
+            self._entries.clear()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Cache statistics
+
+        Returns:
+            dict[str, int]: Hits, misses, evictions, invalidations and entries
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+            }
@@ -0,0 +1,158 @@
+"""Coalescing of identical requests made at the same time
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from copy import deepcopy
+from json import dumps
+from logging import getLogger
+from threading import Event, Lock
+from typing import Any, TypeVar, cast
+
+from metabase_tools.utils.cache import resource_prefix
+
+R = TypeVar("R")
+
+logger = getLogger(__name__)
+
+
+class _Flight:
+    """Request in flight and its outcome, once received"""
+
+    __slots__ = ("done", "result", "error", "followers")
+
+    def __init__(self) -> None:
+        self.done = Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+        self.followers = 0
+
+    def outcome(self) -> Any:
+        """Waits for the response and returns it, or raises the error received
+
+        Returns:
+            Any: Result of the request
+        """
+        self.done.wait()
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+    def land(self, result: Any = None, error: BaseException | None = None) -> None:
+        """Records the outcome of the request and wakes the threads waiting for it
+
+        Args:
+            result (Any, optional): Result of the request
+            error (BaseException, optional): Error raised by the request
+        """
+        self.result = result
+        self.error = error
+        self.done.set()
+
+
+class RequestCoalescer:
+    """Shares one request between threads asking for the same resource at once
+
+    The first thread to request an endpoint with some parameters sends the \
+        request. Threads requesting the same endpoint and parameters before the \
+        response is received wait for it instead of sending their own request. \
+        Every thread receives its own copy of the response, so changes made by one \
+        thread are not seen by the others, and failures are raised in every thread.
+    """
+
+    def __init__(self) -> None:
+        self._flights: dict[tuple[str, str], _Flight] = {}
+        self._lock = Lock()
+        self.requests = 0
+        self.shared = 0
+
+    @staticmethod
+    def _key(endpoint: str, params: dict[str, Any] | None) -> tuple[str, str]:
+        return endpoint, dumps(params or {}, sort_keys=True, default=str)
+
+    def do(
+        self, endpoint: str, params: dict[str, Any] | None, func: Callable[[], R]
+    ) -> R:
+        """Calls func, unless an identical request is in flight, and returns its result
+
+        Args:
+            endpoint (str): URL endpoint
+            params (dict, optional): Endpoint parameters
+            func (Callable[[], R]): Sends the request
+
+        Returns:
+            R: Result of the request
+        """
+        key = self._key(endpoint, params)
+        with self._lock:
+            flight = self._flights.get(key)
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+                self.requests += 1
+                leader = True
+            else:
+                flight.followers += 1
+                self.shared += 1
+                leader = False
+
+        if not leader:
+            logger.debug("Waiting for request in flight: %s:%s", endpoint, params)
+            return deepcopy(cast(R, flight.outcome()))
+
+        try:
+            result = func()
+        except BaseException as error_raised:
+            self._land(key, flight, error=error_raised)
+            raise
+        self._land(key, flight, result=result)
+        # Followers copy the original, so the caller cannot change it under them
+        if flight.followers:
+            return deepcopy(cast(R, flight.result))
+        return cast(R, flight.result)
+
+    def _land(
+        self,
+        key: tuple[str, str],
+        flight: _Flight,
+        result: Any = None,
+        error: BaseException | None = None,
+    ) -> None:
+        with self._lock:
+            if self._flights.get(key) is flight:
+                del self._flights[key]
+        flight.land(result=result, error=error)
+
+    def forget(self, endpoint: str) -> None:
+        """Stops sharing requests in flight for the resource an endpoint belongs to
+
+        Requests made afterwards are sent again, so they are not answered with a \
+            response sent before a change to the resource.
+
+        Args:
+            endpoint (str): URL endpoint that was changed
+        """
+        prefix = resource_prefix(endpoint)
+        with self._lock:
+            stale = [
+                key
+                for key in self._flights
+                if key[0] == prefix or key[0].startswith(prefix + "/")
+            ]
+            for key in stale:
+                del self._flights[key]
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Coalescing statistics
+
+        Returns:
+            dict[str, int]: Requests sent, requests answered by a request already \
+                in flight and requests currently in flight
+        """
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "shared": self.shared,
+                "in_flight": len(self._flights),
+            }
@@ -0,0 +1,124 @@
+"""JSON codecs used to encode requests and decode responses
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import asdict, is_dataclass
+from datetime import date, datetime, time
+from enum import Enum
+from logging import getLogger
+from typing import Any
+from uuid import UUID
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover
+    HAS_ORJSON = False
+
+logger = getLogger(__name__)
+
+
+class JsonCodec:
+    """JSON codec based on the json module of the standard library
+
+    Bodies are decoded straight from bytes, so the encoding of the response is \
+        not detected from its content first. Datetimes, dates, times, UUIDs, enums \
+        and dataclasses are encoded the way orjson encodes them. Subclasses \
+        replace loads and dumps to use another library; loads must raise \
+        json.JSONDecodeError (or a subclass of it) for invalid documents.
+    """
+
+    name = "json"
+
+    def loads(self, data: bytes | str) -> Any:
+        """Decodes a JSON document
+
+        Args:
+            data (bytes | str): Document encoded as UTF-8, or already decoded
+
+        Raises:
+            JSONDecodeError: The document is not valid JSON
+
+        Returns:
+            Any: Decoded document
+        """
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        """Encodes an object as a JSON document
+
+        Args:
+            obj (Any): Object to encode
+
+        Raises:
+            TypeError: The object contains a value that cannot be encoded
+
+        Returns:
+            bytes: Document encoded as UTF-8
+        """
+        return json.dumps(obj, allow_nan=False, default=_default).encode("utf-8")
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}()"
+
+
+class OrjsonCodec(JsonCodec):
+    """JSON codec based on orjson, several times faster than the standard library \
+        on large documents
+
+    Raises:
+        ImportError: orjson is not installed
+    """
+
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if not HAS_ORJSON:
+            raise ImportError(
+                "orjson is required for OrjsonCodec; "
+                "install it with `pip install metabase-tools[fast]`"
+            )
+
+    def loads(self, data: bytes | str) -> Any:
+        return orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+
+
+def _default(obj: Any) -> Any:
+    """Converts values the json module cannot encode, as orjson encodes them
+
+    Args:
+        obj (Any): Value the json module cannot encode
+
+    Raises:
+        TypeError: The value has no JSON representation
+
+    Returns:
+        Any: Value the json module can encode
+    """
+    if isinstance(obj, (datetime, date, time)):
+        return obj.isoformat()
+    if isinstance(obj, UUID):
+        return str(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return asdict(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+def default_codec() -> JsonCodec:
+    """Fastest JSON codec available
+
+    Returns:
+        JsonCodec: OrjsonCodec if orjson is installed, otherwise JsonCodec
+    """
+    if HAS_ORJSON:
+        return OrjsonCodec()
+    logger.debug("orjson is not installed, using the json module")
+    return JsonCodec()
@@ -0,0 +1,377 @@
+"""Helpers for running API calls concurrently
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from time import monotonic
+from typing import Any, NamedTuple, TypeVar
+
+from metabase_tools.exceptions import MetabaseApiException
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def map_concurrently(
+    func: Callable[[T], R], items: Sequence[T], max_workers: int = 1
+) -> list[tuple[R | None, Exception | None]]:
+    """Calls func for every item using a bounded pool of worker threads
+
+    Results are returned in the same order as items. Exceptions are captured \
+        rather than raised so that one failure does not abort the remaining calls.
+
+    Args:
+        func (Callable[[T], R]): Function to call for each item
+        items (Sequence[T]): Items to pass to func
+        max_workers (int, optional): Maximum number of concurrent calls, by \
+            default 1 (serial)
+
+    Returns:
+        list[tuple[R | None, Exception | None]]: Result and exception for each item
+    """
+
+    def call(item: T) -> tuple[R | None, Exception | None]:
+        try:
+            return func(item), None
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            return None, error
+
+    if max_workers <= 1 or len(items) <= 1:
+        return [call(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+        return list(executor.map(call, items))
+
+
+class BulkOutcome(NamedTuple):
+    """Outcome of a bulk operation for one target
+
+    Attributes:
+        target: ID of the object
+        result: Value returned for the target, None if it failed
+        error: Exception raised for the target, None if it succeeded
+        elapsed: Seconds taken by the target
+    """
+
+    target: Any
+    result: Any
+    error: Exception | None
+    elapsed: float
+
+
+class BulkReport:
+    """Successes and failures of a bulk operation
+
+    Args:
+        operation (str): Name of the operation
+        outcomes (list[BulkOutcome]): Outcome for each target, in the order of \
+            the targets
+        elapsed (float): Seconds taken by the whole operation
+    """
+
+    def __init__(self, operation: str, outcomes: list[BulkOutcome], elapsed: float):
+        self.operation = operation
+        self.outcomes = outcomes
+        self.elapsed = elapsed
+
+    def __repr__(self) -> str:
+        return (
+            f"<BulkReport {self.operation}: {len(self.succeeded)} succeeded, "
+            f"{len(self.failed)} failed in {self.elapsed:.2f}s>"
+        )
+
+    @property
+    def succeeded(self) -> list[BulkOutcome]:
+        """Outcomes of the targets that succeeded
+
+        Returns:
+            list[BulkOutcome]
+        """
+        return [outcome for outcome in self.outcomes if outcome.error is None]
+
+    @property
+    def failed(self) -> list[BulkOutcome]:
+        """Outcomes of the targets that failed
+
+        Returns:
+            list[BulkOutcome]
+        """
+        return [outcome for outcome in self.outcomes if outcome.error is not None]
+
+    @property
+    def ok(self) -> bool:
+        """Whether every target succeeded
+
+        Returns:
+            bool
+        """
+        return all(outcome.error is None for outcome in self.outcomes)
+
+    @property
+    def results(self) -> list[Any]:
+        """Values returned for the targets that succeeded
+
+        Returns:
+            list[Any]
+        """
+        return [outcome.result for outcome in self.succeeded]
+
+    @property
+    def errors(self) -> dict[Any, Exception]:
+        """Exception raised for each target that failed, keyed by the repr of \
+            targets that cannot be used as keys
+
+        Returns:
+            dict[Any, Exception]
+        """
+        return {
+            (
+                outcome.target
+                if isinstance(outcome.target, Hashable)
+                else repr(outcome.target)
+            ): outcome.error
+            for outcome in self.outcomes
+            if outcome.error is not None
+        }
+
+    def summary(self) -> dict[str, Any]:
+        """Counts and timings of the operation
+
+        Returns:
+            dict[str, Any]: Operation, number of targets, successes and failures, \
+                total seconds and the mean and maximum seconds per target
+        """
+        timings = [outcome.elapsed for outcome in self.outcomes]
+        return {
+            "operation": self.operation,
+            "total": len(self.outcomes),
+            "succeeded": len(self.succeeded),
+            "failed": len(self.failed),
+            "elapsed": self.elapsed,
+            "mean_latency": sum(timings) / len(timings) if timings else 0.0,
+            "max_latency": max(timings, default=0.0),
+        }
+
+
+def run_bulk(
+    operation: str,
+    func: Callable[[T], Any],
+    items: Sequence[T],
+    key: Callable[[T], Any],
+    max_workers: int = 1,
+) -> BulkReport:
+    """Calls func for every item concurrently and reports the outcome of each
+
+    Args:
+        operation (str): Name of the operation, used in the report
+        func (Callable[[T], Any]): Function to call for each item
+        items (Sequence[T]): Items to pass to func
+        key (Callable[[T], Any]): Target reported for each item, such as its ID. \
+            If key raises, func is not called and the item is reported as a \
+            failed target.
+        max_workers (int, optional): Maximum number of concurrent calls, by \
+            default 1 (serial)
+
+    Returns:
+        BulkReport: Outcome of every item, in the order of items
+    """
+
+    def timed(item: T) -> BulkOutcome:
+        start = monotonic()
+        try:
+            target = key(item)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            return BulkOutcome(item, None, error, monotonic() - start)
+        try:
+            result = func(item)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            return BulkOutcome(target, None, error, monotonic() - start)
+        return BulkOutcome(target, result, None, monotonic() - start)
+
+    start = monotonic()
+    outcomes = [
+        outcome or BulkOutcome(item, None, error, 0.0)
+        for item, (outcome, error) in zip(
+            items, map_concurrently(timed, items, max_workers=max_workers)
+        )
+    ]
+    return BulkReport(
+        operation=operation, outcomes=outcomes, elapsed=monotonic() - start
+    )
+
+
+class Task(NamedTuple):
+    """Unit of work run by run_graph
+
+    Attributes:
+        key: Unique name of the task, reported as its target
+        func: Called with the results of the tasks it depends on, by key
+        depends_on: Keys of the tasks that must succeed before this one starts
+    """
+
+    key: str
+    func: Callable[[dict[str, Any]], Any]
+    depends_on: tuple[str, ...] = ()
+
+
+class _Graph:
+    """Tasks of run_graph, the results of those that succeeded and the \
+        dependencies each one is still waiting for
+
+    Args:
+        tasks (Sequence[Task]): Tasks to run
+        results (dict[str, Any]): Results of tasks already completed, by key
+
+    Raises:
+        ValueError: Keys are duplicated or a dependency is not a task
+    """
+
+    def __init__(self, tasks: Sequence[Task], results: dict[str, Any]):
+        self.tasks = {task.key: task for task in tasks}
+        if len(self.tasks) != len(tasks):
+            raise ValueError("Task keys must be unique")
+        known = self.tasks.keys() | results.keys()
+        for task in tasks:
+            unknown = [key for key in task.depends_on if key not in known]
+            if unknown:
+                raise ValueError(f"{task.key} depends on unknown tasks: {unknown}")
+
+        self.results = results
+        self.outcomes = {
+            key: BulkOutcome(key, results[key], None, 0.0)
+            for key in self.tasks
+            if key in results
+        }
+        self.waiting = {
+            task.key: {key for key in task.depends_on if key not in results}
+            for task in tasks
+            if task.key not in self.outcomes
+        }
+        self.dependents: dict[str, list[str]] = {}
+        for key, dependencies in self.waiting.items():
+            for dependency in dependencies:
+                self.dependents.setdefault(dependency, []).append(key)
+        self.ready = [
+            key for key, dependencies in self.waiting.items() if not dependencies
+        ]
+
+    def start(self) -> tuple[Task, dict[str, Any]]:
+        """Takes the next task ready to run
+
+        Returns:
+            tuple[Task, dict[str, Any]]: Task and the results of its dependencies
+        """
+        task = self.tasks[self.ready.pop(0)]
+        return task, {key: self.results[key] for key in task.depends_on}
+
+    def finish(self, outcome: BulkOutcome) -> None:
+        """Records the outcome of a task, making ready the dependents it was the \
+            last dependency of or, if it failed, failing every task depending on it
+
+        Args:
+            outcome (BulkOutcome): Outcome of the task, with its key as target
+        """
+        key = outcome.target
+        self.outcomes[key] = outcome
+        if outcome.error is not None:
+            self._skip(key, f"{key} failed")
+            return
+        self.results[key] = outcome.result
+        for dependent in self.dependents.get(key, []):
+            self.waiting[dependent].discard(key)
+            if not self.waiting[dependent] and dependent not in self.outcomes:
+                self.ready.append(dependent)
+
+    def _skip(self, key: str, reason: str) -> None:
+        for dependent in self.dependents.get(key, []):
+            if dependent not in self.outcomes:
+                error = MetabaseApiException(f"Not run: {reason}")
+                self.outcomes[dependent] = BulkOutcome(dependent, None, error, 0.0)
+                self._skip(dependent, reason)
+
+    def report(self, stopped: bool) -> list[BulkOutcome]:
+        """Outcome of every task, failing those that were never run
+
+        Args:
+            stopped (bool): Whether the run stopped after a failure
+
+        Returns:
+            list[BulkOutcome]: Outcome of every task, in the order of tasks
+        """
+        reason = "stopped after an earlier failure" if stopped else "cycle"
+        return [
+            self.outcomes.get(key)
+            or BulkOutcome(key, None, MetabaseApiException(f"Not run: {reason}"), 0.0)
+            for key in self.tasks
+        ]
+
+
+def _run_task(task: Task, inputs: dict[str, Any]) -> BulkOutcome:
+    start = monotonic()
+    try:
+        result = task.func(inputs)
+    except Exception as error:  # pylint: disable=broad-exception-caught
+        return BulkOutcome(task.key, None, error, monotonic() - start)
+    return BulkOutcome(task.key, result, None, monotonic() - start)
+
+
+def run_graph(
+    operation: str,
+    tasks: Sequence[Task],
+    max_workers: int = 1,
+    completed: dict[str, Any] | None = None,
+    on_success: Callable[[str, Any], None] | None = None,
+    stop_on_error: bool = False,
+) -> BulkReport:
+    """Runs tasks concurrently, starting each one once its dependencies succeeded
+
+    Independent tasks run in parallel on up to max_workers threads. A task is not \
+        run if one of its dependencies failed and is reported as failed instead. \
+        Tasks already completed, e.g. by an earlier run that was interrupted, are \
+        not run again and their recorded results are passed to their dependents.
+
+    Args:
+        operation (str): Name of the operation, used in the report
+        tasks (Sequence[Task]): Tasks to run
+        max_workers (int, optional): Maximum number of concurrent tasks, by \
+            default 1 (serial)
+        completed (dict[str, Any], optional): Results of tasks already completed, \
+            by key
+        on_success (Callable[[str, Any], None], optional): Called with the key \
+            and result of each task as it succeeds, from the calling thread
+        stop_on_error (bool, optional): Stop starting tasks after the first \
+            failure, by default False
+
+    Raises:
+        ValueError: Keys are duplicated or a dependency is not a task
+
+    Returns:
+        BulkReport: Outcome of every task, in the order of tasks
+    """
+    graph = _Graph(tasks, dict(completed or {}))
+    start = monotonic()
+    stopped = False
+    max_workers = max(1, max_workers)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        running: set[Future[BulkOutcome]] = set()
+        while True:
+            # Tasks are only handed over when a worker is free, so none is queued
+            # when stop_on_error stops the run
+            while graph.ready and not stopped and len(running) < max_workers:
+                running.add(executor.submit(_run_task, *graph.start()))
+            if not running:
+                break
+            finished, running = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                outcome = future.result()
+                graph.finish(outcome)
+                if outcome.error is not None:
+                    stopped = stopped or stop_on_error
+                elif on_success:
+                    on_success(outcome.target, outcome.result)
+    return BulkReport(
+        operation=operation,
+        outcomes=graph.report(stopped),
+        elapsed=monotonic() - start,
+    )
@@ -0,0 +1,405 @@
+"""Persistent cache of responses from the Metabase API stored in SQLite
+"""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+from collections.abc import Iterable
+from hashlib import sha256
+from json import dumps, loads
+from logging import getLogger
+from pathlib import Path
+from threading import Lock, local
+from time import time
+from typing import Any, NamedTuple
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+from metabase_tools.utils.cache import resource_prefix
+
+logger = getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    endpoint TEXT NOT NULL,
+    body BLOB NOT NULL,
+    etag TEXT,
+    last_modified TEXT,
+    stored_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    size INTEGER NOT NULL,
+    updated_at TEXT
+);
+CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at);
+CREATE INDEX IF NOT EXISTS responses_endpoint ON responses (endpoint);
+"""
+
+# Endpoints of a single item, e.g. /card/1, whose updated_at is recorded
+_ITEM_ENDPOINT = re.compile(r"/[\w-]+/\d+")
+
+
+class CachedResponse(NamedTuple):
+    """Response body and validators stored in the cache"""
+
+    body: bytes
+    etag: str | None
+    last_modified: str | None
+    stored_at: float
+
+    @property
+    def validators(self) -> dict[str, str]:
+        """Headers for a conditional request revalidating the response
+
+        Returns:
+            dict[str, str]: If-None-Match and If-Modified-Since headers
+        """
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+    def to_response(self, url: str) -> Response:
+        """Rebuilds a response from the cached body
+
+        Args:
+            url (str): URL of the request
+
+        Returns:
+            Response: Response with a 200 status code
+        """
+        response = Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = url
+        response.encoding = "utf-8"
+        response.headers = CaseInsensitiveDict({"Content-Type": "application/json"})
+        response._content = self.body  # pylint: disable=protected-access
+        return response
+
+
+class DiskCache:
+    """Persistent cache of GET responses shared by processes using the same file
+
+    Responses are served locally while younger than max_age. Older responses are \
+        revalidated with a conditional request when the server returned an ETag or \
+        Last-Modified header, so an unchanged resource costs a 304 response rather \
+        than the full body. The least recently used responses are evicted once the \
+        bodies stored exceed max_bytes.
+
+    Metabase does not send ETag or Last-Modified headers for most of its API, so \
+        the updated_at of each item is recorded as well. When a listing of items \
+        is streamed by the adapter, e.g. by cards.get(), the cached responses of \
+        the items listed are marked fresh if their updated_at is unchanged and \
+        dropped if it changed. Repeated runs fetching items by ID after a listing \
+        are then served locally.
+
+    The database uses write-ahead logging so several processes can read and write \
+        the cache at the same time. Responses are only keyed by URL and parameters, \
+        so use a separate cache file for each Metabase user.
+
+    Other responses are fetched again in full once older than max_age, and \
+        changes made outside the adapter can be served stale for up to max_age \
+        seconds unless a listing revalidated the item since.
+
+    Args:
+        path (Path | str, optional): SQLite database file, by default \
+            metabase_cache.sqlite
+        max_age (float, optional): Seconds a response is served without contacting \
+            the server, by default 60
+        max_bytes (int, optional): Maximum size of the response bodies stored, by \
+            default 256 MiB
+    """
+
+    def __init__(
+        self,
+        path: Path | str = "metabase_cache.sqlite",
+        max_age: float = 60,
+        max_bytes: int = 256 * 1024 * 1024,
+    ):
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+        self.path = Path(path).expanduser()
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self._local = local()
+        self._lock = Lock()
+        self._connections: list[sqlite3.Connection] = []
+        self.hits = 0
+        self.revalidations = 0
+        self.misses = 0
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Apply the size cap in case it was lowered since the cache was last used
+        self._evict(self._connection())
+
+    def _connection(self) -> sqlite3.Connection:
+        """SQLite connection of the current thread, opened on first use and again \
+            after the cache was closed
+
+        Returns:
+            sqlite3.Connection: Connection to the cache database
+        """
+        conn: sqlite3.Connection | None = getattr(self._local, "conn", None)
+        with self._lock:
+            if conn is not None and conn in self._connections:
+                return conn
+        # Only used by this thread, but close() may be called from another one
+        conn = sqlite3.connect(
+            self.path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.executescript(_SCHEMA)
+        self._migrate(conn)
+        self._local.conn = conn
+        with self._lock:
+            self._connections.append(conn)
+        return conn
+
+    @staticmethod
+    def _migrate(conn: sqlite3.Connection) -> None:
+        """Adds the updated_at column to caches created before it was recorded
+
+        Args:
+            conn (sqlite3.Connection): Connection to the cache database
+        """
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(responses)")}
+        if "updated_at" in columns:
+            return
+        try:
+            conn.execute("ALTER TABLE responses ADD COLUMN updated_at TEXT")
+        except sqlite3.OperationalError as error_raised:
+            # Another process added it first
+            if "duplicate column" not in str(error_raised):
+                raise
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    @staticmethod
+    def key(url: str, params: dict[str, Any] | None = None) -> str:
+        """Cache key of a request
+
+        Args:
+            url (str): URL of the request
+            params (dict, optional): Request parameters
+
+        Returns:
+            str: Cache key
+        """
+        request = dumps([url, params or {}], sort_keys=True, default=str)
+        return sha256(request.encode("utf-8")).hexdigest()
+
+    def lookup(self, key: str) -> tuple[CachedResponse | None, bool]:
+        """Finds a cached response
+
+        Args:
+            key (str): Cache key of the request
+
+        Returns:
+            tuple[CachedResponse | None, bool]: Cached response, if any, and whether \
+                it can be served without revalidation
+        """
+        conn = self._connection()
+        row = conn.execute(
+            "SELECT body, etag, last_modified, stored_at FROM responses WHERE key = ?",
+            (key,),
+        ).fetchone()
+        if row is None:
+            return None, False
+        conn.execute(
+            "UPDATE responses SET accessed_at = ? WHERE key = ?", (time(), key)
+        )
+        entry = CachedResponse(*row)
+        fresh = time() - entry.stored_at < self.max_age
+        if fresh:
+            self._count("hits")
+        return entry, fresh
+
+    def revalidated(self, key: str) -> None:
+        """Marks a cached response as confirmed unchanged by the server
+
+        Args:
+            key (str): Cache key of the request
+        """
+        self._count("revalidations")
+        self._connection().execute(
+            "UPDATE responses SET stored_at = ? WHERE key = ?", (time(), key)
+        )
+
+    def store(self, key: str, endpoint: str, response: Response) -> None:
+        """Stores a response and evicts the least recently used responses if the \
+            cache is over its size limit
+
+        Args:
+            key (str): Cache key of the request
+            endpoint (str): URL endpoint
+            response (Response): Response from the API
+        """
+        self._count("misses")
+        if self.max_age <= 0 and not (
+            response.headers.get("ETag") or response.headers.get("Last-Modified")
+        ):
+            # Nothing could ever be served from this response
+            return
+        body = response.content
+        now = time()
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO responses (
+                    key, endpoint, body, etag, last_modified, stored_at,
+                    accessed_at, size, updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    key,
+                    endpoint,
+                    body,
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                    now,
+                    now,
+                    len(body),
+                    self._updated_at(endpoint, body),
+                ),
+            )
+            self._evict(conn)
+            conn.execute("COMMIT")
+        except sqlite3.Error:
+            conn.execute("ROLLBACK")
+            raise
+
+    @staticmethod
+    def _updated_at(endpoint: str, body: bytes) -> str | None:
+        """Last update of the item in the response to a request for a single item
+
+        Args:
+            endpoint (str): URL endpoint
+            body (bytes): Response body
+
+        Returns:
+            str | None: updated_at of the item, None for other responses
+        """
+        if not _ITEM_ENDPOINT.fullmatch(endpoint):
+            return None
+        try:
+            record = loads(body)
+        except ValueError:
+            return None
+        updated_at = record.get("updated_at") if isinstance(record, dict) else None
+        return updated_at if isinstance(updated_at, str) else None
+
+    def revalidate_items(self, url: str, versions: Iterable[tuple[Any, Any]]) -> int:
+        """Marks the cached responses of items as fresh if their updated_at is the \
+            one listed by the server, and removes them if it changed
+
+        Args:
+            url (str): URL of the listing, e.g. http://localhost:3000/api/card
+            versions (Iterable[tuple[Any, Any]]): ID and updated_at of each item \
+                listed
+
+        Returns:
+            int: Cached responses marked fresh
+        """
+        now = time()
+        rows = [
+            (self.key(url=f"{url}/{item_id}"), updated_at)
+            for item_id, updated_at in versions
+            if isinstance(item_id, int) and isinstance(updated_at, str)
+        ]
+        if not rows:
+            return 0
+        conn = self._connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            revalidated = conn.executemany(
+                "UPDATE responses SET stored_at = ? WHERE key = ? AND updated_at = ?",
+                [(now, key, updated_at) for key, updated_at in rows],
+            ).rowcount
+            conn.executemany(
+                "DELETE FROM responses WHERE key = ? AND updated_at != ?", rows
+            )
+            conn.execute("COMMIT")
+        except sqlite3.Error:
+            conn.execute("ROLLBACK")
+            raise
+        with self._lock:
+            self.revalidations += revalidated
+        logger.debug("Revalidated %s cached items from %s", revalidated, url)
+        return revalidated
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        """Deletes the least recently used responses until the bodies stored fit \
+            in max_bytes
+
+        Args:
+            conn (sqlite3.Connection): Connection to the cache database
+        """
+        evicted = conn.execute(
+            """
+            DELETE FROM responses WHERE key IN (
+                SELECT key FROM (
+                    SELECT key, SUM(size) OVER (
+                        ORDER BY accessed_at DESC, key
+                    ) AS running_size
+                    FROM responses
+                ) WHERE running_size > ?
+            )
+            """,
+            (self.max_bytes,),
+        ).rowcount
+        if evicted:
+            logger.debug("Evicted %s responses from disk cache", evicted)
+
+    def invalidate(self, endpoint: str) -> None:
+        """Removes cached responses for the resource an endpoint belongs to
+
+        Args:
+            endpoint (str): URL endpoint that was changed
+        """
+        prefix = resource_prefix(endpoint)
+        self._connection().execute(
+            "DELETE FROM responses WHERE endpoint = ? OR endpoint LIKE ? ESCAPE '\\'",
+            (prefix, prefix.replace("%", "\\%").replace("_", "\\_") + "/%"),
+        )
+
+    def clear(self) -> None:
+        """Removes all cached responses"""
+        self._connection().execute("DELETE FROM responses")
+
+    def close(self) -> None:
+        """Closes the connections opened by every thread, which reopen their \
+            connection if they use the cache again"""
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for conn in connections:
+            conn.close()
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Cache statistics for this process
+
+        Returns:
+            dict[str, int]: Hits, revalidations, misses, entries and bytes stored
+        """
+        entries, size = (
+            self._connection()
+            .execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses")
+            .fetchone()
+        )
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "revalidations": self.revalidations,
+                "misses": self.misses,
+                "entries": entries,
+                "bytes": size,
+            }
@@ -0,0 +1,133 @@
+"""Concurrent, atomic writing of exported files
+"""
+
+from __future__ import annotations
+
+import os
+from logging import getLogger
+from pathlib import Path
+from queue import Queue
+from threading import Lock, Thread
+from types import TracebackType
+from uuid import uuid4
+
+logger = getLogger(__name__)
+
+
+def write_atomic(path: Path, content: str) -> None:
+    """Writes a file through a temporary file in the same folder renamed over the \
+        target, so readers never see a partially written file
+
+    Args:
+        path (Path): File written
+        content (str): Text written, encoded as UTF-8
+
+    Raises:
+        OSError: The file could not be written
+        UnicodeEncodeError: The text cannot be encoded as UTF-8
+    """
+    temp_path = path.with_name(f".{path.name}.{uuid4().hex}.tmp")
+    try:
+        with open(temp_path, "x", newline="", encoding="utf-8") as file:
+            file.write(content)
+        os.replace(temp_path, path)
+    except BaseException:
+        temp_path.unlink(missing_ok=True)
+        raise
+
+
+class FileWriterPool:
+    """Writes files in worker threads while the caller produces more of them
+
+    Files are queued with submit, which blocks once max_pending files are waiting \
+        so memory use stays bounded. Each folder is created once, the first time \
+        a file is written to it, and files are written atomically. Failures are \
+        logged and collected in errors instead of stopping the other writes.
+
+    Args:
+        max_workers (int, optional): Threads writing files, by default 4
+        max_pending (int, optional): Files queued before submit blocks, by default \
+            64
+
+    Raises:
+        ValueError: max_workers or max_pending is less than 1
+    """
+
+    def __init__(self, max_workers: int = 4, max_pending: int = 64):
+        if max_workers < 1 or max_pending < 1:
+            raise ValueError("max_workers and max_pending must be at least 1")
+        self._queue: Queue[tuple[Path, str] | None] = Queue(maxsize=max_pending)
+        self._folders: set[Path] = set()
+        self._lock = Lock()
+        self.errors: dict[Path, Exception] = {}
+        self.written = 0
+        self._closed = False
+        self._workers = [
+            Thread(target=self._work, name=f"file-writer-{number}", daemon=True)
+            for number in range(max_workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def _ensure_folder(self, folder: Path) -> None:
+        with self._lock:
+            if folder in self._folders:
+                return
+            folder.mkdir(parents=True, exist_ok=True)
+            self._folders.add(folder)
+
+    def _work(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                path, content = item
+                try:
+                    self._ensure_folder(path.parent)
+                    write_atomic(path, content)
+                # Any failure, e.g. text that cannot be encoded, only loses this file
+                except Exception as error:  # pylint: disable=broad-exception-caught
+                    logger.warning("Unable to write %s: %s", path, error)
+                    with self._lock:
+                        self.errors[path] = error
+                else:
+                    logger.debug("Saved %s", path)
+                    with self._lock:
+                        self.written += 1
+            finally:
+                self._queue.task_done()
+
+    def submit(self, path: Path | str, content: str) -> None:
+        """Queues a file to be written, waiting if max_pending files are queued
+
+        Args:
+            path (Path | str): File written
+            content (str): Text written, encoded as UTF-8
+        """
+        self._queue.put((Path(path), content))
+
+    def close(self) -> dict[Path, Exception]:
+        """Waits for the queued files to be written and stops the workers
+
+        Returns:
+            dict[Path, Exception]: Files that could not be written and the error raised
+        """
+        if not self._closed:
+            self._closed = True
+            for _ in self._workers:
+                self._queue.put(None)
+        for worker in self._workers:
+            worker.join()
+        return self.errors
+
+    def __enter__(self) -> FileWriterPool:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self.close()
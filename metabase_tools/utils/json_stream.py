@@ -0,0 +1,164 @@
+"""Incremental parsing of JSON lists returned by the Metabase API
+"""
+
+from __future__ import annotations
+
+from codecs import getincrementaldecoder
+from collections.abc import Iterable, Iterator
+from json import JSONDecodeError, JSONDecoder
+from typing import Any
+
+_WHITESPACE = " \t\n\r"
+_NUMBER = "0123456789.eE+-"
+
+
+class _Reader:
+    """Buffer over chunks of a JSON document that only keeps the unparsed text"""
+
+    def __init__(self, chunks: Iterable[bytes]):
+        self._chunks = iter(chunks)
+        self._decoder = getincrementaldecoder("utf-8")()
+        self._json = JSONDecoder()
+        self._exhausted = False
+        self.buffer = ""
+        self.pos = 0
+
+    def _fill(self, min_size: int = 1) -> bool:
+        """Reads chunks until at least min_size unparsed characters are buffered
+
+        Args:
+            min_size (int, optional): Minimum unparsed characters wanted
+
+        Returns:
+            bool: False if the document was already exhausted
+        """
+        if self._exhausted:
+            return False
+        start, self.pos = self.pos, 0
+        self.buffer = self.buffer[start:]
+        parts = [self.buffer]
+        size = len(self.buffer)
+        while size < min_size:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                parts.append(self._decoder.decode(b"", final=True))
+                self._exhausted = True
+                break
+            text = self._decoder.decode(chunk)
+            parts.append(text)
+            size += len(text)
+        self.buffer = "".join(parts)
+        return True
+
+    def peek(self) -> str:
+        """Next character that is not whitespace, without consuming it
+
+        Returns:
+            str: Next character, or an empty string at the end of the document
+        """
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill(min_size=1):
+                return ""
+
+    def expect(self, char: str) -> None:
+        """Consumes the next character that is not whitespace
+
+        Args:
+            char (str): Character expected
+
+        Raises:
+            JSONDecodeError: A different character was found
+        """
+        if self.peek() != char:
+            raise JSONDecodeError(f"Expected {char!r}", self.buffer, self.pos)
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Parses the next complete JSON value
+
+        Returns:
+            Any: Parsed value
+        """
+        self.peek()
+        while True:
+            try:
+                value, end = self._json.raw_decode(self.buffer, self.pos)
+            except JSONDecodeError:
+                # The value is incomplete, read at least as much again
+                if not self._fill(min_size=2 * (len(self.buffer) - self.pos) + 1):
+                    raise
+                continue
+            # A number cut off by the end of a chunk parses as a shorter number
+            if (
+                isinstance(value, (int, float))
+                and (end == len(self.buffer) or self.buffer[end] in _NUMBER)
+                and self._fill(min_size=len(self.buffer) - self.pos + 1)
+            ):
+                continue
+            self.pos = end
+            return value
+
+    def array(self) -> Iterator[Any]:
+        """Yields the values of a JSON array one at a time
+
+        Yields:
+            Any: Parsed values
+        """
+        self.expect("[")
+        if self.peek() == "]":
+            self.pos += 1
+            return
+        while True:
+            yield self.value()
+            separator = self.peek()
+            self.pos += 1
+            if separator == "]":
+                return
+            if separator != ",":
+                raise JSONDecodeError("Expected ',' or ']'", self.buffer, self.pos - 1)
+
+
+def iter_json_list(chunks: Iterable[bytes], key: str = "data") -> Iterator[Any]:
+    """Yields the records of a JSON list as the document is received
+
+    The document can either be a list or an object with the list under key, \
+        such as the paginated responses of newer versions of Metabase. Only the \
+        record being parsed is held in memory.
+
+    Args:
+        chunks (Iterable[bytes]): Chunks of a UTF-8 encoded JSON document
+        key (str, optional): Key of the list when the document is an object, by \
+            default "data"
+
+    Raises:
+        JSONDecodeError: The document is not valid JSON or does not contain a list
+
+    Yields:
+        Any: Records of the list
+    """
+    reader = _Reader(chunks)
+    if reader.peek() == "[":
+        yield from reader.array()
+        return
+
+    reader.expect("{")
+    found = False
+    while reader.peek() != "}":
+        name = reader.value()
+        reader.expect(":")
+        if name == key and reader.peek() == "[":
+            found = True
+            yield from reader.array()
+        else:
+            _ = reader.value()
+        separator = reader.peek()
+        if separator == ",":
+            reader.pos += 1
+        elif separator != "}":
+            raise JSONDecodeError("Expected ',' or '}'", reader.buffer, reader.pos)
+    if not found:
+        raise JSONDecodeError(f"No list found under {key!r}", reader.buffer, reader.pos)
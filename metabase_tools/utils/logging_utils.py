@@ -1,17 +1,59 @@
 """Module for common tools used throughout the project
 """
 
-from collections.abc import Callable
+from collections.abc import Callable, Mapping, Sequence
 from functools import wraps
-from logging import Logger, getLogger
-from typing import Any, TypeVar, cast
+from logging import DEBUG, Logger, getLogger
+from reprlib import Repr
+from typing import Any, NamedTuple, TypeVar, cast
+
+from pydantic import BaseModel
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+MAX_LOGGED_LENGTH = 500
+"""Maximum number of characters logged for each argument and return value"""
+
+
+class _ShortRepr(Repr):
+    """Repr that renders models as their class name and id, since the full repr \
+        of a model is built before reprlib can truncate it"""
+
+    def repr_instance(self, x: Any, level: int) -> str:
+        if isinstance(x, BaseModel):
+            item_id = getattr(x, "id", None)
+            name = type(x).__name__
+            return f"{name}(id={item_id!r})" if item_id is not None else f"{name}(...)"
+        return super().repr_instance(x, level)
+
+
+_repr = _ShortRepr()
+_repr.maxstring = MAX_LOGGED_LENGTH
+_repr.maxother = MAX_LOGGED_LENGTH
+_repr.maxlist = _repr.maxtuple = _repr.maxdict = _repr.maxset = 10
+
+
+class _Rendered(NamedTuple):
+    """Defers rendering values for a log record until the record is formatted, \
+        capping the length of each value rendered"""
+
+    values: Sequence[Any] | Mapping[str, Any]
+    separator: str
+
+    def __str__(self) -> str:
+        if isinstance(self.values, Mapping):
+            return self.separator.join(
+                f"{key}: {_repr.repr(value)}" for key, value in self.values.items()
+            )
+        return self.separator.join(_repr.repr(value) for value in self.values)
+
 
 def log_details(logger: Logger, func: F, *args: Any, **kwargs: Any) -> F:
     """Logs details of a function call
 
+    Arguments and the return value are only rendered if debug logging is enabled \
+        and are truncated to MAX_LOGGED_LENGTH characters.
+
     Args:
         logger (logging.Logger)
         func (F)
@@ -20,25 +62,27 @@ def log_details(logger: Logger, func: F, *args: Any, **kwargs: Any) -> F:
         F
     """
     logger = logger or getLogger(func.__module__)
+    if not logger.isEnabledFor(DEBUG):
+        return cast(F, func(*args, **kwargs))
     logger.debug(
         "%s called\n\targs: %s\n\tkwargs: %s",
         func.__name__,
-        "\n\t\t".join([str(s) for s in args]),
-        "\n\t\t".join(
-            [f"{key}: {value}" for key, value in kwargs.items()],
-        ),
+        _Rendered(args, "\n\t\t"),
+        _Rendered(kwargs, "\n\t\t"),
     )
     return_ = func(*args, **kwargs)
-    logger.debug("Returning: %s", return_)
+    logger.debug("Returning: %s", _Rendered((return_,), ""))
     return cast(F, return_)
 
 
 def log_call(func: F) -> F:
     """Used to log calls to the function provided"""
+    logger = getLogger(func.__module__)
 
     @wraps(func)
     def wrapper(*args, **kwargs):  # type: ignore
-        logger = getLogger(func.__module__)
+        if not logger.isEnabledFor(DEBUG):
+            return func(*args, **kwargs)
         return log_details(logger, func, *args, **kwargs)
 
     return cast(F, wrapper)
@@ -46,10 +90,10 @@ def log_call(func: F) -> F:
 
 def untested(func: F) -> F:
     """Used to log a warning that the decorated function has not been tested"""
+    logger = getLogger(func.__module__)
 
     @wraps(func)
     def wrapper(*args, **kwargs):  # type: ignore
-        logger = getLogger(func.__module__)
         logger.warning("Calling untested function: %s", func.__name__)
         return log_details(logger, func, *args, **kwargs)
 
@@ -0,0 +1,49 @@
+"""Conversions of the values held in the fields of models
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from pydantic import BaseModel
+from pydantic.json import pydantic_encoder
+
+_JSON_TYPES = (str, int, float, bool, type(None))
+
+
+def dict_value(value: Any) -> Any:
+    """Converts a value to how it appears in the dict of an object
+
+    Args:
+        value (Any): Value of a field
+
+    Returns:
+        Any: Value as returned by BaseModel.dict
+    """
+    if isinstance(value, BaseModel):
+        return value.dict()
+    if isinstance(value, list):
+        return [dict_value(item) for item in value]
+    if isinstance(value, dict):
+        return {key: dict_value(item) for key, item in value.items()}
+    return value
+
+
+def json_value(value: Any) -> Any:
+    """Converts a value from the dict of an object to types that every JSON \
+        codec can encode
+
+    Args:
+        value (Any): Value as returned by BaseModel.dict
+
+    Returns:
+        Any: Value made of dicts, lists, strings, numbers, booleans and None, as \
+            BaseModel.json would encode it
+    """
+    if isinstance(value, _JSON_TYPES):
+        return value
+    if isinstance(value, dict):
+        return {key: json_value(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [json_value(item) for item in value]
+    return json_value(pydantic_encoder(value))
@@ -0,0 +1,175 @@
+"""Iteration over paginated listings of the Metabase API
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Generic, NamedTuple, TypeVar
+
+R = TypeVar("R")
+S = TypeVar("S")
+
+
+class Page(NamedTuple):
+    """Page of a listing
+
+    Attributes:
+        data: Records of the page
+        total: Number of records in the whole listing, if returned by the server
+        limit: Maximum number of records in a page, None if the server did not \
+            paginate the listing
+        offset: Number of records before the page
+    """
+
+    data: list[Any]
+    total: int | None
+    limit: int | None
+    offset: int | None
+
+    @classmethod
+    def from_response(cls, response: Any) -> Page:
+        """Builds a page from a response of the API
+
+        Args:
+            response (Any): Either an envelope with the records under data or a \
+                list of records from an endpoint that does not paginate
+
+        Raises:
+            TypeError: Response is not a list or an envelope
+
+        Returns:
+            Page: Page of the listing
+        """
+        if isinstance(response, list):
+            return cls(data=response, total=len(response), limit=None, offset=None)
+        if isinstance(response, dict) and isinstance(response.get("data"), list):
+            return cls(
+                data=response["data"],
+                total=response.get("total"),
+                limit=response.get("limit"),
+                offset=response.get("offset"),
+            )
+        raise TypeError(f"Expected list or paginated dict, received {type(response)}")
+
+
+class Pager(Generic[R]):
+    """Iterates over a listing one page at a time
+
+    Pages are requested as iteration reaches them. With prefetch, the next page \
+        is requested in a worker thread while the records of the current page \
+        are consumed. Iteration stops at the end of the listing or after the first \
+        page if the server did not paginate it.
+
+    Args:
+        fetch (Callable[[int, int], Page]): Requests the page for a limit and \
+            an offset
+        transform (Callable[[Any], R]): Builds the value yielded for each record
+        page_size (int, optional): Records requested per page, by default 50
+        prefetch (bool, optional): Request the next page while the current one \
+            is consumed, by default False
+
+    Raises:
+        ValueError: page_size is less than 1
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[int, int], Page],
+        transform: Callable[[Any], R],
+        page_size: int = 50,
+        prefetch: bool = False,
+    ):
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+        self._fetch = fetch
+        self._transform = transform
+        self.page_size = page_size
+        self.prefetch = prefetch
+        self._first: Page | None = None
+        self._total: int | None = None
+
+    @property
+    def total(self) -> int | None:
+        """Number of records in the listing, requesting the first page if needed
+
+        Returns:
+            int | None: Total reported by the server, None if it was not reported
+        """
+        if self._first is None and self._total is None:
+            self._first = self._get(0)
+        return self._total
+
+    def _get(self, offset: int) -> Page:
+        page = self._fetch(self.page_size, offset)
+        if page.total is not None:
+            self._total = page.total
+        return page
+
+    def _has_more(self, page: Page, offset: int) -> bool:
+        """Whether there are records after a page
+
+        Args:
+            page (Page): Page received
+            offset (int): Offset of the page
+
+        Returns:
+            bool
+        """
+        if page.limit is None or len(page.data) == 0:
+            return False
+        if page.total is not None:
+            return offset + len(page.data) < page.total
+        return len(page.data) >= self.page_size
+
+    def pages(self) -> Iterator[Page]:
+        """Yields the pages of the listing
+
+        Yields:
+            Page: Pages in order
+        """
+        page, self._first = self._first or self._get(0), None
+        offset = 0
+        if not self.prefetch:
+            while True:
+                yield page
+                if not self._has_more(page, offset):
+                    return
+                offset += len(page.data)
+                page = self._get(offset)
+
+        executor = ThreadPoolExecutor(max_workers=1)
+        try:
+            while True:
+                upcoming: Future[Page] | None = None
+                if self._has_more(page, offset):
+                    offset += len(page.data)
+                    upcoming = executor.submit(self._get, offset)
+                yield page
+                if upcoming is None:
+                    return
+                page = upcoming.result()
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def map(self, transform: Callable[[R], S]) -> Pager[S]:
+        """Pager over the same listing with another transform applied to each value
+
+        Args:
+            transform (Callable[[R], S]): Builds the new value from the current one
+
+        Returns:
+            Pager[S]: Pager yielding the new values
+        """
+        current = self._transform
+        return Pager(
+            fetch=self._fetch,
+            transform=lambda record: transform(current(record)),
+            page_size=self.page_size,
+            prefetch=self.prefetch,
+        )
+
+    def __iter__(self) -> Iterator[R]:
+        for page in self.pages():
+            for record in page.data:
+                yield self._transform(record)
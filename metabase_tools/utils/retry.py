@@ -0,0 +1,178 @@
+"""Retry policy for transient failures of requests to the Metabase API
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from random import SystemRandom
+from threading import Lock
+from typing import Protocol
+
+from pydantic import BaseModel
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import RequestException, Timeout
+
+_random = SystemRandom()
+
+
+class ResponseLike(Protocol):
+    """Parts of a response the policy reads, so responses of requests and of \
+        httpx are both accepted"""
+
+    @property
+    def status_code(self) -> int:
+        """Status code of the response"""
+
+    @property
+    def headers(self) -> Mapping[str, str]:
+        """Headers of the response"""
+
+
+class RetryPolicy(BaseModel):
+    """Settings for retrying requests that failed for transient reasons
+
+    Attributes:
+        max_retries (int): Maximum retries of a single request, by default 3
+        backoff_factor (float): Base delay in seconds, doubled on every retry, by \
+            default 0.5
+        max_backoff (float): Maximum delay in seconds between attempts, by \
+            default 30
+        jitter (bool): Randomise each delay between 0 and the computed backoff, by \
+            default True
+        retry_statuses (set[int]): Status codes that are retried, by default 429, \
+            502, 503 and 504
+        retry_methods (set[str]): HTTP verbs that are safe to retry, by default \
+            GET, PUT and DELETE. Add POST to opt in to retrying POST requests.
+        respect_retry_after (bool): Wait for the delay requested by the server in \
+            a Retry-After header, by default True
+        max_retry_after (float): Maximum delay in seconds accepted from a \
+            Retry-After header, by default 60
+        budget_ratio (float): Retries earned by every request for the adapter-wide \
+            retry budget, by default 0.2 (i.e. 1 retry per 5 requests)
+        budget_reserve (float): Retries available before any have been earned and \
+            the maximum that can be saved up, by default 10
+    """
+
+    max_retries: int = 3
+    backoff_factor: float = 0.5
+    max_backoff: float = 30
+    jitter: bool = True
+    retry_statuses: set[int] = {429, 502, 503, 504}
+    retry_methods: set[str] = {"GET", "PUT", "DELETE"}
+    respect_retry_after: bool = True
+    max_retry_after: float = 60
+    budget_ratio: float = 0.2
+    budget_reserve: float = 10
+
+    def is_retryable_method(self, method: str) -> bool:
+        """Checks if requests using the HTTP verb may be retried
+
+        Args:
+            method (str): HTTP verb
+
+        Returns:
+            bool: True if the verb is retryable
+        """
+        return method.upper() in self.retry_methods
+
+    def is_retryable_response(self, response: ResponseLike) -> bool:
+        """Checks if the status code of a response is retryable
+
+        Args:
+            response (ResponseLike): Response from the API
+
+        Returns:
+            bool: True if the status code is retryable
+        """
+        return response.status_code in self.retry_statuses
+
+    @staticmethod
+    def is_retryable_error(error: RequestException) -> bool:
+        """Checks if an exception raised while sending a request is retryable
+
+        Args:
+            error (RequestException): Exception raised by requests
+
+        Returns:
+            bool: True for connection errors and timeouts
+        """
+        return isinstance(error, (RequestsConnectionError, Timeout))
+
+    def backoff(self, retry_number: int) -> float:
+        """Exponential backoff with optional full jitter
+
+        Args:
+            retry_number (int): Number of retries already made for the request
+
+        Returns:
+            float: Seconds to wait before the next attempt
+        """
+        delay: float = min(self.max_backoff, self.backoff_factor * 2**retry_number)
+        if self.jitter:
+            return _random.uniform(0, delay)
+        return delay
+
+    def retry_after(self, response: ResponseLike) -> float | None:
+        """Delay requested by the server in the Retry-After header
+
+        Args:
+            response (ResponseLike): Response from the API
+
+        Returns:
+            float | None: Seconds to wait, or None if the header is missing or invalid
+        """
+        header = response.headers.get("Retry-After")
+        if not self.respect_retry_after or header is None:
+            return None
+        try:
+            delay = float(header)
+        except ValueError:
+            try:
+                retry_at = parsedate_to_datetime(header)
+            except (TypeError, ValueError):
+                return None
+            if retry_at.tzinfo is None:
+                retry_at = retry_at.replace(tzinfo=timezone.utc)
+            delay = (retry_at - datetime.now(timezone.utc)).total_seconds()
+        return min(max(delay, 0), self.max_retry_after)
+
+
+class RetryBudget:
+    """Limits retries across all requests of an adapter to a fraction of the \
+        requests made, so that retries cannot multiply the load on a server that is \
+        already struggling
+    """
+
+    def __init__(self, ratio: float, reserve: float):
+        self._lock = Lock()
+        self.ratio = ratio
+        self.reserve = reserve
+        self._balance = reserve
+
+    @property
+    def balance(self) -> float:
+        """Retries currently available
+
+        Returns:
+            float: Available retries
+        """
+        return self._balance
+
+    def deposit(self) -> None:
+        """Earns retries for a request that was sent"""
+        with self._lock:
+            self._balance = min(self._balance + self.ratio, self.reserve)
+
+    def withdraw(self) -> bool:
+        """Spends one retry if the budget allows it
+
+        Returns:
+            bool: True if the retry may proceed
+        """
+        with self._lock:
+            if self._balance >= 1:
+                self._balance -= 1
+                return True
+            return False
@@ -0,0 +1,204 @@
+"""In-memory index for searching lists of Metabase objects
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from typing import Any, Generic, NamedTuple, TypeVar
+
+from pydantic import BaseModel
+
+from metabase_tools.utils.model_values import dict_value
+
+T = TypeVar("T", bound=BaseModel)
+
+
+class _FieldIndex(NamedTuple):
+    """Positions of the items holding each value of a field
+
+    Attributes:
+        buckets: Positions of the items for each hashable value
+        unhashable: Position and value of the items with unhashable values
+    """
+
+    buckets: dict[Any, list[int]]
+    unhashable: list[tuple[int, Any]]
+
+
+class _PrefixIndex(NamedTuple):
+    """Casefolded text values of a field in sorted order
+
+    Attributes:
+        keys: Casefolded values, sorted
+        positions: Position of the item holding each value in keys
+    """
+
+    keys: list[str]
+    positions: list[int]
+
+
+class SearchIndex(Generic[T]):
+    """Index of a list of objects for repeated lookups by field values
+
+    The index for a field is built the first time the field is searched, so \
+        the cost of building it is shared by every following lookup. Fields are \
+        read as attributes and only the fields searched are read. Changes made to \
+        the objects after a field is indexed are not reflected in the index.
+
+    Args:
+        items (Iterable[T]): Objects to index
+    """
+
+    def __init__(self, items: Iterable[T]):
+        self._items = list(items)
+        self._fields: dict[str, _FieldIndex] = {}
+        self._prefixes: dict[str, _PrefixIndex] = {}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self) -> Iterator[T]:
+        return iter(self._items)
+
+    def __getitem__(self, position: int) -> T:
+        return self._items[position]
+
+    def _values(self, field: str) -> Iterator[tuple[int, Any]]:
+        """Position and value of each item that has the field
+
+        Args:
+            field (str): Name of the field
+
+        Yields:
+            tuple[int, Any]: Position of the item and value of its field
+        """
+        for position, item in enumerate(self._items):
+            if field in item.__fields__:
+                yield position, dict_value(getattr(item, field))
+
+    def _field_index(self, field: str) -> _FieldIndex:
+        """Index of a field, built on first use
+
+        Args:
+            field (str): Name of the field
+
+        Returns:
+            _FieldIndex: Index of the field
+        """
+        index = self._fields.get(field)
+        if index is None:
+            index = _FieldIndex(buckets={}, unhashable=[])
+            for position, value in self._values(field):
+                try:
+                    index.buckets.setdefault(value, []).append(position)
+                except TypeError:
+                    index.unhashable.append((position, value))
+            self._fields[field] = index
+        return index
+
+    def positions(self, field: str, value: Any) -> list[int]:
+        """Positions of the objects with a field equal to value
+
+        Args:
+            field (str): Name of the field
+            value (Any): Value searched for
+
+        Returns:
+            list[int]: Positions of the matching objects, in ascending order
+        """
+        index = self._field_index(field)
+        try:
+            return list(index.buckets.get(value, ()))
+        except TypeError:
+            return [
+                position
+                for position, candidate in index.unhashable
+                if candidate == value
+            ]
+
+    def lookup(self, field: str, value: Any) -> list[T]:
+        """Objects with a field equal to value
+
+        Args:
+            field (str): Name of the field
+            value (Any): Value searched for
+
+        Returns:
+            list[T]: Matching objects, in the order they were indexed
+        """
+        return [self._items[position] for position in self.positions(field, value)]
+
+    def find(self, criteria: Mapping[str, Any]) -> list[T]:
+        """Objects matching all of the criteria
+
+        Args:
+            criteria (Mapping[str, Any]): Values searched for by field name
+
+        Returns:
+            list[T]: Matching objects, in the order they were indexed
+        """
+        if len(criteria) == 0:
+            return list(self._items)
+        matches = sorted(
+            (self.positions(field, value) for field, value in criteria.items()),
+            key=len,
+        )
+        found = set(matches[0])
+        for positions in matches[1:]:
+            found.intersection_update(positions)
+        return [self._items[position] for position in sorted(found)]
+
+    def match_each(self, search_params: Sequence[Mapping[str, Any]]) -> list[T]:
+        """Objects matching the criteria of each dict, once for every criterion \
+            matched
+
+        Args:
+            search_params (Sequence[Mapping[str, Any]]): Values searched for by \
+                field name, one mapping per search
+
+        Returns:
+            list[T]: Matching objects of each search, in the order they were indexed
+        """
+        results = []
+        for param in search_params:
+            matches = Counter(
+                position
+                for field, value in param.items()
+                for position in self.positions(field, value)
+            )
+            for position in sorted(matches):
+                results.extend([self._items[position]] * matches[position])
+        return results
+
+    def prefix(self, text: str, field: str = "name") -> list[T]:
+        """Objects with a text field starting with text, ignoring case
+
+        Args:
+            text (str): Start of the value searched for
+            field (str, optional): Name of the field, by default "name"
+
+        Returns:
+            list[T]: Matching objects, in the order they were indexed
+        """
+        index = self._prefixes.get(field)
+        if index is None:
+            pairs = sorted(
+                (value.casefold(), position)
+                for position, value in self._values(field)
+                if isinstance(value, str)
+            )
+            index = _PrefixIndex(
+                keys=[key for key, _ in pairs],
+                positions=[position for _, position in pairs],
+            )
+            self._prefixes[field] = index
+
+        text = text.casefold()
+        found = []
+        for i in range(bisect_left(index.keys, text), len(index.keys)):
+            if not index.keys[i].startswith(text):
+                break
+            found.append(index.positions[i])
+        return [self._items[position] for position in sorted(found)]
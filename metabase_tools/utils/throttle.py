@@ -0,0 +1,142 @@
+"""Client-side throttling of requests to the Metabase API
+"""
+
+from __future__ import annotations
+
+from logging import getLogger
+from threading import Condition, Lock
+from time import monotonic, sleep
+
+logger = getLogger(__name__)
+
+
+class RateLimiter:
+    """Token bucket limiting the rate of requests
+
+    Tokens are added at a fixed rate up to the size of the bucket and every request \
+        spends one token, so short bursts are allowed while the average rate is capped.
+
+    Args:
+        rate (float): Requests allowed per second
+        burst (int, optional): Maximum requests sent back to back, by default the \
+            rate rounded up
+    """
+
+    def __init__(self, rate: float, burst: int | None = None):
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0")
+        self.rate = rate
+        self.burst = burst or max(int(rate + 0.999), 1)
+        self._tokens = float(self.burst)
+        self._updated = monotonic()
+        self._lock = Lock()
+
+    def _refill(self) -> None:
+        now = monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """Spends a token without blocking, borrowing against future tokens when \
+            the bucket is empty so that callers are served in order
+
+        Returns:
+            float: Seconds to wait before sending the request
+        """
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            return max(-self._tokens / self.rate, 0.0)
+
+    def acquire(self) -> float:
+        """Blocks until a request may be sent
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        delay = self.reserve()
+        if delay:
+            sleep(delay)
+        return delay
+
+
+class AdaptiveConcurrencyLimiter:
+    """Limits concurrent requests with additive increase, multiplicative decrease
+
+    The limit grows by roughly one request per round trip while responses are fast \
+        and successful and is cut by backoff_ratio when a response is slower than \
+        latency_target or the server reports an error or throttling (5xx or 429).
+
+    Args:
+        initial_limit (int, optional): Starting concurrency limit, by default 4
+        min_limit (int, optional): Lowest concurrency limit, by default 1
+        max_limit (int, optional): Highest concurrency limit, by default 64
+        latency_target (float, optional): Slowest response time in seconds treated \
+            as healthy, by default 1.0
+        backoff_ratio (float, optional): Factor applied to the limit when the server \
+            is overloaded, by default 0.5
+    """
+
+    def __init__(
+        self,
+        initial_limit: int = 4,
+        min_limit: int = 1,
+        max_limit: int = 64,
+        latency_target: float = 1.0,
+        backoff_ratio: float = 0.5,
+    ):
+        if not 1 <= min_limit <= initial_limit <= max_limit:
+            raise ValueError("Expected 1 <= min_limit <= initial_limit <= max_limit")
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.latency_target = latency_target
+        self.backoff_ratio = backoff_ratio
+        self._limit = float(initial_limit)
+        self._in_flight = 0
+        self._last_decrease = 0.0
+        self._condition = Condition()
+
+    @property
+    def limit(self) -> int:
+        """Current concurrency limit
+
+        Returns:
+            int: Maximum requests in flight
+        """
+        return max(int(self._limit), self.min_limit)
+
+    @property
+    def in_flight(self) -> int:
+        """Requests currently in flight
+
+        Returns:
+            int: Requests in flight
+        """
+        return self._in_flight
+
+    def acquire(self) -> None:
+        """Blocks until the number of requests in flight is below the limit"""
+        with self._condition:
+            self._condition.wait_for(lambda: self._in_flight < self.limit)
+            self._in_flight += 1
+
+    def release(self, latency: float, overloaded: bool) -> None:
+        """Records the outcome of a request and adjusts the limit
+
+        Args:
+            latency (float): Seconds the request took
+            overloaded (bool): The server returned an error or throttled the request
+        """
+        with self._condition:
+            self._in_flight -= 1
+            now = monotonic()
+            if overloaded or latency > self.latency_target:
+                # Only back off once per round trip so a burst of slow responses to
+                # requests sent under the old limit does not collapse the limit
+                if now - self._last_decrease >= latency:
+                    self._limit = max(self._limit * self.backoff_ratio, self.min_limit)
+                    self._last_decrease = now
+                    logger.debug("Concurrency limit decreased to %s", self.limit)
+            else:
+                self._limit = min(self._limit + 1 / self._limit, self.max_limit)
+            self._condition.notify_all()
@@ -0,0 +1,174 @@
+"""HTTP transport configuration and connection pool instrumentation"""
+
+from __future__ import annotations
+
+from threading import Lock
+from typing import Any
+
+from pydantic import BaseModel
+from requests import PreparedRequest, Response, Session
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from metabase_tools.utils.retry import RetryPolicy
+from metabase_tools.utils.throttle import AdaptiveConcurrencyLimiter, RateLimiter
+
+
+class TransportConfig(BaseModel, arbitrary_types_allowed=True):
+    """Settings for how requests are sent to the Metabase URL: the connection \
+        pool, timeouts, retries and throttles
+
+    Attributes:
+        pool_connections (int): Number of host pools to keep, by default 10
+        pool_maxsize (int): Maximum number of connections kept open per host, by \
+            default 10
+        pool_block (bool): Wait for a free connection rather than opening a \
+            connection that will be discarded when the pool is full, by default False
+        connect_timeout (float): Seconds to wait for a connection, by default 30
+        read_timeout (float): Seconds to wait for a response, by default 30
+        keep_alive (bool): Reuse connections between requests, by default True. \
+            When False, each request sent through the pool asks the server to \
+            close its connection
+        retry_policy (RetryPolicy, optional): Retry transient failures, by default \
+            requests are not retried
+        rate_limiter (RateLimiter, optional): Cap the rate of requests, by default \
+            unlimited
+        concurrency_limiter (AdaptiveConcurrencyLimiter, optional): Limit \
+            concurrent requests, by default only limited by max_workers
+    """
+
+    pool_connections: int = 10
+    pool_maxsize: int = 10
+    pool_block: bool = False
+    connect_timeout: float = 30
+    read_timeout: float = 30
+    keep_alive: bool = True
+    retry_policy: RetryPolicy | None = None
+    rate_limiter: RateLimiter | None = None
+    concurrency_limiter: AdaptiveConcurrencyLimiter | None = None
+
+    @property
+    def timeout(self) -> tuple[float, float]:
+        """Connect and read timeouts in the format expected by requests
+
+        Returns:
+            tuple[float, float]: Connect timeout and read timeout
+        """
+        return (self.connect_timeout, self.read_timeout)
+
+
+class ConnectionStats:
+    """Thread-safe counters of requests sent and connections opened"""
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self.requests = 0
+        self.new_connections = 0
+
+    def record_request(self) -> None:
+        """Counts a request sent through the pool"""
+        with self._lock:
+            self.requests += 1
+
+    def record_new_connection(self) -> None:
+        """Counts a connection opened by the pool"""
+        with self._lock:
+            self.new_connections += 1
+
+    @property
+    def reused_connections(self) -> int:
+        """Requests that were sent on a connection that was already open
+
+        Returns:
+            int: Number of reused connections
+        """
+        return max(self.requests - self.new_connections, 0)
+
+    def as_dict(self) -> dict[str, int]:
+        """Snapshot of the counters
+
+        Returns:
+            dict[str, int]: Requests, new connections and reused connections
+        """
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "new_connections": self.new_connections,
+                "reused_connections": self.reused_connections,
+            }
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter configured from a TransportConfig that counts connection reuse"""
+
+    def __init__(self, config: TransportConfig) -> None:
+        self.transport = config
+        self.stats = ConnectionStats()
+        super().__init__(
+            pool_connections=config.pool_connections,
+            pool_maxsize=config.pool_maxsize,
+            pool_block=config.pool_block,
+        )
+
+    def init_poolmanager(
+        self, connections: int, maxsize: int, block: bool = False, **pool_kwargs: Any
+    ) -> None:
+        super().init_poolmanager(connections, maxsize, block, **pool_kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _counting_pool(HTTPConnectionPool, self.stats),
+            "https": _counting_pool(HTTPSConnectionPool, self.stats),
+        }
+
+    def send(self, request: PreparedRequest, *args: Any, **kwargs: Any) -> Response:
+        self.stats.record_request()
+        if not self.transport.keep_alive:
+            request.headers["Connection"] = "close"
+        return super().send(request, *args, **kwargs)
+
+
+def has_custom_adapter(session: Session, url: str) -> bool:
+    """Checks whether the adapter that serves url was mounted by the owner of the \
+        session rather than being one of the defaults of requests
+
+    Args:
+        session (Session): Session to inspect
+        url (str): URL the adapter would be used for
+
+    Returns:
+        bool: True if a prefix more specific than the scheme, or an adapter other \
+            than a plain HTTPAdapter, serves url
+    """
+    adapter = session.get_adapter(url)
+    prefix = next(
+        prefix for prefix in session.adapters if url.lower().startswith(prefix.lower())
+    )
+    return prefix not in ("http://", "https://") or adapter.__class__ is not HTTPAdapter
+
+
+def _counting_pool(
+    base: type[HTTPConnectionPool], stats: ConnectionStats
+) -> type[HTTPConnectionPool]:
+    """Creates a connection pool class whose connections report every new socket \
+        (including reconnects of dropped connections) to stats
+
+    Args:
+        base (type[HTTPConnectionPool]): Pool class to extend
+        stats (ConnectionStats): Counters to update
+
+    Returns:
+        type[HTTPConnectionPool]: Instrumented pool class
+    """
+    connection_cls = base.ConnectionCls
+
+    def connect(self: Any) -> None:
+        stats.record_new_connection()
+        connection_cls.connect(self)
+
+    counting_connection_cls = type(
+        f"Counting{connection_cls.__name__}", (connection_cls,), {"connect": connect}
+    )
+    return type(
+        f"Counting{base.__name__}",
+        (base,),
+        {"ConnectionCls": counting_connection_cls},
+    )
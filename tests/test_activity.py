@@ -37,6 +37,13 @@ class TestEndpointMethodsCommonPass:
             for item in result
         )  # check adapter initialized
 
+    def test_iter_get(self, api: MetabaseApi):
+        result = list(api.activity.iter_get())
+        assert all(
+            isinstance(item, ActivityItem) for item in result
+        )  # check item class
+        assert len(result) == len(api.activity.get())  # check action result
+
     def test_search(self, api: MetabaseApi):
         result = api.activity.search({"database_id": 1})
         assert isinstance(result, list)  # check item class
@@ -2,9 +2,11 @@ from pathlib import Path
 
 import pytest
 from packaging.version import Version
+from requests import Session
+from requests.adapters import HTTPAdapter
 
-from metabase_tools import MetabaseApi
-from metabase_tools.exceptions import MetabaseApiException
+from metabase_tools import MetabaseApi, TransportConfig
+from metabase_tools.exceptions import MetabaseApiBatchException, MetabaseApiException
 
 
 @pytest.fixture
@@ -130,3 +132,105 @@ class TestApiGeneral:
 
     def test_server_version(self, api: MetabaseApi):
         assert isinstance(api.server_version, Version)
+
+    def test_server_version_supplied(self, host: str, credentials: dict):
+        api = MetabaseApi(
+            metabase_url=host, credentials=credentials, server_version="v0.41.2"
+        )
+        assert api.server_version == Version("v0.41.2")
+
+    def test_lazy_start_up(self, host: str, token: dict):
+        api = MetabaseApi(metabase_url=host, credentials=token, trust_token=True)
+        assert api.connection_stats["requests"] == 0
+        assert isinstance(api.server_version, Version)
+        assert api.settings is api.settings
+        assert api.connection_stats["requests"] == 2
+
+    def test_trusted_bad_token(self, host: str):
+        api = MetabaseApi(
+            metabase_url=host, credentials={"token": "badtoken"}, trust_token=True
+        )
+        with pytest.raises(MetabaseApiException):
+            _ = api.cards.get()
+
+
+class TestApiConcurrency:
+    @pytest.fixture(scope="class")
+    def concurrent_api(self, host: str, credentials: dict) -> MetabaseApi:
+        return MetabaseApi(metabase_url=host, credentials=credentials, max_workers=4)
+
+    def test_get_many_keeps_order(self, concurrent_api: MetabaseApi):
+        targets = [card.id for card in concurrent_api.cards.get()][::-1]
+        result = concurrent_api.cards.get(targets=targets)  # type: ignore
+        assert [card.id for card in result] == targets
+
+    def test_get_many_collects_failures(self, concurrent_api: MetabaseApi):
+        good_id = concurrent_api.cards.get()[0].id
+        bad_id = 999999
+        with pytest.raises(MetabaseApiBatchException) as error:
+            _ = concurrent_api.cards.get(targets=[bad_id, good_id])  # type: ignore
+        assert list(error.value.errors) == [bad_id]
+        assert [result["id"] for result in error.value.results] == [good_id]
+
+    def test_invalid_max_workers(self, host: str, credentials: dict):
+        with pytest.raises(MetabaseApiException):
+            _ = MetabaseApi(metabase_url=host, credentials=credentials, max_workers=0)
+
+
+class TestApiTransport:
+    def test_connections_reused(self, host: str, credentials: dict):
+        api = MetabaseApi(
+            metabase_url=host,
+            credentials=credentials,
+            transport=TransportConfig(pool_maxsize=4),
+        )
+        _ = api.cards.get()
+        stats = api.connection_stats
+        assert stats["requests"] >= 2
+        assert stats["reused_connections"] > 0
+        assert (
+            stats["new_connections"] + stats["reused_connections"] == stats["requests"]
+        )
+
+    def test_keep_alive_disabled(self, host: str, credentials: dict):
+        api = MetabaseApi(
+            metabase_url=host,
+            credentials=credentials,
+            transport=TransportConfig(keep_alive=False),
+        )
+        _ = api.cards.get()
+        stats = api.connection_stats
+        assert stats["new_connections"] == stats["requests"]
+        assert api._session.headers["Connection"] != "close"
+
+    def test_session_adapter_kept(self, host: str, credentials: dict):
+        session = Session()
+        adapter = HTTPAdapter(max_retries=2)
+        session.mount(host, adapter)
+        api = MetabaseApi(metabase_url=host, credentials=credentials, session=session)
+        assert session.get_adapter(api.metabase_url) is adapter
+
+
+class TestTrustedHydration:
+    @pytest.fixture(scope="class")
+    def trusted_api(self, host: str, credentials: dict) -> MetabaseApi:
+        return MetabaseApi(
+            metabase_url=host, credentials=credentials, trusted_hydration=True
+        )
+
+    @pytest.mark.parametrize("endpoint", ["cards", "dashboards", "users"])
+    def test_matches_validated(
+        self, api: MetabaseApi, trusted_api: MetabaseApi, endpoint: str
+    ):
+        validated = getattr(api, endpoint).get()
+        trusted = getattr(trusted_api, endpoint).get()
+        assert trusted == validated
+        assert all(item._adapter is trusted_api for item in trusted)
+
+    def test_refresh_matches_validated(
+        self, api: MetabaseApi, trusted_api: MetabaseApi
+    ):
+        validated = api.cards.get()[0].refresh()
+        trusted = trusted_api.cards.get()[0].refresh()
+        assert trusted == validated
+        assert trusted._adapter is trusted_api
@@ -0,0 +1,114 @@
+import asyncio
+
+import pytest
+from packaging.version import Version
+
+from metabase_tools.aio import AsyncMetabaseApi
+from metabase_tools.exceptions import MetabaseApiBatchException, MetabaseApiException
+from metabase_tools.models.card_model import CardItem
+from metabase_tools.models.user_model import UserItem
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+class TestAsyncApi:
+    def test_context_manager(self, host: str, credentials: dict):
+        async def main():
+            async with AsyncMetabaseApi(
+                metabase_url=host, credentials=credentials
+            ) as api:
+                return await api.get_server_version(), await api.test_for_auth()
+
+        server_version, authed = run(main())
+        assert isinstance(server_version, Version)
+        assert authed
+
+    def test_auth_fail(self, host: str, email: str):
+        async def main():
+            bad_credentials = {"username": email, "password": "badpass"}
+            async with AsyncMetabaseApi(metabase_url=host, credentials=bad_credentials):
+                pass
+
+        with pytest.raises(MetabaseApiException):
+            run(main())
+
+    def test_not_connected(self, host: str, credentials: dict):
+        api = AsyncMetabaseApi(metabase_url=host, credentials=credentials)
+        with pytest.raises(MetabaseApiException):
+            run(api.get("/user/current"))
+
+
+class TestAsyncEndpoints:
+    def test_get_many_keeps_order(self, host: str, credentials: dict):
+        async def main():
+            async with AsyncMetabaseApi(
+                metabase_url=host, credentials=credentials, max_concurrency=4
+            ) as api:
+                targets = [card.id for card in await api.cards.get()][::-1]
+                return targets, await api.cards.get(targets=targets)
+
+        targets, result = run(main())
+        assert all(isinstance(item, CardItem) for item in result)
+        assert [card.id for card in result] == targets
+
+    def test_get_many_collects_failures(self, host: str, credentials: dict):
+        async def main():
+            async with AsyncMetabaseApi(
+                metabase_url=host, credentials=credentials
+            ) as api:
+                good_id = (await api.cards.get())[0].id
+                with pytest.raises(MetabaseApiBatchException) as error:
+                    _ = await api.cards.get(targets=[999999, good_id])
+                return good_id, error.value
+
+        good_id, error = run(main())
+        assert list(error.errors) == [999999]
+        assert [result["id"] for result in error.results] == [good_id]
+
+    def test_update(self, host: str, credentials: dict, run_id: str):
+        async def main():
+            async with AsyncMetabaseApi(
+                metabase_url=host, credentials=credentials
+            ) as api:
+                target = (await api.cards.get())[0]
+                return await api.cards.update(target, description=f"Async {run_id}")
+
+        result = run(main())
+        assert isinstance(result, CardItem)
+        assert result.description == f"Async {run_id}"
+
+    def test_current_user(self, host: str, credentials: dict, email: str):
+        async def main():
+            async with AsyncMetabaseApi(
+                metabase_url=host, credentials=credentials
+            ) as api:
+                return await api.users.current()
+
+        result = run(main())
+        assert isinstance(result, UserItem)
+        assert result.email == email
+
+    def test_share(self, host: str, credentials: dict):
+        async def main():
+            async with AsyncMetabaseApi(
+                metabase_url=host, credentials=credentials
+            ) as api:
+                target = (await api.cards.get())[0]
+                shared = await api.cards.share(target)
+                return shared, await api.cards.unshare(target)
+
+        shared, unshared = run(main())
+        assert shared.public_uuid is not None
+        assert unshared.public_uuid is None
+
+    def test_settings(self, host: str, credentials: dict):
+        async def main():
+            async with AsyncMetabaseApi(
+                metabase_url=host, credentials=credentials
+            ) as api:
+                return await api.get_settings()
+
+        result = run(main())
+        assert isinstance(result.site_name.value, str)
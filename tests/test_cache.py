@@ -0,0 +1,102 @@
+from time import sleep
+
+import pytest
+
+from metabase_tools import MetabaseApi, ResponseCache
+
+
+class TestResponseCache:
+    def test_hit_and_miss(self):
+        cache = ResponseCache()
+        assert cache.lookup("/card") == (False, None)
+        cache.store("/card", None, [{"id": 1}])
+        assert cache.lookup("/card") == (True, [{"id": 1}])
+        assert cache.stats["hits"] == 1
+        assert cache.stats["misses"] == 1
+
+    def test_keyed_by_params(self):
+        cache = ResponseCache()
+        cache.store("/user", {"limit": 1, "offset": 0}, [{"id": 1}])
+        assert cache.lookup("/user", {"offset": 0, "limit": 1})[0]
+        assert not cache.lookup("/user", {"offset": 1, "limit": 1})[0]
+
+    def test_returns_copies(self):
+        cache = ResponseCache()
+        value = [{"id": 1}]
+        cache.store("/card", None, value)
+        value[0]["id"] = 2
+        _, cached = cache.lookup("/card")
+        cached[0]["id"] = 3
+        assert cache.lookup("/card")[1] == [{"id": 1}]
+
+    def test_ttl_by_prefix(self):
+        cache = ResponseCache(default_ttl=60, ttls={"/card": 0.05, "/card/1": 0})
+        assert cache.ttl_for("/card/1/query") == 0
+        cache.store("/card/1", None, {"id": 1})
+        cache.store("/card/2", None, {"id": 2})
+        cache.store("/database", None, [])
+        assert not cache.lookup("/card/1")[0]
+        assert cache.lookup("/card/2")[0]
+        sleep(0.1)
+        assert not cache.lookup("/card/2")[0]
+        assert cache.lookup("/database")[0]
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(max_entries=2)
+        cache.store("/card", None, [])
+        cache.store("/database", None, [])
+        _ = cache.lookup("/card")
+        cache.store("/user", None, [])
+        assert cache.lookup("/card")[0]
+        assert not cache.lookup("/database")[0]
+        assert cache.stats["evictions"] == 1
+
+    def test_invalidate_resource(self):
+        cache = ResponseCache()
+        for endpoint in ["/card", "/card/1", "/card/embeddable", "/cardinal"]:
+            cache.store(endpoint, None, [])
+        cache.invalidate("/card/1/favorite")
+        assert cache.stats["invalidations"] == 3
+        assert cache.stats["entries"] == 1
+        assert cache.lookup("/cardinal")[0]
+
+    def test_invalidated_in_flight(self):
+        cache = ResponseCache()
+        generation = cache.generation("/card/1")
+        cache.invalidate("/card")  # written while the request was in flight
+        cache.store("/card/1", None, {"id": 1}, generation=generation)
+        assert not cache.lookup("/card/1")[0]
+        cache.store("/card/1", None, {"id": 1}, generation=cache.generation("/card/1"))
+        assert cache.lookup("/card/1")[0]
+
+    def test_invalid_max_entries(self):
+        with pytest.raises(ValueError):
+            _ = ResponseCache(max_entries=0)
+
+
+class TestCachedRequests:
+    def test_get_served_from_cache(self, host: str, credentials: dict):
+        cache = ResponseCache()
+        api = MetabaseApi(
+            metabase_url=host, credentials=credentials, response_cache=cache
+        )
+        requests = api.connection_stats["requests"]
+        first = api.databases.get()
+        second = api.databases.get()
+        assert first == second
+        assert api.connection_stats["requests"] == requests + 1
+        assert cache.stats["hits"] >= 1
+
+    def test_write_invalidates(self, host: str, credentials: dict):
+        cache = ResponseCache()
+        api = MetabaseApi(
+            metabase_url=host, credentials=credentials, response_cache=cache
+        )
+        card = api.cards.get()[0]
+        new_name = f"{card.name} (cached)"
+        _ = card.update(name=new_name)
+        try:
+            assert api.cards.get(targets=[card.id])[0].name == new_name
+            assert any(c.name == new_name for c in api.cards.get())
+        finally:
+            _ = card.update(name=card.name)
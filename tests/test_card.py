@@ -11,6 +11,8 @@ from metabase_tools.models.card_model import (
     CardQueryResult,
     CardRelatedObjects,
 )
+from metabase_tools.models.generic_model import ItemProjection
+from metabase_tools.models.user_model import UserItem
 
 
 @pytest.fixture(scope="module")
@@ -30,6 +32,36 @@ class TestModelMethodsCommonPass:
             result._adapter.server_version, Version
         )  # check adapter initialized
 
+    def test_save(self, items: list[CardItem], run_id: str):
+        target = random.choice(items).refresh()
+        target.description = f"Saved {run_id}"
+        assert target.dirty_fields == {"description"}  # check change tracked
+        result = target.save()
+        assert isinstance(result, CardItem)  # check item class
+        assert result.description == f"Saved {run_id}"  # check action result
+        assert result.dirty_fields == set()  # check changes cleared
+        assert target.dirty_fields == set()  # check changes cleared
+        assert isinstance(result._adapter, MetabaseApi)  # check adapter set
+
+    def test_copy_resets_changes(self, items: list[CardItem], run_id: str):
+        target = random.choice(items).refresh()
+        target.description = f"Copied {run_id}"
+        assert target.copy().dirty_fields == set()  # check changes not carried
+        copied = target.copy(update={"name": f"Copied {run_id}"})
+        assert copied.dirty_fields == {"name"}  # check update tracked
+
+    def test_assign_nested_dict(self, items: list[CardItem]):
+        target = random.choice(items).refresh()
+        target.creator = target.creator.dict(by_alias=True)
+        assert isinstance(target.creator, UserItem)  # check nested object built
+        assert target.dirty_fields == {"creator"}  # check change tracked
+        with pytest.raises(ValueError):
+            target.creator = {"id": 1}  # check nested object validated
+
+    def test_save_unchanged(self, items: list[CardItem]):
+        target = random.choice(items)
+        assert target.save() is target  # check nothing sent
+
     def test_archive(self, items: list[CardItem]):
         target = random.choice(items)
         result = target.archive()
@@ -81,6 +113,13 @@ class TestModelMethodsCommonFail:
         with pytest.raises(MetabaseApiException):
             _ = target.unarchive()  # type: ignore
 
+    def test_save_fail(self, items: list[CardItem]):
+        target = random.choice(items).copy()
+        target._adapter = None
+        target.name = "Not saved"
+        with pytest.raises(AttributeError):
+            _ = target.save()
+
     def test_delete_fail(self, items: list[CardItem]):
         target = random.choice(items)
         with pytest.raises(NotImplementedError):
@@ -114,6 +153,41 @@ class TestEndpointMethodsCommonPass:
             result._adapter.server_version, Version
         )  # check adapter is initialized correctly
 
+    def test_iter_all(self, api: MetabaseApi, items: list[CardItem]):
+        result = list(api.cards.iter_all())
+        assert all(isinstance(item, CardItem) for item in result)  # check item class
+        assert [item.id for item in result] == [item.id for item in items]
+        assert all(
+            isinstance(item._adapter, MetabaseApi) for item in result
+        )  # check adapter set
+
+    def test_iter_get_targets(self, api: MetabaseApi, items: list[CardItem]):
+        target = [item.id for item in items if isinstance(item.id, int)][:3]
+        result = api.cards.iter_get(targets=target)
+        assert [item.id for item in result] == target  # check action result
+
+    def test_get_fields(self, api: MetabaseApi, items: list[CardItem]):
+        result = api.cards.get(fields=["name", "collection_id", "last-edit-info"])
+        assert all(
+            isinstance(item, ItemProjection) for item in result
+        )  # check item class
+        assert set(result[0].__fields__) == {
+            "id",
+            "name",
+            "collection_id",
+            "last_edit_info",
+        }  # check only requested fields kept
+        assert [(item.id, item.name) for item in result] == [
+            (item.id, item.name) for item in items
+        ]  # check action result
+
+    def test_iter_get_fields(self, api: MetabaseApi, items: list[CardItem]):
+        target = [item.id for item in items if isinstance(item.id, int)][:3]
+        result = list(api.cards.iter_get(targets=target, fields=["name"]))
+        assert [item.id for item in result] == target  # check action result
+        with pytest.raises(TypeError):
+            result[0].name = "Renamed"  # check read-only
+
     def test_get_one(self, api: MetabaseApi, items: list[CardItem]):
         item_ids = [item.id for item in items if isinstance(item.id, int)]
         target = random.sample(item_ids, 1)
@@ -186,6 +260,10 @@ class TestEndpointMethodsCommonFail:
         with pytest.raises(TypeError):
             _ = api.cards.get(targets=target)  # type: ignore
 
+    def test_get_fields_fail(self, api: MetabaseApi):
+        with pytest.raises(ValueError):
+            _ = api.cards.get(fields=["not_a_field"])
+
     def test_search_fail(self, api: MetabaseApi, items: list[CardItem]):
         params = [{"name": f"{random.choice(items).name}z"}]
         result = api.cards.search(search_params=params, search_list=items)
@@ -209,9 +287,36 @@ class TestEndpointMethodsUniquePass:
             for item in result
         )  # check adapter initialized
 
+    def test_bulk_archive(self, api: MetabaseApi, items: list[CardItem]):
+        targets = [item.id for item in items if isinstance(item.id, int)][:3]
+        result = api.cards.bulk_archive(targets)
+        _ = api.cards.bulk_unarchive(targets)
+        assert result.ok  # check action result
+        assert [outcome.target for outcome in result.outcomes] == targets
+        assert all(item.archived for item in result.results)  # check action result
+
+    def test_bulk_update(self, api: MetabaseApi, items: list[CardItem], run_id: str):
+        targets = random.sample(items, 2)
+        changes = [{"id": targets[0].id, "description": f"Bulk {run_id}"}]
+        targets[1].description = f"Bulk {run_id}"
+        result = api.cards.bulk_update([*changes, targets[1]])
+        assert result.ok  # check action result
+        assert all(
+            item.description == f"Bulk {run_id}" for item in result.results
+        )  # check action result
+
 
 class TestEndpointMethodsUniqueFail:
-    pass
+    def test_bulk_archive_fail(self, api: MetabaseApi, items: list[CardItem]):
+        target = [item.id for item in items if isinstance(item.id, int)][0]
+        result = api.cards.bulk_archive([999999, target])
+        _ = api.cards.bulk_unarchive([target])
+        assert list(result.errors) == [999999]  # check failure reported
+        assert [item.id for item in result.results] == [target]  # check others run
+
+    def test_bulk_delete_fail(self, api: MetabaseApi, items: list[CardItem]):
+        with pytest.raises(NotImplementedError):
+            _ = api.cards.bulk_delete([items[0].id])
 
 
 class TestModelMethodsUniquePass:
@@ -275,6 +380,20 @@ class TestModelMethodsUniquePass:
             result._adapter.server_version, Version
         )  # check adapter initialized
 
+    def test_lazy_creator(self, api: MetabaseApi):
+        result = api.cards.get()[0]
+        assert not isinstance(
+            result.__dict__["creator"], UserItem
+        )  # check nested object not built yet
+        assert isinstance(result.creator, UserItem)  # check built on access
+        assert result.__dict__["creator"] is result.creator  # check kept
+
+    def test_lazy_dict(self, api: MetabaseApi):
+        result = api.cards.get()[0]
+        definition = result.dict()
+        assert isinstance(definition["creator"], dict)  # check nested built
+        assert definition["creator"]["id"] == result.creator_id
+
     def test_query(self, items: list[CardItem]):
         target = random.choice(items)
         result = target.query()
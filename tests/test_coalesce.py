@@ -0,0 +1,103 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from time import sleep
+
+import pytest
+
+from metabase_tools import MetabaseApi
+from metabase_tools.utils.coalesce import RequestCoalescer
+
+
+class TestRequestCoalescer:
+    def test_shares_request(self):
+        coalescer = RequestCoalescer()
+        started, release = Event(), Event()
+        calls = []
+
+        def request() -> dict:
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return {"data": [1, 2]}
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            leader = executor.submit(coalescer.do, "/card", None, request)
+            assert started.wait(5)
+            followers = [
+                executor.submit(coalescer.do, "/card", {}, request) for _ in range(3)
+            ]
+            while coalescer.stats["shared"] < 3:
+                sleep(0.001)
+            release.set()
+            results = [leader.result()] + [future.result() for future in followers]
+        assert len(calls) == 1
+        assert all(result == {"data": [1, 2]} for result in results)
+        assert len({id(result) for result in results}) == 4  # check copies
+        assert coalescer.stats == {"requests": 1, "shared": 3, "in_flight": 0}
+
+    def test_keyed_by_params(self):
+        coalescer = RequestCoalescer()
+        assert coalescer.do("/card", {"f": "all"}, lambda: 1) == 1
+        assert coalescer.do("/card", {"f": "mine"}, lambda: 2) == 2
+        assert coalescer.stats["requests"] == 2
+
+    def test_raises_in_followers(self):
+        coalescer = RequestCoalescer()
+        started, release = Event(), Event()
+
+        def request() -> None:
+            started.set()
+            release.wait(5)
+            raise ValueError("failed")
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            leader = executor.submit(coalescer.do, "/card", None, request)
+            assert started.wait(5)
+            follower = executor.submit(coalescer.do, "/card", None, request)
+            while coalescer.stats["shared"] < 1:
+                sleep(0.001)
+            release.set()
+            for future in (leader, follower):
+                with pytest.raises(ValueError):
+                    future.result()
+        assert coalescer.stats["in_flight"] == 0
+
+    def test_forget(self):
+        coalescer = RequestCoalescer()
+        started, release = Event(), Event()
+
+        def request() -> int:
+            started.set()
+            release.wait(5)
+            return 1
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            leader = executor.submit(coalescer.do, "/card/1", None, request)
+            assert started.wait(5)
+            coalescer.forget("/card/1/query")
+            assert coalescer.do("/card/1", None, lambda: 2) == 2  # not shared
+            release.set()
+            assert leader.result() == 1
+        assert coalescer.stats["shared"] == 0
+
+
+class TestCoalescedRequests:
+    def test_concurrent_gets(self, host: str, credentials: dict):
+        api = MetabaseApi(
+            metabase_url=host,
+            credentials=credentials,
+            max_workers=8,
+            coalesce_requests=True,
+        )
+        card_id = api.cards.get()[0].id
+        cards = api.cards.get(targets=[card_id] * 8)
+        assert len({card.id for card in cards}) == 1
+        assert len({id(card) for card in cards}) == 8
+        assert api.request_coalescer is not None
+        stats = api.request_coalescer.stats
+        assert stats["in_flight"] == 0
+
+    def test_disabled_by_default(self, host: str, credentials: dict):
+        api = MetabaseApi(metabase_url=host, credentials=credentials)
+        assert api.request_coalescer is None
+        assert len(api.databases.get()) > 0
@@ -0,0 +1,55 @@
+from datetime import date, datetime, timezone
+from json import JSONDecodeError
+from uuid import UUID
+
+import pytest
+
+from metabase_tools import JsonCodec, MetabaseApi, OrjsonCodec
+from metabase_tools.utils.codec import HAS_ORJSON, default_codec
+
+CODECS = [JsonCodec()] + ([OrjsonCodec()] if HAS_ORJSON else [])
+
+
+class TestJsonCodec:
+    @pytest.mark.parametrize("codec", CODECS, ids=lambda codec: codec.name)
+    def test_round_trip(self, codec: JsonCodec):
+        obj = {"id": 1, "name": "Café", "tags": [None, 1.5, True], "nested": {}}
+        encoded = codec.dumps(obj)
+        assert isinstance(encoded, bytes)
+        assert codec.loads(encoded) == obj
+        assert codec.loads(encoded.decode("utf-8")) == obj
+
+    @pytest.mark.parametrize("codec", CODECS, ids=lambda codec: codec.name)
+    def test_invalid_document(self, codec: JsonCodec):
+        for body in (b"", b"{not json"):
+            with pytest.raises(JSONDecodeError):
+                _ = codec.loads(body)
+
+    @pytest.mark.parametrize("codec", CODECS, ids=lambda codec: codec.name)
+    def test_encode_values(self, codec: JsonCodec):
+        obj = {
+            "created_at": datetime(2024, 1, 2, 3, 4, 5, 6, tzinfo=timezone.utc),
+            "day": date(2024, 1, 2),
+            "entity_id": UUID(int=1),
+        }
+        assert codec.loads(codec.dumps(obj)) == {
+            "created_at": "2024-01-02T03:04:05.000006+00:00",
+            "day": "2024-01-02",
+            "entity_id": str(UUID(int=1)),
+        }
+        with pytest.raises(TypeError):
+            _ = codec.dumps({"value": object()})
+
+    def test_default_codec(self):
+        expected = OrjsonCodec if HAS_ORJSON else JsonCodec
+        assert type(default_codec()) is expected
+
+
+class TestCodecRequests:
+    @pytest.mark.parametrize("codec", CODECS, ids=lambda codec: codec.name)
+    def test_codec(self, host: str, credentials: dict, codec: JsonCodec):
+        api = MetabaseApi(metabase_url=host, credentials=credentials, json_codec=codec)
+        assert api.json_codec is codec
+        card = api.cards.get()[0]
+        result = card.update(description=card.description)
+        assert result.id == card.id  # check action result
@@ -219,6 +219,23 @@ class TestModelMethodsUniquePass:
         assert isinstance(result, list)
         assert all(isinstance(record, dict) for record in result)
 
+    def test_paginate_contents(self, items: list[CollectionItem]):
+        item = random.choice(items)
+        pager = item.paginate_contents(page_size=2, prefetch=True)
+        result = list(pager)
+        assert result == item.get_contents()  # check action result
+        assert pager.total == len(result)
+
+    def test_check_for_object(self, api: MetabaseApi):
+        card = next(
+            card for card in api.cards.get() if isinstance(card.collection_id, int)
+        )
+        collection = api.collections.get(targets=[card.collection_id])[0]
+        assert collection.check_for_object(card.name) == card.id
+
 
 class TestModelMethodsUniqueFail:
-    pass
+    def test_check_for_object_fail(self, items: list[CollectionItem]):
+        item = random.choice(items)
+        with pytest.raises(MetabaseApiException):
+            _ = item.check_for_object("Not a card name")
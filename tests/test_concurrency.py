@@ -0,0 +1,125 @@
+from threading import Lock
+
+import pytest
+
+from metabase_tools.utils.concurrency import (
+    BulkReport,
+    Task,
+    map_concurrently,
+    run_bulk,
+    run_graph,
+)
+
+
+def square(value: int) -> int:
+    if value < 0:
+        raise ValueError(value)
+    return value * value
+
+
+class TestMapConcurrently:
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_keeps_order(self, max_workers: int):
+        result = map_concurrently(square, [3, -1, 2], max_workers=max_workers)
+        assert [value for value, _ in result] == [9, None, 4]
+        assert isinstance(result[1][1], ValueError)
+
+
+class TestRunBulk:
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_report(self, max_workers: int):
+        report = run_bulk(
+            "square",
+            square,
+            [3, -1, 2],
+            key=lambda value: value,
+            max_workers=max_workers,
+        )
+        assert isinstance(report, BulkReport)
+        assert [outcome.target for outcome in report.outcomes] == [3, -1, 2]
+        assert report.results == [9, 4]
+        assert list(report.errors) == [-1]
+        assert not report.ok
+        assert all(outcome.elapsed >= 0 for outcome in report.outcomes)
+
+    def test_summary(self):
+        report = run_bulk("square", square, [1, 2], key=str)
+        summary = report.summary()
+        assert summary["operation"] == "square"
+        assert (summary["total"], summary["succeeded"], summary["failed"]) == (2, 2, 0)
+        assert summary["max_latency"] <= summary["elapsed"]
+        assert report.ok
+
+    def test_key_failure_reported(self):
+        changes = [{"id": 1}, {"name": "no id"}]
+        report = run_bulk(
+            "update", lambda change: change, changes, key=lambda change: change["id"]
+        )
+        assert [outcome.target for outcome in report.outcomes] == [1, changes[1]]
+        assert report.results == [{"id": 1}]
+        assert isinstance(report.errors[repr(changes[1])], KeyError)
+
+    def test_empty(self):
+        report = run_bulk("square", square, [], key=str)
+        assert report.ok
+        assert report.summary()["mean_latency"] == 0.0
+
+
+class TestRunGraph:
+    @staticmethod
+    def tasks(calls: list[str], lock: Lock) -> list[Task]:
+        def make(key: str, value: int):
+            def func(inputs: dict) -> int:
+                with lock:
+                    calls.append(key)
+                if value < 0:
+                    raise ValueError(key)
+                return value + sum(inputs.values())
+
+            return func
+
+        return [
+            Task("a", make("a", 1)),
+            Task("b", make("b", 2), ("a",)),
+            Task("c", make("c", -1)),
+            Task("d", make("d", 3), ("b", "c")),
+            Task("e", make("e", 4)),
+        ]
+
+    @pytest.mark.parametrize("max_workers", [1, 4])
+    def test_dependencies(self, max_workers: int):
+        calls: list[str] = []
+        report = run_graph("graph", self.tasks(calls, Lock()), max_workers)
+        assert [outcome.target for outcome in report.outcomes] == list("abcde")
+        assert [outcome.result for outcome in report.outcomes] == [1, 3, None, None, 4]
+        assert calls.index("a") < calls.index("b")
+        assert "d" not in calls  # c failed
+        assert set(report.errors) == {"c", "d"}
+        assert isinstance(report.errors["c"], ValueError)
+
+    def test_resume(self):
+        calls: list[str] = []
+        recorded = {}
+        report = run_graph(
+            "graph",
+            self.tasks(calls, Lock()),
+            completed={"a": 10, "c": 0},
+            on_success=recorded.__setitem__,
+        )
+        assert sorted(calls) == ["b", "d", "e"]
+        assert recorded == {"b": 12, "d": 15, "e": 4}
+        assert report.ok
+
+    def test_stop_on_error(self):
+        calls: list[str] = []
+        report = run_graph(
+            "graph", self.tasks(calls, Lock()), max_workers=1, stop_on_error=True
+        )
+        assert calls == ["a", "c"]
+        assert set(report.errors) == {"b", "c", "d", "e"}
+
+    def test_invalid(self):
+        with pytest.raises(ValueError):
+            run_graph("graph", [Task("a", sum), Task("a", sum)])
+        with pytest.raises(ValueError):
+            run_graph("graph", [Task("a", sum, ("missing",))])
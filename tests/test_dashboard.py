@@ -61,6 +61,17 @@ class TestModelMethodsCommonPass:
         created_db = api.dashboards.create(**new_dashboard)
         created_db.delete()
 
+    def test_bulk_delete(self, api: MetabaseApi):
+        created = [
+            api.dashboards.create(name=f"Test - Bulk {i}", parameters=[])
+            for i in range(3)
+        ]
+        result = api.dashboards.bulk_delete(created)
+        assert result.ok  # check action result
+        assert [outcome.target for outcome in result.outcomes] == [
+            item.id for item in created
+        ]
+
 
 class TestModelMethodsCommonFail:
     def test_update_fail(self, items: list[DashboardItem]):
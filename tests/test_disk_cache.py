@@ -0,0 +1,101 @@
+from pathlib import Path
+from threading import Thread
+
+import pytest
+from requests import Response
+
+from metabase_tools import DiskCache, MetabaseApi
+
+
+def make_response(body: bytes, etag: str | None = None) -> Response:
+    response = Response()
+    response.status_code = 200
+    response._content = body
+    if etag:
+        response.headers["ETag"] = etag
+    return response
+
+
+class TestDiskCache:
+    def test_store_and_lookup(self, tmp_path: Path):
+        cache = DiskCache(tmp_path / "cache.sqlite")
+        key = cache.key("http://localhost/api/card", {"f": "all"})
+        assert cache.lookup(key) == (None, False)
+        cache.store(key, "/card", make_response(b'[{"id": 1}]'))
+        cached, fresh = cache.lookup(key)
+        assert fresh
+        assert cached is not None
+        assert cached.to_response("http://localhost/api/card").json() == [{"id": 1}]
+
+    def test_persists_between_instances(self, tmp_path: Path):
+        key = DiskCache.key("http://localhost/api/card")
+        DiskCache(tmp_path / "cache.sqlite").store(key, "/card", make_response(b"[]"))
+        cached, _ = DiskCache(tmp_path / "cache.sqlite").lookup(key)
+        assert cached is not None
+
+    def test_stale_response_has_validators(self, tmp_path: Path):
+        cache = DiskCache(tmp_path / "cache.sqlite", max_age=0)
+        key = cache.key("http://localhost/api/card")
+        cache.store(key, "/card", make_response(b"[]", etag='"abc"'))
+        cached, fresh = cache.lookup(key)
+        assert not fresh
+        assert cached is not None
+        assert cached.validators == {"If-None-Match": '"abc"'}
+
+    def test_size_cap(self, tmp_path: Path):
+        cache = DiskCache(tmp_path / "cache.sqlite", max_bytes=250)
+        for i in range(5):
+            cache.store(cache.key(str(i)), "/card", make_response(b"x" * 100))
+        assert cache.stats["entries"] == 2
+        assert cache.lookup(cache.key("4"))[0] is not None
+        assert cache.lookup(cache.key("0"))[0] is None
+
+    def test_invalidate_resource(self, tmp_path: Path):
+        cache = DiskCache(tmp_path / "cache.sqlite")
+        for endpoint in ["/card", "/card/1", "/cardinal"]:
+            cache.store(cache.key(endpoint), endpoint, make_response(b"[]"))
+        cache.invalidate("/card/1")
+        assert cache.stats["entries"] == 1
+
+    def test_revalidate_items(self, tmp_path: Path):
+        cache = DiskCache(tmp_path / "cache.sqlite")
+        url = "http://localhost/api/card"
+        for item_id in [1, 2]:
+            body = f'{{"id": {item_id}, "updated_at": "2023-01-01"}}'.encode()
+            cache.store(
+                cache.key(f"{url}/{item_id}"), f"/card/{item_id}", make_response(body)
+            )
+        cache._connection().execute("UPDATE responses SET stored_at = 0")  # expired
+        assert not cache.lookup(cache.key(f"{url}/1"))[1]
+        versions = [(1, "2023-01-01"), (2, "2023-02-01"), (3, "2023-01-01")]
+        assert cache.revalidate_items(url, versions) == 1
+        assert cache.lookup(cache.key(f"{url}/1"))[1]  # unchanged, so fresh again
+        assert cache.lookup(cache.key(f"{url}/2"))[0] is None  # changed, so dropped
+
+    def test_close_all_threads(self, tmp_path: Path):
+        cache = DiskCache(tmp_path / "cache.sqlite")
+        thread = Thread(target=cache.lookup, args=(cache.key("x"),))
+        thread.start()
+        thread.join()
+        assert len(cache._connections) == 2
+        cache.close()
+        assert cache._connections == []
+        assert cache.lookup(cache.key("x")) == (None, False)
+
+    def test_invalid_max_bytes(self, tmp_path: Path):
+        with pytest.raises(ValueError):
+            _ = DiskCache(tmp_path / "cache.sqlite", max_bytes=0)
+
+
+class TestDiskCachedRequests:
+    def test_get_served_from_disk(self, host: str, credentials: dict, tmp_path: Path):
+        path = tmp_path / "cache.sqlite"
+        first = MetabaseApi(
+            metabase_url=host, credentials=credentials, disk_cache=DiskCache(path)
+        ).cards.get()
+        cache = DiskCache(path)
+        api = MetabaseApi(metabase_url=host, credentials=credentials, disk_cache=cache)
+        requests = api.connection_stats["requests"]
+        assert api.cards.get() == first
+        assert api.connection_stats["requests"] == requests
+        assert cache.stats["hits"] >= 1
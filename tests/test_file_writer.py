@@ -0,0 +1,61 @@
+from pathlib import Path
+
+import pytest
+
+from metabase_tools.utils.file_writer import FileWriterPool, write_atomic
+
+
+class TestWriteAtomic:
+    def test_write(self, tmp_path: Path):
+        path = tmp_path / "query.sql"
+        write_atomic(path, "select 1")
+        write_atomic(path, "select 2")
+        assert path.read_text(encoding="utf-8") == "select 2"
+        assert [item.name for item in tmp_path.iterdir()] == ["query.sql"]
+
+    def test_write_fail(self, tmp_path: Path):
+        with pytest.raises(OSError):
+            write_atomic(tmp_path / "missing" / "query.sql", "select 1")
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestFileWriterPool:
+    def test_writes_files(self, tmp_path: Path):
+        with FileWriterPool(max_workers=3, max_pending=2) as writer:
+            for number in range(20):
+                writer.submit(
+                    tmp_path / f"c{number % 4}" / f"{number}.sql", str(number)
+                )
+        assert writer.written == 20
+        assert writer.errors == {}
+        assert sorted(item.name for item in tmp_path.iterdir()) == [
+            "c0",
+            "c1",
+            "c2",
+            "c3",
+        ]
+        assert (tmp_path / "c1" / "5.sql").read_text(encoding="utf-8") == "5"
+
+    def test_collects_errors(self, tmp_path: Path):
+        (tmp_path / "file").write_text("", encoding="utf-8")
+        writer = FileWriterPool(max_workers=2)
+        writer.submit(tmp_path / "file" / "query.sql", "select 1")  # not a folder
+        writer.submit(tmp_path / "ok.sql", "select 2")
+        errors = writer.close()
+        assert list(errors) == [tmp_path / "file" / "query.sql"]
+        assert writer.written == 1
+        assert writer.close() == errors  # closing again does not block
+
+    def test_worker_survives_unexpected_error(self, tmp_path: Path):
+        with FileWriterPool(max_workers=1, max_pending=1) as writer:
+            writer.submit(tmp_path / "bad.sql", "select '\ud800'")  # lone surrogate
+            for number in range(5):
+                writer.submit(tmp_path / f"{number}.sql", str(number))
+        assert list(writer.errors) == [tmp_path / "bad.sql"]
+        assert isinstance(writer.errors[tmp_path / "bad.sql"], UnicodeEncodeError)
+        assert writer.written == 5
+        assert not (tmp_path / "bad.sql").exists()
+
+    def test_invalid_workers(self):
+        with pytest.raises(ValueError):
+            _ = FileWriterPool(max_workers=0)
@@ -0,0 +1,46 @@
+from json import JSONDecodeError, dumps
+
+import pytest
+
+from metabase_tools.utils.json_stream import iter_json_list
+
+RECORDS = [
+    {"id": 1, "name": "Orders ü", "values": [1.5, -2e-3, None, True]},
+    {"id": 22, "name": 'Quote " ]', "nested": {"list": [{"a": 1}]}},
+    333,
+    -45000000000.0,
+]
+
+
+def chunked(document: bytes, size: int) -> list[bytes]:
+    starts = range(0, len(document), size)
+    return [document[start:][:size] for start in starts]
+
+
+class TestIterJsonList:
+    @pytest.mark.parametrize("size", [1, 2, 3, 16, 1_000_000])
+    def test_list(self, size: int):
+        document = dumps(RECORDS, ensure_ascii=False).encode("utf-8")
+        assert list(iter_json_list(chunked(document, size))) == RECORDS
+
+    @pytest.mark.parametrize("size", [1, 5, 1_000_000])
+    def test_envelope(self, size: int):
+        document = dumps({"total": 4, "data": RECORDS, "limit": None}, indent=2)
+        assert list(iter_json_list(chunked(document.encode(), size))) == RECORDS
+
+    def test_empty_list(self):
+        assert not list(iter_json_list([b" [ ] "]))
+
+    def test_yields_before_end(self):
+        def chunks():
+            yield b'[{"id": 1}, '
+            raise AssertionError("Read past the first record")
+
+        assert next(iter_json_list(chunks())) == {"id": 1}
+
+    @pytest.mark.parametrize(
+        "document", [b"", b"[1, 2", b"[1 2]", b"[1.]", b'{"id": 1}', b'{"data": 1}']
+    )
+    def test_invalid(self, document: bytes):
+        with pytest.raises(JSONDecodeError):
+            _ = list(iter_json_list(chunked(document, 2)))
@@ -0,0 +1,43 @@
+import logging
+
+from pydantic import BaseModel
+
+from metabase_tools.utils.logging_utils import MAX_LOGGED_LENGTH, log_call
+
+
+class Unprintable:
+    def __repr__(self) -> str:
+        raise AssertionError("Rendered while debug logging was disabled")
+
+
+class Model(BaseModel):
+    id: int
+    payload: str
+
+
+@log_call
+def echo(value, **kwargs):
+    return value
+
+
+class TestLogCall:
+    def test_disabled_does_not_render(self, caplog):
+        caplog.set_level(logging.INFO)
+        value = Unprintable()
+        assert echo(value, extra=value) is value
+        assert "echo called" not in caplog.text
+
+    def test_enabled_truncates(self, caplog):
+        caplog.set_level(logging.DEBUG)
+        assert echo("x" * 10_000, extra=list(range(1_000))) == "x" * 10_000
+        assert "echo called" in caplog.text
+        assert "x" * MAX_LOGGED_LENGTH not in caplog.text
+        assert "extra: [0, 1, 2" in caplog.text
+        assert len(caplog.text) < 2_000
+
+    def test_models_rendered_short(self, caplog):
+        caplog.set_level(logging.DEBUG)
+        model = Model(id=7, payload="x" * 10_000)
+        assert echo([model]) == [model]
+        assert "[Model(id=7)]" in caplog.text
+        assert "payload" not in caplog.text
@@ -0,0 +1,28 @@
+from datetime import datetime, timezone
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from metabase_tools.utils.model_values import dict_value, json_value
+
+
+class Owner(BaseModel):
+    id: int
+    joined: datetime
+
+
+class TestModelValues:
+    def test_dict_value(self):
+        owner = Owner(id=1, joined=datetime(2024, 1, 1))
+        assert dict_value([owner]) == [owner.dict()]
+        assert dict_value({"owner": owner}) == {"owner": owner.dict()}
+
+    def test_json_value_matches_model_json(self):
+        owner = Owner(id=1, joined=datetime(2024, 1, 1, tzinfo=timezone.utc))
+        assert json_value(owner.dict()) == {"id": 1, "joined": owner.joined.isoformat()}
+        value = {"ids": (1, 2), "uuid": UUID(int=1), "nested": [owner.dict()]}
+        assert json_value(value) == {
+            "ids": [1, 2],
+            "uuid": str(UUID(int=1)),
+            "nested": [json_value(owner.dict())],
+        }
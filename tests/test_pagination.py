@@ -0,0 +1,116 @@
+from threading import get_ident
+
+import pytest
+
+from metabase_tools import MetabaseApi
+from metabase_tools.models.user_model import UserItem
+from metabase_tools.utils.pagination import Page, Pager
+
+
+def make_fetch(records: list[int], total: bool = True, paginated: bool = True):
+    calls: list[tuple[int, int, int]] = []
+
+    def fetch(limit: int, offset: int) -> Page:
+        calls.append((limit, offset, get_ident()))
+        if not paginated:
+            return Page.from_response(records)
+        end = offset + limit
+        return Page(
+            data=records[offset:end],
+            total=len(records) if total else None,
+            limit=limit,
+            offset=offset,
+        )
+
+    return fetch, calls
+
+
+class TestPage:
+    def test_from_envelope(self):
+        page = Page.from_response({"data": [1, 2], "total": 5, "limit": 2})
+        assert page == Page(data=[1, 2], total=5, limit=2, offset=None)
+
+    def test_from_list(self):
+        assert Page.from_response([1, 2]) == Page([1, 2], 2, None, None)
+
+    def test_from_response_fail(self):
+        with pytest.raises(TypeError):
+            _ = Page.from_response({"total": 0})
+
+
+class TestPager:
+    def test_iterate(self):
+        fetch, calls = make_fetch(list(range(7)))
+        pager = Pager(fetch=fetch, transform=str, page_size=3)
+        assert list(pager) == [str(i) for i in range(7)]
+        assert [(limit, offset) for limit, offset, _ in calls] == [
+            (3, 0),
+            (3, 3),
+            (3, 6),
+        ]
+
+    def test_total(self):
+        fetch, calls = make_fetch(list(range(7)))
+        pager = Pager(fetch=fetch, transform=int, page_size=3)
+        assert pager.total == 7
+        assert list(pager) == list(range(7))
+        assert len(calls) == 3  # first page reused
+
+    def test_without_total(self):
+        fetch, calls = make_fetch(list(range(6)), total=False)
+        pager = Pager(fetch=fetch, transform=int, page_size=3)
+        assert list(pager) == list(range(6))
+        assert len(calls) == 3  # stops on the empty page
+        assert pager.total is None
+
+    def test_not_paginated(self):
+        fetch, calls = make_fetch(list(range(6)), paginated=False)
+        pager = Pager(fetch=fetch, transform=int, page_size=2)
+        assert list(pager) == list(range(6))
+        assert len(calls) == 1
+
+    def test_prefetch(self):
+        fetch, calls = make_fetch(list(range(10)))
+        pager = Pager(fetch=fetch, transform=int, page_size=4, prefetch=True)
+        assert list(pager) == list(range(10))
+        assert [offset for _, offset, _ in calls] == [0, 4, 8]
+        assert calls[1][2] != get_ident()  # next page requested by a worker
+
+    def test_prefetch_stop_early(self):
+        fetch, calls = make_fetch(list(range(10)))
+        pager = Pager(fetch=fetch, transform=int, page_size=4, prefetch=True)
+        iterator = iter(pager)
+        assert next(iterator) == 0
+        iterator.close()  # type: ignore
+        assert len(calls) <= 2
+
+    def test_map(self):
+        fetch, _ = make_fetch(list(range(3)))
+        pager = Pager(fetch=fetch, transform=int, page_size=2).map(lambda x: x * 2)
+        assert list(pager) == [0, 2, 4]
+
+    def test_page_size_fail(self):
+        fetch, _ = make_fetch([])
+        with pytest.raises(ValueError):
+            _ = Pager(fetch=fetch, transform=int, page_size=0)
+
+
+class TestPaginatedEndpoints:
+    def test_get_page(self, api: MetabaseApi):
+        page = api.get_page(endpoint="/user", limit=1)
+        assert len(page.data) <= 1
+        assert page.total is not None and page.total >= len(page.data)
+
+    def test_users_paginate(self, api: MetabaseApi):
+        pager = api.users.paginate(page_size=1, prefetch=True)
+        result = list(pager)
+        assert all(isinstance(item, UserItem) for item in result)  # check class
+        assert sorted(item.id for item in result) == sorted(
+            item.id for item in api.users.get()
+        )
+        assert pager.total == len(result)
+
+    def test_search_paginate(self, api: MetabaseApi):
+        result = list(api.search.paginate(models=["card"], page_size=2))
+        assert all(item.model == "card" for item in result)
+        assert len(result) == len(api.search.get(models=["card"]))
@@ -0,0 +1,88 @@
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import pytest
+from requests import Response
+
+from metabase_tools import MetabaseApi, RetryPolicy, TransportConfig
+from metabase_tools.exceptions import MetabaseApiException
+from metabase_tools.utils.retry import RetryBudget
+
+
+def make_response(status_code: int, retry_after: str | None = None) -> Response:
+    response = Response()
+    response.status_code = status_code
+    if retry_after is not None:
+        response.headers["Retry-After"] = retry_after
+    return response
+
+
+class TestRetryPolicy:
+    def test_retryable_methods(self):
+        policy = RetryPolicy()
+        assert policy.is_retryable_method("GET")
+        assert policy.is_retryable_method("put")
+        assert policy.is_retryable_method("DELETE")
+        assert not policy.is_retryable_method("POST")
+        assert RetryPolicy(retry_methods={"POST"}).is_retryable_method("POST")
+
+    def test_backoff_without_jitter(self):
+        policy = RetryPolicy(backoff_factor=1, max_backoff=5, jitter=False)
+        assert [policy.backoff(n) for n in range(4)] == [1, 2, 4, 5]
+
+    def test_backoff_with_jitter(self):
+        policy = RetryPolicy(backoff_factor=1, max_backoff=5)
+        assert all(0 <= policy.backoff(3) <= 5 for _ in range(20))
+
+    def test_retry_after_seconds(self):
+        policy = RetryPolicy(max_retry_after=10)
+        assert policy.retry_after(make_response(503, "3")) == 3
+        assert policy.retry_after(make_response(503, "120")) == 10
+        assert policy.retry_after(make_response(503)) is None
+        assert policy.retry_after(make_response(503, "soon")) is None
+
+    def test_retry_after_date(self):
+        retry_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+        delay = RetryPolicy().retry_after(make_response(429, format_datetime(retry_at)))
+        assert delay is not None and 25 < delay <= 30
+
+
+class TestRetryBudget:
+    def test_budget_exhausted(self):
+        budget = RetryBudget(ratio=0.5, reserve=2)
+        assert budget.withdraw()
+        assert budget.withdraw()
+        assert not budget.withdraw()
+        budget.deposit()
+        budget.deposit()
+        assert budget.withdraw()
+
+    def test_budget_capped(self):
+        budget = RetryBudget(ratio=1, reserve=2)
+        for _ in range(10):
+            budget.deposit()
+        assert budget.balance == 2
+
+
+class TestRetryRequests:
+    def test_retried_status(self, host: str, credentials: dict, caplog):
+        policy = RetryPolicy(retry_statuses={404}, max_retries=2, backoff_factor=0)
+        api = MetabaseApi(
+            metabase_url=host,
+            credentials=credentials,
+            transport=TransportConfig(retry_policy=policy),
+        )
+        with pytest.raises(MetabaseApiException):
+            _ = api.get(endpoint="/card/999999")
+        assert caplog.text.count("Retrying GET") == 2
+
+    def test_post_not_retried(self, host: str, credentials: dict, caplog):
+        policy = RetryPolicy(retry_statuses={404}, max_retries=2, backoff_factor=0)
+        api = MetabaseApi(
+            metabase_url=host,
+            credentials=credentials,
+            transport=TransportConfig(retry_policy=policy),
+        )
+        with pytest.raises(MetabaseApiException):
+            _ = api.post(endpoint="/card/999999/query")
+        assert "Retrying POST" not in caplog.text
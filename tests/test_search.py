@@ -0,0 +1,63 @@
+import pytest
+
+from metabase_tools.endpoints.search_endpoint import Search
+from metabase_tools.metabase import MetabaseApi
+from metabase_tools.models.card_model import CardItem
+from metabase_tools.models.search_model import SearchItem
+
+
+@pytest.fixture(scope="module")
+def card(api: MetabaseApi) -> CardItem:
+    return next(card for card in api.cards.get() if card.name)
+
+
+class TestSearch:
+    def test_params(self):
+        params = Search.request_params(
+            query="Sales", models=["card"], archived=False, limit=10, offset=None
+        )
+        assert params == {
+            "archived": "false",
+            "q": "Sales",
+            "models": ["card"],
+            "limit": 10,
+        }
+
+    def test_parse_envelope(self):
+        records = [
+            {"id": 1, "model": "card", "name": "A", "collection": {"id": 2}},
+            {"id": 2, "model": "dashboard", "name": "B", "collection": None},
+        ]
+        result = Search.parse_results({"data": records, "total": 2}, collection_id=None)
+        assert [item.id for item in result] == [1, 2]
+        assert Search.parse_results(records, collection_id=2) == result[:1]
+        with pytest.raises(TypeError):
+            _ = Search.parse_results({"total": 0}, collection_id=None)
+
+    def test_is_complete(self):
+        assert Search.is_complete({"data": [{"id": 1}], "total": 1})
+        assert not Search.is_complete({"data": [{"id": 1}], "total": 2})
+        assert not Search.is_complete({"data": [{"id": 1}]})
+        assert not Search.is_complete([{"id": 1}])
+
+
+class TestSearchEndpoint:
+    def test_search(self, api: MetabaseApi, card: CardItem):
+        result = api.search.get(query=card.name, models=["card"])
+        assert all(isinstance(item, SearchItem) for item in result)  # check class
+        assert all(item.model == "card" for item in result)  # check models
+        assert card.id in [item.id for item in result]  # check action result
+
+    def test_search_collection(self, api: MetabaseApi, card: CardItem):
+        result = api.search.get(
+            query=card.name, models=["card"], collection_id=card.collection_id
+        )
+        assert all(item.collection_id == card.collection_id for item in result)
+
+    def test_search_limit(self, api: MetabaseApi):
+        result = api.search.get(models=["card"], limit=1)
+        assert len(result) <= 1
+
+    def test_search_fail(self, api: MetabaseApi, card: CardItem):
+        result = api.search.get(query=f"{card.name} not a card", models=["card"])
+        assert card.id not in [item.id for item in result]
@@ -0,0 +1,81 @@
+import pytest
+from pydantic import BaseModel
+
+from metabase_tools import MetabaseApi, SearchIndex
+from metabase_tools.endpoints.generic_endpoint import Endpoint
+
+
+class Owner(BaseModel):
+    id: int
+    email: str
+
+
+class Record(BaseModel):
+    id: int
+    name: str | None
+    collection_id: int | None
+    tags: list[str] = []
+    owner: Owner | None
+
+
+@pytest.fixture
+def records() -> list[Record]:
+    return [
+        Record(id=1, name="Sales", collection_id=1, owner=Owner(id=1, email="a")),
+        Record(id=2, name="sales by region", collection_id=2, tags=["finance"]),
+        Record(id=3, name="Users", collection_id=1, owner=Owner(id=2, email="b")),
+        Record(id=4, name=None, collection_id=None),
+        Record(id=5, name="Sales", collection_id=2, tags=["finance"]),
+    ]
+
+
+class TestSearchIndex:
+    def test_lookup(self, records: list[Record]):
+        index = SearchIndex(records)
+        assert index.lookup("name", "Sales") == [records[0], records[4]]
+        assert index.lookup("name", None) == [records[3]]
+        assert index.lookup("name", "Missing") == []
+        assert index.lookup("not_a_field", 1) == []
+
+    def test_lookup_unhashable(self, records: list[Record]):
+        index = SearchIndex(records)
+        assert index.lookup("tags", ["finance"]) == [records[1], records[4]]
+        assert index.lookup("owner", {"id": 2, "email": "b"}) == [records[2]]
+
+    def test_find(self, records: list[Record]):
+        index = SearchIndex(records)
+        assert index.find({"name": "Sales", "collection_id": 2}) == [records[4]]
+        assert index.find({"name": "Sales", "collection_id": 3}) == []
+        assert index.find({"name": "Sales", "not_a_field": 1}) == []
+        assert index.find({}) == records
+
+    def test_prefix(self, records: list[Record]):
+        index = SearchIndex(records)
+        assert index.prefix("sales") == [records[0], records[1], records[4]]
+        assert index.prefix("SALES B") == [records[1]]
+        assert index.prefix("x") == []
+        assert index.prefix("") == [records[0], records[1], records[2], records[4]]
+
+    def test_built_once(self, records: list[Record]):
+        index = SearchIndex(records)
+        _ = index.lookup("name", "Sales")
+        records[0].name = "Renamed"
+        assert index.lookup("name", "Sales") == [records[0], records[4]]
+
+    def test_filter_matches_each_criterion(self, records: list[Record]):
+        params = [{"name": "Sales", "collection_id": 1}, {"id": 3}]
+        result = Endpoint._filter(objs=records, search_params=params)
+        assert result == [records[0], records[0], records[2], records[4], records[2]]
+        index = SearchIndex(records)
+        assert Endpoint._filter(objs=index, search_params=params) == result
+        assert index.match_each(params) == result
+
+
+class TestIndexedSearch:
+    def test_search_index(self, api: MetabaseApi):
+        items = api.cards.get()
+        index = SearchIndex(items)
+        params = [{"name": item.name} for item in items[:5]]
+        result = api.cards.search(search_params=params, search_list=index)
+        assert result == api.cards.search(search_params=params, search_list=items)
+        assert len(result) >= len(params)  # check action result
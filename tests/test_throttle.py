@@ -0,0 +1,89 @@
+from time import monotonic
+
+import pytest
+
+from metabase_tools import (
+    AdaptiveConcurrencyLimiter,
+    MetabaseApi,
+    RateLimiter,
+    TransportConfig,
+)
+
+
+class TestRateLimiter:
+    def test_burst_not_delayed(self):
+        limiter = RateLimiter(rate=1, burst=5)
+        assert all(limiter.acquire() == 0 for _ in range(5))
+
+    def test_rate_enforced(self):
+        limiter = RateLimiter(rate=20, burst=1)
+        start = monotonic()
+        for _ in range(5):
+            limiter.acquire()
+        assert monotonic() - start >= 0.19
+
+    def test_reserve_queues_callers(self):
+        limiter = RateLimiter(rate=10, burst=1)
+        assert limiter.reserve() == 0
+        assert limiter.reserve() == pytest.approx(0.1, abs=0.01)
+        assert limiter.reserve() == pytest.approx(0.2, abs=0.01)
+
+    def test_invalid_rate(self):
+        with pytest.raises(ValueError):
+            _ = RateLimiter(rate=0)
+
+
+class TestAdaptiveConcurrencyLimiter:
+    def test_additive_increase(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, latency_target=1)
+        for _ in range(10):
+            limiter.acquire()
+            limiter.release(latency=0.01, overloaded=False)
+        assert limiter.limit > 2
+        assert limiter.in_flight == 0
+
+    def test_multiplicative_decrease(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, latency_target=1)
+        limiter.acquire()
+        limiter.release(latency=0.01, overloaded=True)
+        assert limiter.limit == 4
+
+    def test_slow_response_decreases(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=8, latency_target=0.1)
+        limiter.acquire()
+        limiter.release(latency=0.5, overloaded=False)
+        assert limiter.limit == 4
+
+    def test_limit_bounded(self):
+        limiter = AdaptiveConcurrencyLimiter(initial_limit=2, min_limit=2, max_limit=3)
+        limiter.acquire()
+        limiter.release(latency=0.01, overloaded=True)
+        assert limiter.limit == 2
+        for _ in range(20):
+            limiter.acquire()
+            limiter.release(latency=0.01, overloaded=False)
+        assert limiter.limit == 3
+
+    def test_invalid_limits(self):
+        with pytest.raises(ValueError):
+            _ = AdaptiveConcurrencyLimiter(initial_limit=10, max_limit=5)
+
+
+class TestThrottledRequests:
+    def test_limiters_shared_by_endpoints(self, host: str, credentials: dict):
+        rate_limiter = RateLimiter(rate=50)
+        concurrency_limiter = AdaptiveConcurrencyLimiter(initial_limit=2)
+        api = MetabaseApi(
+            metabase_url=host,
+            credentials=credentials,
+            max_workers=4,
+            transport=TransportConfig(
+                rate_limiter=rate_limiter, concurrency_limiter=concurrency_limiter
+            ),
+        )
+        cards = api.cards.get()
+        _ = api.cards.get(targets=[card.id for card in cards])  # type: ignore
+        _ = api.collections.get()
+        assert api.rate_limiter is rate_limiter
+        assert concurrency_limiter.in_flight == 0
+        assert concurrency_limiter.limit >= 2
@@ -7,6 +7,8 @@ import pytest
 from packaging.version import Version
 
 from metabase_tools import MetabaseApi
+from metabase_tools.exceptions import MetabaseApiException
+from metabase_tools.utils import file_writer
 
 
 class TestDownload:
@@ -17,6 +19,51 @@ class TestDownload:
             file.stat().st_ctime - datetime.now().timestamp() < 2
         )  # file was created in the last 2 seconds
 
+    def test_download_requests(self, host: str, credentials: dict, result_path):
+        api = MetabaseApi(metabase_url=host, credentials=credentials)
+        requests = api.connection_stats["requests"]
+        _ = api.tools.download_native_queries(root_folder=f"{result_path}/data/")
+        # Cards, collection tree and databases, whatever the number of cards
+        assert api.connection_stats["requests"] - requests == 3
+
+    def test_download_incremental(self, api: MetabaseApi, tmp_path: Path):
+        file = api.tools.download_native_queries(root_folder=tmp_path)
+        mapping = loads(file.read_text(encoding="utf-8"))
+        assert all({"id", "updated_at", "query_hash"} <= set(card) for card in mapping)
+        query_path = next(tmp_path.rglob("*.sql"))
+        query_path.unlink()  # missing files are written again
+        stale_path = tmp_path / "Deleted card.sql"
+        stale_path.write_text("select 1", encoding="utf-8")
+        mapping.append({"id": -1, "name": "Deleted card", "path": ""})
+        outside_path = tmp_path.parent / f"{tmp_path.name} outside.sql"
+        outside_path.write_text("select 1", encoding="utf-8")
+        mapping.append({"id": -2, "name": f"../{tmp_path.name} outside", "path": ""})
+        file.write_text(dumps(mapping, indent=2), encoding="utf-8")
+        _ = api.tools.download_native_queries(root_folder=tmp_path, incremental=True)
+        assert query_path.exists()
+        assert not stale_path.exists()  # check deleted card removed
+        assert outside_path.exists()  # check files outside the folder kept
+        modified = file.stat().st_mtime_ns
+        _ = api.tools.download_native_queries(root_folder=tmp_path, incremental=True)
+        assert file.stat().st_mtime_ns == modified  # check mapping untouched
+
+    def test_download_write_failure(
+        self, api: MetabaseApi, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        def fail(path: Path, content: str):
+            raise OSError(f"Unable to write {path}")
+
+        monkeypatch.setattr(file_writer, "write_atomic", fail)
+        file = api.tools.download_native_queries(root_folder=tmp_path)
+        mapping = loads(file.read_text(encoding="utf-8"))
+        assert not list(tmp_path.rglob("*.sql"))
+        assert any("query_hash" not in card for card in mapping)  # check hash dropped
+        monkeypatch.undo()
+        _ = api.tools.download_native_queries(root_folder=tmp_path, incremental=True)
+        mapping = loads(file.read_text(encoding="utf-8"))
+        assert list(tmp_path.rglob("*.sql"))  # check queries written again
+        assert all("query_hash" in card for card in mapping)
+
 
 class TestUpload:
     def test_upload_existing(self, api: MetabaseApi, random_string: LambdaType):
@@ -66,6 +113,90 @@ class TestUpload:
         assert "creates" in results
         assert "errors" in results
 
+    def test_upload_requests(self, host: str, credentials: dict):
+        api = MetabaseApi(metabase_url=host, credentials=credentials)
+        requests = api.connection_stats["requests"]
+        results = api.tools.upload_native_queries(
+            mapping_path=Path("./tests/data/mapping.json"),
+            file_extension="sql",
+            dry_run=True,
+            stop_on_error=False,
+        )
+        assert isinstance(results, dict)
+        # Collection tree, cards and databases, whatever the number of queries
+        assert api.connection_stats["requests"] - requests <= 3
+
+    def test_upload_duplicate(self, api: MetabaseApi, tmp_path: Path):
+        card = loads(Path("./tests/data/mapping.json").read_text(encoding="utf-8"))[1]
+        card_path = tmp_path / card["path"].lstrip("/") / f"{card['name']}.sql"
+        card_path.parent.mkdir(parents=True)
+        card_path.write_text("select 1", encoding="utf-8")
+        mapping_path = tmp_path / "mapping.json"
+        mapping_path.write_text(dumps([card, card]), encoding="utf-8")
+        results = api.tools.upload_native_queries(
+            mapping_path=mapping_path, file_extension="sql", dry_run=True
+        )
+        assert isinstance(results, dict)
+        assert results["errors"] == [card]  # check duplicate reported, not pushed
+        assert len(results["updates"]) + len(results["creates"]) == 1
+
+    def test_upload_missing_collection(self, api: MetabaseApi, tmp_path: Path):
+        card = loads(Path("./tests/data/mapping.json").read_text(encoding="utf-8"))[1]
+        card["path"] = f"{card['path']}/Missing {tmp_path.name}"
+        card_path = tmp_path / card["path"].lstrip("/") / f"{card['name']}.sql"
+        card_path.parent.mkdir(parents=True)
+        card_path.write_text("select 1", encoding="utf-8")
+        mapping_path = tmp_path / "mapping.json"
+        mapping_path.write_text(dumps([card]), encoding="utf-8")
+        results = api.tools.upload_native_queries(
+            mapping_path=mapping_path, file_extension="sql", dry_run=True
+        )
+        assert isinstance(results, dict)
+        assert results["errors"] == [card]  # check not created without opt-in
+        assert results["collections"] == [] and results["creates"] == []
+        with pytest.raises(MetabaseApiException):
+            _ = api.tools.upload_native_queries(
+                mapping_path=mapping_path,
+                file_extension="sql",
+                dry_run=True,
+                stop_on_error=True,
+            )
+        results = api.tools.upload_native_queries(
+            mapping_path=mapping_path,
+            file_extension="sql",
+            dry_run=True,
+            create_collections=True,
+        )
+        assert isinstance(results, dict)
+        assert [new["path"] for new in results["collections"]] == [card["path"]]
+        assert len(results["creates"]) == 1
+
+    def test_upload_checkpoint(
+        self, api: MetabaseApi, random_string: LambdaType, tmp_path: Path
+    ):
+        mapping_path = Path("./tests/data/mapping.json")
+        test_card_path = Path("./tests/data/Development/Accounting/Test Card.sql")
+        checkpoint_path = tmp_path / "upload.checkpoint"
+        with open(test_card_path, newline="", encoding="utf-8") as file:
+            current = file.read()
+        with open(test_card_path, "a", newline="", encoding="utf-8") as file:
+            file.write("\n-- " + random_string(6))
+        try:
+            results = api.tools.upload_native_queries(
+                mapping_path=mapping_path,
+                file_extension="sql",
+                dry_run=False,
+                max_workers=4,
+                checkpoint_path=checkpoint_path,
+            )
+        finally:
+            with open(test_card_path, "w", newline="", encoding="utf-8") as file:
+                file.write(current)
+        assert isinstance(results, list) and len(results) > 0
+        assert all(result["is_success"] for result in results)
+        assert all(result["elapsed"] >= 0 for result in results)
+        assert not checkpoint_path.exists()  # removed once every change succeeded
+
     def test_upload_existing_stop(self, api: MetabaseApi, random_string: LambdaType):
         mapping_path = Path("./tests/data/mapping.json")
         test_card_path = Path("./tests/data/Development/Accounting/Test Card.sql")